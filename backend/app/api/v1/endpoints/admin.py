@@ -1,11 +1,23 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import date, timedelta
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.services.nlic_loader import (load_initial_changes_until_yesterday, load_changes_for_date)
+from app.models.backfill_job import BackfillJob
+from app.services.nlic_loader import load_changes_for_date_async
+from app.services.backfill_jobs import (
+    BackfillJobError,
+    create_job,
+    job_dates,
+    job_to_dict,
+    pause_job,
+    resume_job,
+    start_job,
+)
 
 router = APIRouter()
 
@@ -13,31 +25,125 @@ router = APIRouter()
 @router.post("/init-changes")
 def init_changes(
     start_date: Optional[date] = None,
+    workers: Optional[int] = Query(
+        None, ge=1, description="동시에 수집할 날짜 수 (없으면 설정값)"
+    ),
     db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
     """
     어제까지의 변경이력을 모두 저장하는 초기 전체 적재 API
-    - start_date가 없으면 1990-01-01 ~ 어제까지
+    - start_date가 없으면 2020-01-01 ~ 어제까지
+    - 백그라운드 백필 작업으로 실행하고 바로 작업 정보를 돌려준다
+      (진행 상황: GET /backfill-jobs/{job_id})
     """
-    summary = load_initial_changes_until_yesterday(db, start_date=start_date)
-    return summary
+    return _start_backfill_job(
+        db,
+        start_date=start_date or date(2020, 1, 1),
+        end_date=date.today() - timedelta(days=1),
+        workers=workers,
+    )
+
+
+@router.post("/backfill-jobs")
+def create_backfill_job(
+    start_date: date = Query(..., description="YYYY-MM-DD"),
+    end_date: Optional[date] = Query(None, description="YYYY-MM-DD (없으면 어제)"),
+    workers: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    기간 백필 작업 생성 + 시작
+    - 페이지마다 체크포인트를 커밋하므로 크래시/재배포 후에도 이어서 실행된다
+    """
+    return _start_backfill_job(
+        db,
+        start_date=start_date,
+        end_date=end_date or date.today() - timedelta(days=1),
+        workers=workers,
+    )
 
 
+@router.get("/backfill-jobs")
+def list_backfill_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> List[Dict[str, Any]]:
+    jobs = db.scalars(
+        select(BackfillJob).order_by(BackfillJob.created_at.desc()).limit(limit)
+    )
+    return [job_to_dict(job) for job in jobs]
+
+
+@router.get("/backfill-jobs/{job_id}")
+def get_backfill_job(
+    job_id: UUID,
+    dates: int = Query(31, ge=0, le=366, description="함께 돌려줄 최근 날짜별 상태 개수"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    job = db.get(BackfillJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Backfill job not found")
+
+    result = job_to_dict(job)
+    result["dates"] = job_dates(db, job_id, limit=dates) if dates else []
+    return result
+
+
+@router.post("/backfill-jobs/{job_id}/pause")
+def pause_backfill_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """지금 적재 중인 페이지까지 커밋한 뒤 멈춘다"""
+    try:
+        job = pause_job(db, job_id)
+    except BackfillJobError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return job_to_dict(job)
+
+
+@router.post("/backfill-jobs/{job_id}/resume")
+def resume_backfill_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """일시정지/실패한 작업을 마지막 체크포인트부터 다시 실행"""
+    try:
+        job = resume_job(db, job_id)
+    except BackfillJobError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return job_to_dict(job)
+
+
+def _start_backfill_job(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    workers: Optional[int],
+) -> Dict[str, Any]:
+    try:
+        job = create_job(db, start_date=start_date, end_date=end_date, workers=workers)
+    except BackfillJobError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    start_job(job.job_id)
+    return job_to_dict(job)
+
 
 @router.post("/fetch-yesterday")
-def fetch_yesterday(
+async def fetch_yesterday(
     db: Session = Depends(get_db),
 ):
     """
     매일 밤 배치용 – '어제' 날짜(regDt=어제) 기준 변경이력 적재
+    - NLIC 조회는 async 클라이언트, DB 적재는 스레드 → 이벤트 루프를 막지 않음
     """
     target_date = date.today() - timedelta(days=1)
-    summary = load_changes_for_date(db, target_date=target_date)
+    summary = await load_changes_for_date_async(db, target_date=target_date)
     return summary
 
 
 @router.post("/fetch-date")
-def fetch_for_date(
+async def fetch_for_date(
     target_date: date = Query(..., description="YYYY-MM-DD 형식의 날짜"),
     db: Session = Depends(get_db),
 ):
@@ -45,5 +151,5 @@ def fetch_for_date(
     필요할 때 특정 날짜를 수동으로 다시 돌리고 싶을 때 쓰는 엔드포인트.
     예: /fetch-date?target_date=2025-11-11
     """
-    summary = load_changes_for_date(db, target_date=target_date)
+    summary = await load_changes_for_date_async(db, target_date=target_date)
     return summary
\ No newline at end of file
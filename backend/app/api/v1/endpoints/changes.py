@@ -1,31 +1,167 @@
 # app/api/v1/endpoints/changes.py
-from datetime import date
-from typing import Optional
+from datetime import date, datetime
+from typing import Optional, Tuple
 from uuid import UUID
+import base64
+import hashlib
+import json
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import and_, func, literal, literal_column, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.db.session import get_db   
+from app.db.session import get_async_db
 from app.models.law import Law
-from app.models.law_change_event import LawChangeEvent
+from app.models.law_change_event import AI_SEARCH_TEXT_SQL, LawChangeEvent
+from app.models.law_change_feed import LawChangeFeed
 from app.models.old_new_info import OldNewInfo
 from app.models.article_diff import ArticleDiff
+from app.models.article_text import ArticleText
 from app.schemas.law_change import (
     LawChangeListResponse,
     LawChangeListItem,
     LawChangeDetail,
     LawChangeSummary,
     ArticleDiffItem,
+    ArticleDiffPage,
 )
+from app.services.cache_versions import (
+    AI_SUMMARIES,
+    ARTICLE_DIFFS,
+    CHANGE_EVENTS,
+    get_cache_version_async,
+)
+from app.services.change_counts import cached_change_count_async
+from app.services.detail_cache import get_cached_detail, store_detail
 
 router = APIRouter()
 
 
+DATE_COLUMNS = {
+    "promulgation": LawChangeFeed.proclamation_date,  # 공포일자
+    "enforcement": LawChangeFeed.enforce_date,        # 시행일자
+    "collected": LawChangeFeed.collected_date,        # 변경일자
+}
+
+
+def _encode_cursor(date_basis: str, ev: LawChangeFeed) -> str:
+    """마지막 행의 정렬 키 (date_basis 날짜, created_at, change_id) → 불투명 문자열"""
+    date_value = getattr(ev, DATE_COLUMNS[date_basis].key)
+    raw = json.dumps(
+        {
+            "b": date_basis,
+            "d": date_value.isoformat() if date_value else None,
+            "c": ev.created_at.isoformat(),
+            "i": str(ev.change_id),
+        },
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, date_basis: str) -> Tuple[Optional[date], datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if data["b"] != date_basis:
+            raise ValueError("date_basis mismatch")
+        return (
+            date.fromisoformat(data["d"]) if data["d"] else None,
+            datetime.fromisoformat(data["c"]),
+            UUID(data["i"]),
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
+def keyset_segments(date_column, last_date: Optional[date], last_created_at: datetime, last_id: UUID) -> list:
+    """
+    (date DESC NULLS LAST, created_at DESC, change_id DESC) 순서에서 커서 다음 행들의 조건을 순서대로.
+    OR로 묶으면 인덱스 범위 스캔을 못 하므로 구간을 나눠 앞 구간부터 채운다.
+    - 커서 날짜가 있으면: (date, created_at, change_id) < 커서 (행 비교 → 인덱스 조건), 그다음 날짜 없는 행
+    - 커서 날짜가 없으면: 날짜 없는 행 중 (created_at, change_id)가 더 작은 행
+    """
+    last_key = tuple_(literal(last_created_at), literal(last_id))
+    if last_date is None:
+        return [
+            and_(
+                date_column.is_(None),
+                tuple_(LawChangeFeed.created_at, LawChangeFeed.change_id) < last_key,
+            )
+        ]
+    return [
+        tuple_(date_column, LawChangeFeed.created_at, LawChangeFeed.change_id)
+        < tuple_(literal(last_date), literal(last_created_at), literal(last_id)),
+        date_column.is_(None),
+    ]
+
+
+def change_list_order(date_basis: str) -> tuple:
+    """목록 정렬 – ix_law_change_feed_*_order 인덱스와 같은 순서"""
+    return (
+        DATE_COLUMNS[date_basis].desc().nullslast(),
+        LawChangeFeed.created_at.desc(),
+        LawChangeFeed.change_id.desc(),
+    )
+
+
+SEARCH_MODES = ("name", "content", "all")
+
+
+def _like_pattern(keyword: str) -> str:
+    # 사용자가 입력한 %, _ 는 와일드카드가 아니라 글자로
+    escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def keyword_condition(keyword: str, search_mode: str):
+    """
+    검색 조건 (law_change_feed의 pg_trgm GIN 인덱스로 부분 문자열 검색 – migrations 0005)
+    - name: 법령명
+    - content: AI 요약 + 조치사항 (한국어는 조사가 붙어 단어 단위 검색이 어려워 trigram n-gram으로)
+    - all: 둘 중 하나라도
+    """
+    like = _like_pattern(keyword)
+    by_name = LawChangeFeed.law_name.ilike(like, escape="\\")
+    by_content = literal_column(AI_SEARCH_TEXT_SQL).ilike(like, escape="\\")
+    if search_mode == "content":
+        return by_content
+    if search_mode == "all":
+        return or_(by_name, by_content)
+    return by_name
+
+
+def filtered_change_query(
+    keyword: Optional[str],
+    date_basis: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    search_mode: str = "name",
+):
+    """목록 조회 필터까지 적용한 LawChangeFeed select (조인 없음, 정렬/페이지 전)"""
+    date_column = DATE_COLUMNS[date_basis]
+
+    q = select(LawChangeFeed)
+
+    if keyword:
+        q = q.where(keyword_condition(keyword, search_mode))
+
+    if start_date:
+        q = q.where(date_column >= start_date)
+    if end_date:
+        q = q.where(date_column <= end_date)
+
+    return q
+
+
 @router.get("", response_model=LawChangeListResponse)
-def list_law_changes(
-    db: Session = Depends(get_db),
-    keyword: Optional[str] = Query(None, description="법령명 검색어"),
+async def list_law_changes(
+    db: AsyncSession = Depends(get_async_db),
+    keyword: Optional[str] = Query(None, description="검색어"),
+    search_mode: str = Query(
+        "name", description="name: 법령명 | content: AI 요약/조치사항 | all: 둘 다"
+    ),
     date_basis: str = Query(
         "promulgation", description="promulgation | enforcement | collected"
     ),
@@ -33,98 +169,208 @@ def list_law_changes(
     end_date: Optional[date] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(6, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (있으면 page 대신 커서 기준으로 다음 페이지)"
+    ),
 ):
     """
     변경이력 목록 조회
 
-    - keyword: 법령명 like 검색
+    - keyword + search_mode: 부분 문자열 검색 (trigram 인덱스)
+        - name: 법령명
+        - content: AI 요약(change_summary) + 조치사항(action_recommendation)
+        - all: 둘 중 하나라도
     - date_basis:
         - promulgation: 공포일자 (proclamation_date)
         - enforcement: 시행일자 (enforce_date)
         - collected: 변경일자 (collected_date)
     - start_date, end_date: 기준일자 범위
-    - page, page_size: 페이지네이션
+    - page, page_size: 페이지네이션 (OFFSET)
+    - cursor: keyset 페이지네이션 – 깊은 페이지도 첫 페이지와 같은 비용 (ix_law_change_feed_*_order)
+    - total: 적재 시 무효화되는 캐시 건수
+
+    law 조인 없이 law_change_feed(목록용 비정규화 테이블) 한 테이블만 읽는다.
     """
-    # 기준 날짜 컬럼 매핑
-    if date_basis == "enforcement":
-        # 시행일자
-        date_column = LawChangeEvent.enforce_date
-    elif date_basis == "collected":
-        # 변경일자
-        date_column = LawChangeEvent.collected_date
+    if date_basis not in DATE_COLUMNS:
+        date_basis = "promulgation"
+    date_column = DATE_COLUMNS[date_basis]
+
+    if search_mode not in SEARCH_MODES:
+        search_mode = "name"
+
+    q = filtered_change_query(keyword, date_basis, start_date, end_date, search_mode)
+
+    async def count() -> int:
+        return await db.scalar(q.with_only_columns(func.count(), maintain_column_froms=True))
+
+    # AI 요약/조치사항으로 검색하면 요약이 저장될 때마다 건수가 바뀐다
+    searches_ai_text = bool(keyword) and search_mode in ("content", "all")
+    total = await cached_change_count_async(
+        db,
+        (keyword or None, search_mode if keyword else None, date_basis, start_date, end_date),
+        count,
+        (CHANGE_EVENTS, AI_SUMMARIES) if searches_ai_text else (CHANGE_EVENTS,),
+    )
+
+    q = q.order_by(*change_list_order(date_basis))
+
+    # 한 건 더 읽어서 다음 페이지 유무 판단
+    if cursor:
+        rows = []
+        for cond in keyset_segments(date_column, *_decode_cursor(cursor, date_basis)):
+            rows += (await db.scalars(q.where(cond).limit(page_size + 1 - len(rows)))).all()
+            if len(rows) > page_size:
+                break
     else:
-        # 기본: 공포일자
-        date_column = LawChangeEvent.proclamation_date
+        rows = (await db.scalars(q.offset((page - 1) * page_size).limit(page_size + 1))).all()
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
 
-    q = db.query(LawChangeEvent, Law).join(Law, Law.law_id == LawChangeEvent.law_id)
+    items = [LawChangeListItem.from_orm(row) for row in rows]
 
-    if keyword:
-        like = f"%{keyword}%"
-        q = q.filter(Law.law_name.ilike(like))
+    next_cursor = _encode_cursor(date_basis, rows[-1]) if has_next and rows else None
+    return LawChangeListResponse(total=total, items=items, next_cursor=next_cursor)
 
-    if start_date:
-        q = q.filter(date_column >= start_date)
-    if end_date:
-        q = q.filter(date_column <= end_date)
 
-    total = q.count()
+# 조문 비교 정렬 (법령 순서, 같은 키는 적재 순서) – ix_article_diff_mst_order (mst, sort_key, ordinal) 범위 스캔
+_ARTICLE_ORDER = (ArticleDiff.sort_key, ArticleDiff.ordinal)
 
-    offset = (page - 1) * page_size
-    rows = (
-        q.order_by(
-            date_column.desc().nullslast(),
-            LawChangeEvent.created_at.desc(),
+# 개정 전/후 내용이 다른 조문 (적재 시 계산한 is_changed, backfill 전 행은 본문 해시 비교)
+ARTICLE_CHANGED = func.coalesce(
+    ArticleDiff.is_changed, ArticleDiff.old_hash.is_distinct_from(ArticleDiff.new_hash)
+)
+
+_OldText = aliased(ArticleText, name="old_text")
+_NewText = aliased(ArticleText, name="new_text")
+
+# 상세 응답에 같이 싣는 첫 페이지 크기
+_DETAIL_ARTICLE_PAGE_SIZE = 20
+
+
+def _encode_article_cursor(row) -> str:
+    raw = json.dumps({"s": row.sort_key, "o": row.ordinal}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_article_cursor(cursor: str) -> Tuple[int, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return int(data["s"]), int(data["o"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
+def _text_column(column, max_chars: Optional[int]):
+    """본문 컬럼 (max_chars가 있으면 DB에서 앞부분만 잘라 가져오고, 잘렸는지도 함께)"""
+    if max_chars is None:
+        return column, literal(False)
+    return func.left(column, max_chars), func.coalesce(func.char_length(column) > max_chars, False)
+
+
+async def article_page(
+    db: AsyncSession,
+    mst: str,
+    page_size: int,
+    cursor: Optional[str] = None,
+    changed_only: bool = False,
+    max_chars: Optional[int] = None,
+) -> ArticleDiffPage:
+    """
+    mst의 조문 비교 한 페이지 (keyset).
+    필요한 컬럼만, 잘라야 하면 DB에서 잘라서 가져오므로 법령 크기와 상관없이 한 페이지 분량만 읽는다.
+    """
+    old_content, old_truncated = _text_column(_OldText.content, max_chars)
+    new_content, new_truncated = _text_column(_NewText.content, max_chars)
+
+    q = (
+        select(
+            ArticleDiff.diff_id,
+            ArticleDiff.sort_key,
+            ArticleDiff.ordinal,
+            ArticleDiff.old_no,
+            old_content.label("old_content"),
+            old_truncated.label("old_truncated"),
+            ArticleDiff.new_no,
+            new_content.label("new_content"),
+            new_truncated.label("new_truncated"),
+            ArticleDiff.is_changed,
+            ArticleDiff.change_score,
+            ArticleDiff.diff_ops,
         )
-        .offset(offset)
-        .limit(page_size)
-        .all()
+        .outerjoin(_OldText, _OldText.content_hash == ArticleDiff.old_hash)
+        .outerjoin(_NewText, _NewText.content_hash == ArticleDiff.new_hash)
+        .where(ArticleDiff.mst == mst)
+        .order_by(*_ARTICLE_ORDER)
+        .limit(page_size + 1)
     )
+    if changed_only:
+        q = q.where(ARTICLE_CHANGED)
+    if cursor:
+        q = q.where(tuple_(*_ARTICLE_ORDER) > tuple_(*(literal(v) for v in _decode_article_cursor(cursor))))
+
+    rows = (await db.execute(q)).all()
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    return ArticleDiffPage(
+        items=[ArticleDiffItem.model_validate(row._mapping) for row in rows],
+        next_cursor=_encode_article_cursor(rows[-1]) if has_next and rows else None,
+    )
+
+
+# 상세 응답 모양이 바뀌면 올려서 기존 ETag/캐시를 무효화
+_DETAIL_FORMAT_VERSION = "6"
+
+
+def _detail_etag(mst: str, change_summary: LawChangeSummary, articles_version: int) -> str:
+    """
+    상세 응답의 강한 ETag.
+    신·구 기본정보/조문 비교는 mst별로 한 번 쓰면 적재 경로에서는 바뀌지 않으므로
+    mst + 요약(법령명, AI 필드 등) + 기존 행을 고쳐 쓰는 작업(backfill)이 올리는 article_diff 버전으로 정해진다.
+    """
+    raw = json.dumps(
+        [_DETAIL_FORMAT_VERSION, mst, articles_version, change_summary.model_dump(mode="json")],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
 
-    items: list[LawChangeListItem] = []
-
-    for ev, law in rows:
-        items.append(
-            LawChangeListItem(
-                change_id=ev.change_id,
-                law_id=ev.law_id,
-                law_name=law.law_name,
-                law_type_name=law.law_type_name,
-                ministry_names=law.ministry_names,
-                change_type=ev.change_type,
-                proclamation_no=ev.proclamation_no,
-                proclamation_date=ev.proclamation_date,
-                enforce_date=ev.enforce_date,
-                current_hist_cd=ev.current_hist_cd,
-                collected_date=ev.collected_date,  # ✅ 변경일자
-                change_summary=ev.change_summary,
-                action_recommendation=ev.action_recommendation,
-                ai_importance=ev.ai_importance
-            )
-        )
 
-    return LawChangeListResponse(total=total, items=items)
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match는 약한 비교 (W/ 접두어 무시), 여러 개/`*` 허용"""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
 
 
 @router.get("/{change_id}", response_model=LawChangeDetail)
-def get_law_change_detail(
+async def get_law_change_detail(
     change_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     특정 change_id에 대한
     - 법령/변경이력 요약
     - 신·구 기본정보
-    - 조문 비교 목록
+    - 조문 비교 건수(전체/변경) + 첫 페이지 (나머지는 articles_next_cursor로 /{change_id}/articles)
 
     최종 URL: GET /api/v1/changes/{change_id}
+
+    - ETag: mst + 요약(AI 필드 포함)으로 정해지는 강한 ETag. If-None-Match가 맞으면 본문 없이 304
+    - 직렬화된 본문은 프로세스 내 LRU(changes_detail_cache_max_bytes)에 보관 → 같은 버전이면 조문 조회/직렬화 생략
+    - 아직 oldAndNew가 적재되지 않은 변경이력은 내용이 채워질 수 있으므로 ETag/캐시 없이 응답
     """
     # 변경 이벤트 + 법령 기본정보
     row = (
-        db.query(LawChangeEvent, Law)
-        .join(Law, Law.law_id == LawChangeEvent.law_id)
-        .filter(LawChangeEvent.change_id == change_id)
-        .first()
-    )
+        await db.execute(
+            select(LawChangeEvent, Law)
+            .join(Law, Law.law_id == LawChangeEvent.law_id)
+            .where(LawChangeEvent.change_id == change_id)
+        )
+    ).first()
     if not row:
         raise HTTPException(status_code=404, detail="Change event not found")
 
@@ -147,12 +393,19 @@ def get_law_change_detail(
         ai_importance=ev.ai_importance
     )
 
+    etag = _detail_etag(mst, change_summary, await get_cache_version_async(db, ARTICLE_DIFFS))
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}  # 저장은 해도 되지만 매번 재검증
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    body = get_cached_detail(change_id, etag)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=cache_headers)
+
      # 2) 신·구 기본정보 (mst 기준으로 1건)
     oni: Optional[OldNewInfo] = (
-        db.query(OldNewInfo)
-        .filter(OldNewInfo.mst == mst)
-        .first()
-    )
+        await db.scalars(select(OldNewInfo).where(OldNewInfo.mst == mst))
+    ).first()
 
     if oni is None:
         has_old_new = "N"
@@ -163,24 +416,50 @@ def get_law_change_detail(
         old_basic = oni.old_basic
         new_basic = oni.new_basic
 
-    # 조문 비교 목록
-    article_rows = (
-        db.query(ArticleDiff)
-        .filter(ArticleDiff.mst == mst)
-        .order_by(
-            ArticleDiff.old_no.nullsfirst(),
-            ArticleDiff.new_no.nullsfirst(),
-            ArticleDiff.diff_id,
+    # 조문 비교 건수 + 첫 페이지
+    article_count, changed_article_count = (
+        await db.execute(
+            select(func.count(), func.count().filter(ARTICLE_CHANGED)).where(ArticleDiff.mst == mst)
         )
-        .all()
-    )
-
-    articles = [ArticleDiffItem.from_orm(a) for a in article_rows]
+    ).one()
+    first_page = await article_page(db, mst, _DETAIL_ARTICLE_PAGE_SIZE)
 
-    return LawChangeDetail(
+    detail = LawChangeDetail(
         change=change_summary,
         has_old_new=has_old_new,
         old_basic=old_basic,
         new_basic=new_basic,
-        articles=articles,
+        article_count=article_count,
+        changed_article_count=changed_article_count,
+        articles=first_page.items,
+        articles_next_cursor=first_page.next_cursor,
     )
+    if oni is None:
+        return detail
+
+    body = detail.model_dump_json().encode("utf-8")
+    store_detail(change_id, etag, body)
+    return Response(content=body, media_type="application/json", headers=cache_headers)
+
+
+@router.get("/{change_id}/articles", response_model=ArticleDiffPage)
+async def list_change_articles(
+    change_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (상세 응답의 articles_next_cursor)"),
+    page_size: int = Query(20, ge=1, le=200),
+    changed_only: bool = Query(False, description="개정 전/후 내용이 다른 조문만"),
+    max_chars: Optional[int] = Query(
+        None, ge=1, description="조문 본문을 앞에서 N자까지만 (HTML 포함 길이, 잘리면 *_truncated=true)"
+    ),
+):
+    """
+    변경이력의 조문 비교 목록 (커서 페이지네이션)
+
+    최종 URL: GET /api/v1/changes/{change_id}/articles
+    """
+    mst = await db.scalar(select(LawChangeEvent.mst).where(LawChangeEvent.change_id == change_id))
+    if mst is None:
+        raise HTTPException(status_code=404, detail="Change event not found")
+
+    return await article_page(db, mst, page_size, cursor, changed_only, max_chars)
@@ -8,15 +8,64 @@ class Settings(BaseSettings):
     app_env: str = "local"
     
     database_url: str
+    async_database_url: str | None = None  # 없으면 database_url의 드라이버만 asyncpg로 바꿔서 사용
+
+    # DB 커넥션 풀
+    # - sync 엔진: 적재/관리자 엔드포인트/AI 워커 (쿼리가 길 수 있어서 기본은 타임아웃 없음)
+    # - async 엔진: 조회 API (풀을 따로 써서 긴 적재 작업이 조회용 커넥션을 잡고 있지 않게)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_sec: float = 30.0       # 풀이 비었을 때 커넥션을 기다리는 최대 시간
+    db_statement_timeout_ms: int = 0        # 0이면 제한 없음
+    db_async_pool_size: int = 10
+    db_async_max_overflow: int = 10
+    db_async_pool_timeout_sec: float = 10.0
+    db_async_statement_timeout_ms: int = 5000  # 조회 쿼리 1건 상한 (넘으면 취소 → 500)
+
+    # 조회 API
+    changes_detail_cache_max_bytes: int = 128 * 1024 ** 2  # 변경이력 상세 응답 캐시 (직렬화된 본문 기준)
 
     # NLIC settings
     nlic_oc: str
     nlic_history_url: str
     nlic_oldnew_url: str
-    
+    nlic_max_requests_per_sec: float = 5.0  # 프로세스 전체 NLIC 호출 상한 (0 이하면 제한 없음)
+    nlic_backfill_workers: int = 4          # 초기 적재 시 동시에 수집할 날짜 수
+    nlic_bulk_ingest: bool = True           # lsHstInf 페이지 단위 일괄 upsert/insert (False면 건별 ORM 처리)
+    nlic_old_new_workers: int = 4           # oldAndNew 적재 워커 수 (0이면 페이지 트랜잭션 안에서 직접 호출)
+    nlic_old_new_queue_size: int = 200      # oldAndNew 대기 mst 큐 크기
+    nlic_old_new_streaming: bool = False    # oldAndNew 응답을 조문 단위로 스트리밍 파싱/적재 (큰 응답 메모리 절약)
+    nlic_max_connections_per_host: int = 8  # 호스트별 동시 커넥션 상한 (keep-alive 풀 크기)
+    nlic_max_connections: int = 16          # async 클라이언트 전체 커넥션 상한
+    nlic_request_deadline_sec: float = 600.0  # 재시도 포함 요청 1건의 최대 소요 시간 (async)
+
+    # NLIC 응답 디스크 캐시 (nlic_cache_dir이 없으면 사용 안 함)
+    nlic_cache_dir: str | None = None
+    nlic_cache_max_bytes: int = 5 * 1024 ** 3
+    nlic_cache_mst_ttl_sec: float = 365 * 24 * 3600     # oldAndNew (MST 내용은 불변)
+    nlic_cache_history_ttl_sec: float = 7 * 24 * 3600   # 지난 날짜 lsHstInf 페이지
+    nlic_cache_today_ttl_sec: float = 10 * 60           # 오늘 날짜 lsHstInf 페이지
+    nlic_cache_offline: bool = False                    # True면 캐시에 없는 요청은 네트워크 대신 실패 (재현/픽스처용)
+
     # AI Settings
+    llm_backend: str = "ollama"           # 'ollama' | 'openai' (vLLM/llama.cpp 등 OpenAI 호환) | 'stub'
     ollama_base_url: str = "http://localhost:11434"
     ollama_model_name: str = "qwen2.5:7b-instruct"
+    openai_base_url: str = "http://localhost:8000/v1"
+    openai_model_name: str = "Qwen/Qwen2.5-7B-Instruct"
+    openai_api_key: str | None = None
+    llm_stub_latency_sec: float = 1.0     # stub 백엔드 응답 지연 (±30%)
+    llm_stub_failure_rate: float = 0.0    # stub 백엔드가 형식이 틀린 응답을 줄 확률
+    llm_stub_seed: int = 0
+    llm_streaming: bool = False           # 토큰 스트리밍 + JSON 모양 검사로 객체가 닫히면/형식이 틀리면 바로 끊기
+    llm_timeout_sec: float = 120.0        # 호출 1회 최대 소요 시간
+    llm_stream_max_chars: int = 8000      # 스트리밍 시 객체가 이 길이 안에 안 닫히면 중단
+    ai_prompt_token_budget: int = 3000    # 프롬프트 전체 추정 토큰 상한 (조문 변경은 변경량 큰 순서로 채움)
+    ai_batch_size: int = 5                # 타법개정/작은 변경을 한 번에 묶어 물을 최대 건수 (1이면 묶지 않음)
+    ai_batch_small_tokens: int = 600      # 변경 내용(메타+조문 변경)이 이 추정 토큰 이하면 묶음 대상
+    ai_batch_other_law_tokens: int = 1000  # 타법개정은 이 추정 토큰 이하까지 묶음 대상 (기본 예산에 2건)
+    ai_workers: int = 4                   # 동시에 Ollama를 호출할 워커 수 (OLLAMA_NUM_PARALLEL 이하로)
+    ai_claim_timeout_sec: float = 15 * 60  # 처리 중 표시(ai_claimed_at)가 이보다 오래되면 다른 워커가 다시 가져감
 
     class Config:
         env_file = ".env"
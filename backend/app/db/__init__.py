@@ -4,4 +4,9 @@ from app.db.base import Base  # noqa
 from app.models.law import Law  # noqa
 from app.models.law_change_event import LawChangeEvent  # noqa
 from app.models.old_new_info import OldNewInfo  # noqa
+from app.models.article_text import ArticleText  # noqa
 from app.models.article_diff import ArticleDiff  # noqa
+from app.models.backfill_job import BackfillJob, BackfillJobDate  # noqa
+from app.models.ai_summary_cache import AiSummaryCache  # noqa
+from app.models.cache_version import CacheVersion  # noqa
+from app.models.law_change_feed import LawChangeFeed  # noqa
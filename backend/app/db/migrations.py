@@ -0,0 +1,254 @@
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.models.article_diff import ARTICLE_SORT_KEY_SQL
+from app.models.article_text import ARTICLE_TEXT_HASH_SQL
+from app.models.law_change_event import AI_SEARCH_TEXT_SQL, EVENT_KEY_SQL
+from app.services.change_feed import rebuild_feed_sql
+
+def _if_column_exists(table: str, column: str, *statements: str) -> str:
+    """컬럼이 있을 때만 실행 (나중 마이그레이션에서 지운 컬럼을 쓰는 문장 – create_all로 만든 새 DB에는 없음)"""
+    body = "\n".join(f"EXECUTE $stmt${stmt}$stmt$;" for stmt in statements)
+    return f"""
+        DO $migration$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = '{table}' AND column_name = '{column}'
+            ) THEN
+                {body}
+            END IF;
+        END
+        $migration$
+    """
+
+
+def _add_foreign_key(name: str, table: str, column: str, ref_table: str, ref_column: str) -> str:
+    return f"""
+        DO $migration$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{name}') THEN
+                ALTER TABLE {table} ADD CONSTRAINT {name}
+                FOREIGN KEY ({column}) REFERENCES {ref_table} ({ref_column});
+            END IF;
+        END
+        $migration$
+    """
+
+
+# 이미 운영 중인 DB에 적용할 스키마 변경 (create_all은 기존 테이블을 바꾸지 않음)
+# - 이름 순서대로 한 번씩만 적용되고, schema_migration 테이블에 기록된다
+# - create_all로 새로 만든 DB에서도 문제없도록 모든 문장은 IF NOT EXISTS 등으로 멱등하게 작성
+MIGRATIONS: List[Tuple[str, List[str]]] = [
+    (
+        "0001_law_change_event_event_key",
+        [
+            "ALTER TABLE law_change_event ADD COLUMN IF NOT EXISTS event_key TEXT",
+            f"UPDATE law_change_event SET event_key = {EVENT_KEY_SQL} WHERE event_key IS NULL",
+            # 동시 적재 등으로 이미 들어가 있는 중복 이벤트는 가장 먼저 수집된 1건만 남긴다
+            """
+            DELETE FROM law_change_event a
+            USING law_change_event b
+            WHERE a.event_key = b.event_key
+              AND (a.created_at, a.change_id) > (b.created_at, b.change_id)
+            """,
+            "ALTER TABLE law_change_event ALTER COLUMN event_key SET NOT NULL",
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_law_change_event_event_key
+            ON law_change_event (event_key)
+            """,
+        ],
+    ),
+    (
+        "0002_law_change_event_ai_claimed_at",
+        [
+            "ALTER TABLE law_change_event ADD COLUMN IF NOT EXISTS ai_claimed_at TIMESTAMPTZ",
+        ],
+    ),
+    (
+        "0003_law_change_event_list_indexes",
+        [
+            """
+            CREATE INDEX IF NOT EXISTS ix_law_change_event_proclamation_order
+            ON law_change_event (proclamation_date DESC NULLS LAST, created_at DESC, change_id DESC)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_law_change_event_enforce_order
+            ON law_change_event (enforce_date DESC NULLS LAST, created_at DESC, change_id DESC)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_law_change_event_collected_order
+            ON law_change_event (collected_date DESC NULLS LAST, created_at DESC, change_id DESC)
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_law_change_event_law_id ON law_change_event (law_id)",
+            "ANALYZE law_change_event",
+        ],
+    ),
+    (
+        "0004_trigram_search_indexes",
+        [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            "CREATE INDEX IF NOT EXISTS ix_law_law_name_trgm ON law USING gin (law_name gin_trgm_ops)",
+            f"""
+            CREATE INDEX IF NOT EXISTS ix_law_change_event_ai_text_trgm
+            ON law_change_event USING gin ({AI_SEARCH_TEXT_SQL} gin_trgm_ops)
+            """,
+        ],
+    ),
+    (
+        # law_change_feed 테이블/정렬 인덱스는 create_all이 만들고, 여기서는 검색 인덱스 + 기존 데이터 채우기
+        "0005_law_change_feed",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_law_change_feed_law_name_trgm ON law_change_feed USING gin (law_name gin_trgm_ops)",
+            f"""
+            CREATE INDEX IF NOT EXISTS ix_law_change_feed_ai_text_trgm
+            ON law_change_feed USING gin ({AI_SEARCH_TEXT_SQL} gin_trgm_ops)
+            """,
+            rebuild_feed_sql(),
+            "ANALYZE law_change_feed",
+        ],
+    ),
+    (
+        "0006_article_diff_sort_key",
+        [
+            "ALTER TABLE article_diff ADD COLUMN IF NOT EXISTS sort_key BIGINT",
+            _if_column_exists(
+                "article_diff",
+                "new_content",
+                f"UPDATE article_diff SET sort_key = {ARTICLE_SORT_KEY_SQL} WHERE sort_key IS NULL",
+            ),
+            "ALTER TABLE article_diff ALTER COLUMN sort_key SET NOT NULL",
+            """
+            CREATE INDEX IF NOT EXISTS ix_article_diff_mst_sort_key
+            ON article_diff (mst, sort_key, diff_id)
+            """,
+            # mst 단독 조회도 위 인덱스의 앞 컬럼으로 처리됨
+            "DROP INDEX IF EXISTS idx_article_diff_mst",
+            "ANALYZE article_diff",
+        ],
+    ),
+    (
+        # article_text 테이블은 create_all이 만든다
+        "0007_article_text_store",
+        [
+            # 짧은 본문도 압축되도록: 128바이트 넘는 행부터 압축 시도, 가능하면 행 안(MAIN)에, PG14+면 lz4
+            "ALTER TABLE article_text SET (toast_tuple_target = 128)",
+            "ALTER TABLE article_text ALTER COLUMN content SET STORAGE MAIN",
+            """
+            DO $migration$
+            BEGIN
+                IF current_setting('server_version_num')::int >= 140000 THEN
+                    ALTER TABLE article_text ALTER COLUMN content SET COMPRESSION lz4;
+                END IF;
+            EXCEPTION WHEN OTHERS THEN
+                RAISE NOTICE 'lz4 미지원 – 기본 압축(pglz) 사용: %', SQLERRM;
+            END
+            $migration$
+            """,
+            "ALTER TABLE article_diff ADD COLUMN IF NOT EXISTS old_hash TEXT",
+            "ALTER TABLE article_diff ADD COLUMN IF NOT EXISTS new_hash TEXT",
+            # 기존 본문을 article_text로 옮기고 해시로 바꾼 뒤 본문 컬럼 삭제
+            # (디스크 공간은 VACUUM FULL / pg_repack 으로 테이블을 다시 써야 돌아온다)
+            _if_column_exists(
+                "article_diff",
+                "new_content",
+                f"""
+                INSERT INTO article_text (content_hash, content)
+                SELECT {ARTICLE_TEXT_HASH_SQL.format("c")}, c
+                FROM (
+                    SELECT old_content AS c FROM article_diff
+                    UNION
+                    SELECT new_content FROM article_diff
+                ) s
+                WHERE c <> ''
+                ON CONFLICT (content_hash) DO NOTHING
+                """,
+                f"""
+                UPDATE article_diff
+                SET old_hash = {ARTICLE_TEXT_HASH_SQL.format("old_content")},
+                    new_hash = {ARTICLE_TEXT_HASH_SQL.format("new_content")}
+                """,
+                "ALTER TABLE article_diff DROP COLUMN old_content, DROP COLUMN new_content",
+            ),
+            _add_foreign_key("fk_article_diff_old_hash", "article_diff", "old_hash", "article_text", "content_hash"),
+            _add_foreign_key("fk_article_diff_new_hash", "article_diff", "new_hash", "article_text", "content_hash"),
+            "ANALYZE article_text",
+            "ANALYZE article_diff",
+        ],
+    ),
+    (
+        # 기존 행의 값은 python -m app.services.backfill_article_word_diffs 로 채운다 (difflib 계산이라 SQL로 못 함)
+        "0008_article_diff_word_diff",
+        [
+            "ALTER TABLE article_diff ADD COLUMN IF NOT EXISTS is_changed BOOLEAN",
+            "ALTER TABLE article_diff ADD COLUMN IF NOT EXISTS change_score INTEGER",
+            "ALTER TABLE article_diff ADD COLUMN IF NOT EXISTS diff_ops JSONB",
+        ],
+    ),
+    (
+        # 같은 sort_key 안의 순서 = 적재 순서. 기존 행은 물리 순서(ctid)로 추정한다 (COPY로 순서대로 들어갔고
+        # 0007의 전체 UPDATE도 스캔 순서대로 새 버전을 쓰므로 대체로 보존됨).
+        # sort_key 자체는 python -m app.services.backfill_article_sort_keys 로 새 규칙(앞 행 상속/부칙 구역)에 맞춰 다시 계산
+        "0009_article_diff_ordinal",
+        [
+            "ALTER TABLE article_diff ADD COLUMN IF NOT EXISTS ordinal INTEGER",
+            """
+            UPDATE article_diff a
+            SET ordinal = o.n
+            FROM (
+                SELECT diff_id, row_number() OVER (PARTITION BY mst ORDER BY ctid) - 1 AS n
+                FROM article_diff
+            ) o
+            WHERE a.diff_id = o.diff_id AND a.ordinal IS NULL
+            """,
+            "ALTER TABLE article_diff ALTER COLUMN ordinal SET NOT NULL",
+            """
+            CREATE INDEX IF NOT EXISTS ix_article_diff_mst_order
+            ON article_diff (mst, sort_key, ordinal)
+            """,
+            "DROP INDEX IF EXISTS ix_article_diff_mst_sort_key",
+            "ANALYZE article_diff",
+        ],
+    ),
+    (
+        # 목록 조회는 law_change_feed만 읽으므로(0005) 원본 테이블의 정렬/검색 인덱스는 적재·AI 저장 비용만 든다
+        # (ix_law_change_event_law_id는 law 조인/법령별 조회에 계속 사용)
+        "0010_drop_unused_list_indexes",
+        [
+            "DROP INDEX IF EXISTS ix_law_change_event_proclamation_order",
+            "DROP INDEX IF EXISTS ix_law_change_event_enforce_order",
+            "DROP INDEX IF EXISTS ix_law_change_event_collected_order",
+            "DROP INDEX IF EXISTS ix_law_law_name_trgm",
+            "DROP INDEX IF EXISTS ix_law_change_event_ai_text_trgm",
+        ],
+    ),
+]
+
+
+def run_migrations(engine: Engine) -> None:
+    """아직 적용되지 않은 MIGRATIONS를 순서대로 적용 (여러 프로세스가 동시에 떠도 advisory lock으로 한 번만)"""
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('law_change.schema_migration'))"))
+        conn.execute(
+            text(
+                """
+                CREATE TABLE IF NOT EXISTS schema_migration (
+                    name TEXT PRIMARY KEY,
+                    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+                """
+            )
+        )
+        applied = set(conn.scalars(text("SELECT name FROM schema_migration")))
+
+        for name, statements in MIGRATIONS:
+            if name in applied:
+                continue
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.execute(
+                text("INSERT INTO schema_migration (name) VALUES (:name)"),
+                {"name": name},
+            )
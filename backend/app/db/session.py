@@ -1,23 +1,63 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlalchemy.orm import Session
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+
+def _sync_connect_args() -> dict:
+    if settings.db_statement_timeout_ms > 0:
+        return {"options": f"-c statement_timeout={settings.db_statement_timeout_ms}"}
+    return {}
+
+
+def _async_database_url() -> str:
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# 적재/관리자/AI 워커용 (sync, FastAPI 스레드풀 또는 백그라운드 스레드에서 사용)
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_sec,
+    connect_args=_sync_connect_args(),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 조회 API용 (async, 이벤트 루프에서 바로 실행 → 스레드풀이 적재 작업으로 차도 영향 없음)
+async_engine = create_async_engine(
+    _async_database_url(),
+    pool_pre_ping=True,
+    pool_size=settings.db_async_pool_size,
+    max_overflow=settings.db_async_max_overflow,
+    pool_timeout=settings.db_async_pool_timeout_sec,
+    connect_args={
+        "server_settings": {"statement_timeout": str(settings.db_async_statement_timeout_ms)},
+    },
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
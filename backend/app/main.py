@@ -1,16 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
 from app.db import Base
-from app.db.session import engine
+from app.db.migrations import run_migrations
+from app.db.session import async_engine, engine
 from app.api.v1.endpoints import admin, changes
+from app.services.backfill_jobs import resume_interrupted_jobs
+from app.services.nlic_async_client import close_async_nlic_client
 
 settings = get_settings()
 
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 크래시/재배포로 끊긴 백필 작업은 체크포인트부터 이어서 실행
+    resume_interrupted_jobs()
+    yield
+    # 공용 NLIC async 클라이언트 커넥션 풀 정리
+    await close_async_nlic_client()
+    await async_engine.dispose()
+
 
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,40 @@
+from sqlalchemy import (
+    Column,
+    Text,
+    Integer,
+    DateTime,
+    PrimaryKeyConstraint,
+)
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class AiSummaryCache(Base):
+    """
+    AI 요약 결과 캐시 – 같은 MST 내용(신·구조문 + 조문 diff)에 대한 LLM 결과를 재사용
+    모델명/프롬프트 버전이 키에 들어가므로 둘 중 하나가 바뀌면 자연히 새로 생성된다.
+    """
+
+    __tablename__ = "ai_summary_cache"
+
+    content_hash = Column(Text, nullable=False)   # mst_content_hash (sha256 hex)
+    model_name = Column(Text, nullable=False)
+    prompt_version = Column(Text, nullable=False)
+
+    ai_importance = Column(Text, nullable=True)
+    change_summary = Column(Text, nullable=True)
+    action_recommendation = Column(Text, nullable=True)
+
+    hit_count = Column(Integer, nullable=False, server_default="0")
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    last_hit_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("content_hash", "model_name", "prompt_version"),
+    )
@@ -1,13 +1,99 @@
+from typing import Optional
+import re
+
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     Column,
+    Integer,
     Text,
     DateTime,
+    ForeignKey,
     Index,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func, text
 
 from app.db.base import Base
+from app.models.article_text import ArticleText
+
+
+# 조문 정렬 키: 조문번호(없으면 본문 앞부분)에서 읽은 (부칙 구역, 조, 조의N, 항)을 한 정수로
+#   부칙 구역 * 10^12 + 조 * 10^6 + 조의N * 10^3 + 항(①~⑳)
+# - 부칙 구역: 적재 순서상 "부칙"이 나올 때마다 +1 (부칙 제1조가 본칙 제1조나 앞 부칙과 섞이지 않게)
+# - 번호를 못 읽은 행(장/절 제목 등)은 바로 앞 행의 키를 물려받는다 → (sort_key, ordinal)로 앞 행 바로 뒤
+_SORT_KEY_SECTION = 10 ** 12
+_SORT_KEY_JO = re.compile(r"제\s*([0-9]+)\s*조(?:\s*의\s*([0-9]+))?")
+_SORT_KEY_HANG = re.compile(r"[①-⑳]")
+_SORT_KEY_TAG = re.compile(r"<[^>]*>")
+_SORT_KEY_CONTENT_SCAN = 200   # 태그를 지우기 전에 볼 본문 길이
+_SORT_KEY_CONTENT_CHARS = 40   # 태그를 지운 뒤 정렬 키에 쓰는 본문 길이
+
+
+def _article_sort_label(
+    old_no: Optional[str],
+    old_content: Optional[str],
+    new_no: Optional[str],
+    new_content: Optional[str],
+) -> str:
+    head = _SORT_KEY_TAG.sub("", (new_content or old_content or "")[:_SORT_KEY_CONTENT_SCAN])
+    return " ".join([*(no for no in (new_no, old_no) if no), head[:_SORT_KEY_CONTENT_CHARS]])
+
+
+def compute_article_sort_key(
+    old_no: Optional[str],
+    old_content: Optional[str],
+    new_no: Optional[str],
+    new_content: Optional[str],
+    prev_key: Optional[int] = None,
+) -> int:
+    """
+    조문 비교 행의 법령 순서 정렬 키 (제2조 < 제10조 < 제10조의2 < 부칙 제1조).
+    prev_key는 적재 순서상 바로 앞 행의 키 (첫 행이면 None) – 부칙 구역과 번호 없는 행의 키가 여기서 이어진다.
+    같은 키끼리는 ordinal(적재 순서)로 정렬한다.
+    """
+    label = _article_sort_label(old_no, old_content, new_no, new_content)
+
+    prev_key = prev_key or 0
+    section = prev_key // _SORT_KEY_SECTION
+    if "부칙" in label:
+        section += 1
+        prev_key = section * _SORT_KEY_SECTION  # 새 부칙 구역의 맨 앞
+
+    hang = _SORT_KEY_HANG.search(label)
+    hang_no = ord(hang.group(0)) - ord("①") + 1 if hang else 0
+
+    jo = _SORT_KEY_JO.search(label)
+    if jo:
+        return (
+            section * _SORT_KEY_SECTION
+            + int(jo.group(1)) * 10 ** 6
+            + int(jo.group(2) or 0) * 10 ** 3
+            + hang_no
+        )
+    if hang:
+        # 항만 있는 행은 앞 행의 조에 붙는다
+        return prev_key // 10 ** 3 * 10 ** 3 + hang_no
+    return prev_key
+
+
+_ARTICLE_SORT_LABEL_SQL = (
+    "concat_ws(' ', nullif(new_no, ''), nullif(old_no, ''), "
+    f"left(regexp_replace(left(coalesce(nullif(new_content, ''), old_content, ''), {_SORT_KEY_CONTENT_SCAN}), "
+    f"'<[^>]*>', '', 'g'), {_SORT_KEY_CONTENT_CHARS}))"
+)
+
+_SORT_KEY_JO_SQL = "'제\\s*([0-9]+)\\s*조(?:\\s*의\\s*([0-9]+))?'"
+
+# 본문이 article_diff에 있던 때의 sort_key 첫 backfill (migrations 0006) – 행 하나만 보는 예전 규칙.
+# 앞 행 상속/부칙 구역은 0009 이후 app.services.backfill_article_sort_keys가 다시 계산한다
+ARTICLE_SORT_KEY_SQL = f"""(
+    CASE WHEN position('부칙' in {_ARTICLE_SORT_LABEL_SQL}) > 0 THEN 1000000000000 ELSE 0 END
+    + coalesce((regexp_match({_ARTICLE_SORT_LABEL_SQL}, {_SORT_KEY_JO_SQL}))[1]::bigint * 1000000, 0)
+    + coalesce((regexp_match({_ARTICLE_SORT_LABEL_SQL}, {_SORT_KEY_JO_SQL}))[2]::bigint * 1000, 0)
+    + coalesce(ascii((regexp_match({_ARTICLE_SORT_LABEL_SQL}, '[①-⑳]'))[1]) - ascii('①') + 1, 0)
+)"""
 
 
 class ArticleDiff(Base):
@@ -22,9 +108,28 @@ class ArticleDiff(Base):
     mst = Column(Text, nullable=False)
 
     old_no = Column(Text, nullable=True)
-    old_content = Column(Text, nullable=True)
     new_no = Column(Text, nullable=True)
-    new_content = Column(Text, nullable=True)
+
+    # 본문은 article_text에 한 번만 저장하고 해시로 참조 (빈 본문은 NULL)
+    old_hash = Column(
+        Text,
+        ForeignKey("article_text.content_hash", name="fk_article_diff_old_hash"),
+        nullable=True,
+    )
+    new_hash = Column(
+        Text,
+        ForeignKey("article_text.content_hash", name="fk_article_diff_new_hash"),
+        nullable=True,
+    )
+
+    # 법령 순서 정렬 키 (compute_article_sort_key, 적재 시 계산) + 같은 키 안에서의 순서
+    sort_key = Column(BigInteger, nullable=False)
+    ordinal = Column(Integer, nullable=False)   # mst 안에서의 적재 순서 (iter_article_pairs 순번, 0부터)
+
+    # 적재 시 계산한 단어 diff (text_diff.article_word_diff). 0008 이전 행은 backfill 전까지 NULL
+    is_changed = Column(Boolean, nullable=True)      # <p> 등을 정리한 본문이 다른지
+    change_score = Column(Integer, nullable=True)    # 바뀐(삭제+추가) 단어 수
+    diff_ops = Column(JSONB, nullable=True)          # [[tag, i1, i2, j1, j2], ...] (text_diff.word_diff_ops)
 
     created_at = Column(
         DateTime(timezone=True),
@@ -32,5 +137,17 @@ class ArticleDiff(Base):
         server_default=func.now(),
     )
 
+    old_text = relationship(ArticleText, foreign_keys=[old_hash], lazy="joined", viewonly=True)
+    new_text = relationship(ArticleText, foreign_keys=[new_hash], lazy="joined", viewonly=True)
+
+    @property
+    def old_content(self) -> Optional[str]:
+        return self.old_text.content if self.old_text is not None else None
+
+    @property
+    def new_content(self) -> Optional[str]:
+        return self.new_text.content if self.new_text is not None else None
+
 
-Index("idx_article_diff_mst", ArticleDiff.mst)
+# mst별 조문을 법령 순서대로 읽는 인덱스 (mst 단독 조회도 이 인덱스로)
+Index("ix_article_diff_mst_order", ArticleDiff.mst, ArticleDiff.sort_key, ArticleDiff.ordinal)
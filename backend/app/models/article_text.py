@@ -0,0 +1,41 @@
+from typing import Optional
+import hashlib
+
+from sqlalchemy import (
+    Column,
+    Text,
+    DateTime,
+)
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+def article_text_hash(content: Optional[str]) -> Optional[str]:
+    """조문 본문의 주소 (sha256 hex). 빈 본문은 저장하지 않고 NULL. ARTICLE_TEXT_HASH_SQL과 같은 값"""
+    if not content:
+        return None
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+# article_text_hash와 같은 값을 만드는 SQL 식 ({} 자리에 컬럼)
+ARTICLE_TEXT_HASH_SQL = "CASE WHEN {0} <> '' THEN encode(sha256(convert_to({0}, 'UTF8')), 'hex') END"
+
+
+class ArticleText(Base):
+    """
+    조문 본문 저장소 (내용 주소 방식) – 같은 본문은 MST가 달라도 한 번만 저장.
+    article_diff.old_hash / new_hash가 가리키고, 한 번 쓰면 바뀌지 않는다.
+    content는 짧은 본문도 압축되도록 migrations 0007에서 toast_tuple_target / STORAGE MAIN / lz4 설정.
+    """
+
+    __tablename__ = "article_text"
+
+    content_hash = Column(Text, primary_key=True)   # article_text_hash(content)
+    content = Column(Text, nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -0,0 +1,96 @@
+from sqlalchemy import (
+    Column,
+    Text,
+    Date,
+    DateTime,
+    Integer,
+    ForeignKey,
+    CheckConstraint,
+    PrimaryKeyConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func, text
+
+from app.db.base import Base
+
+
+class BackfillJob(Base):
+    """변경이력 백필(기간 적재) 작업 – 체크포인트를 남겨서 중단 후 이어서 실행"""
+
+    __tablename__ = "backfill_job"
+
+    job_id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    workers = Column(Integer, nullable=True)  # 없으면 설정값(nlic_backfill_workers)
+
+    # 'PENDING' | 'RUNNING' | 'PAUSE_REQUESTED' | 'PAUSED' | 'COMPLETED' | 'FAILED'
+    status = Column(Text, nullable=False, server_default="PENDING")
+
+    # 체크포인트: 모든 페이지를 마친 마지막 날짜 / 마지막으로 커밋된 (날짜, 페이지)
+    last_completed_date = Column(Date, nullable=True)
+    last_page_date = Column(Date, nullable=True)
+    last_page_no = Column(Integer, nullable=True)
+
+    total_history_records_seen = Column(Integer, nullable=False, server_default="0")
+    total_new_events_inserted = Column(Integer, nullable=False, server_default="0")
+    total_laws_touched = Column(Integer, nullable=False, server_default="0")
+    old_new_failed = Column(Integer, nullable=False, server_default="0")
+
+    error = Column(Text, nullable=True)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('PENDING','RUNNING','PAUSE_REQUESTED','PAUSED','COMPLETED','FAILED')",
+            name="ck_backfill_job_status",
+        ),
+    )
+
+
+class BackfillJobDate(Base):
+    """백필 작업의 날짜별 진행 상태/집계"""
+
+    __tablename__ = "backfill_job_date"
+
+    job_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("backfill_job.job_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    target_date = Column(Date, nullable=False)
+
+    status = Column(Text, nullable=False)  # 'RUNNING' | 'DONE'
+    pages_done = Column(Integer, nullable=False, server_default="0")
+    history_records = Column(Integer, nullable=False, server_default="0")
+    new_events = Column(Integer, nullable=False, server_default="0")
+    laws_touched = Column(Integer, nullable=False, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("job_id", "target_date"),
+        CheckConstraint("status IN ('RUNNING','DONE')", name="ck_backfill_job_date_status"),
+    )
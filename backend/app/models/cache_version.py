@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Text, BigInteger, DateTime
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class CacheVersion(Base):
+    """
+    프로세스 메모리 캐시 무효화용 버전 번호.
+    데이터를 바꾸는 쪽이 같은 트랜잭션에서 올리고, 캐시하는 쪽은 값이 바뀌면 버린다.
+    """
+
+    __tablename__ = "cache_version"
+
+    name = Column(Text, primary_key=True)
+    version = Column(BigInteger, nullable=False, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
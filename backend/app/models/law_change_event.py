@@ -1,10 +1,15 @@
+from datetime import date
+from typing import Any
+import hashlib
+
 from sqlalchemy import (
     Column,
     Text,
     Date,
     DateTime,
     ForeignKey,
-    CheckConstraint
+    CheckConstraint,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func, text
@@ -13,6 +18,73 @@ from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
+# 변경이력 중복 판정 키 (이 순서대로 정규화해서 해시)
+EVENT_KEY_COLUMNS = (
+    "law_id",
+    "mst",
+    "change_type",
+    "proclamation_no",
+    "proclamation_date",
+    "enforce_date",
+    "current_hist_cd",
+)
+
+_EVENT_KEY_SEP = "\x1f"
+
+
+def _event_key_part(value: Any) -> str:
+    # NULL과 빈 문자열을 구분하기 위해 값이 있으면 '=' 접두사, NULL이면 '~'
+    if value is None:
+        return "~"
+    if isinstance(value, date):
+        return "=" + value.strftime("%Y-%m-%d")
+    return "=" + str(value)
+
+
+def compute_event_key(
+    law_id: Any,
+    mst: Any,
+    change_type: Any,
+    proclamation_no: Any,
+    proclamation_date: date | None,
+    enforce_date: date | None,
+    current_hist_cd: Any,
+) -> str:
+    """
+    변경이력 자연키(7개 컬럼)의 NULL-safe 지문 (md5 hex).
+    EVENT_KEY_SQL과 같은 값을 만들어야 한다 (기존 행 backfill용).
+    """
+    raw = _EVENT_KEY_SEP.join(
+        _event_key_part(v)
+        for v in (
+            law_id,
+            mst,
+            change_type,
+            proclamation_no,
+            proclamation_date,
+            enforce_date,
+            current_hist_cd,
+        )
+    )
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _event_key_sql_part(col: str) -> str:
+    if col.endswith("_date"):
+        return f"coalesce('=' || to_char({col}, 'YYYY-MM-DD'), '~')"
+    return f"coalesce('=' || {col}, '~')"
+
+
+# compute_event_key와 같은 값을 만드는 SQL 식
+EVENT_KEY_SQL = "md5(concat_ws(E'\\x1f', {}))".format(
+    ", ".join(_event_key_sql_part(col) for col in EVENT_KEY_COLUMNS)
+)
+
+
+# AI 요약/조치사항 검색 대상 식 – ix_law_change_feed_ai_text_trgm(migrations 0005)의 식과 똑같아야 인덱스를 탄다
+AI_SEARCH_TEXT_SQL = "(coalesce(change_summary, '') || ' ' || coalesce(action_recommendation, ''))"
+
+
 class LawChangeEvent(Base):
     __tablename__ = "law_change_event"
 
@@ -35,10 +107,14 @@ class LawChangeEvent(Base):
     proclamation_date = Column(Date, nullable=True)
     enforce_date = Column(Date, nullable=True)
     current_hist_cd = Column(Text, nullable=True)
+    # 위 7개 자연키의 지문 (compute_event_key) – 유니크 인덱스로 중복 방지
+    event_key = Column(Text, nullable=False)
     collected_date = Column(Date, nullable=False)
     change_summary = Column(Text, nullable=True)           # 내용요약
     action_recommendation = Column(Text, nullable=True)     # 조치사항
     ai_importance = Column(Text, nullable=True)  # 'HIGH' | 'MEDIUM' | 'LOW' | 'NONE'
+    # AI 워커가 요약 대상으로 가져간 시각 (여러 프로세스 중복 처리 방지용 임대)
+    ai_claimed_at = Column(DateTime(timezone=True), nullable=True)
 
     created_at = Column(
         DateTime(timezone=True),
@@ -53,4 +129,11 @@ class LawChangeEvent(Base):
             "ai_importance IN ('HIGH','MEDIUM','LOW','NONE')",
             name="ck_law_change_event_ai_importance",
         ),
-    )
\ No newline at end of file
+        Index("uq_law_change_event_event_key", "event_key", unique=True),
+    )
+
+
+# 목록 조회 정렬/검색 인덱스는 law_change_feed에 있다 (이 테이블의 0003/0004 인덱스는 0010에서 삭제)
+
+# law 조인 / 법령별 조회용 (FK에는 인덱스가 자동으로 생기지 않음)
+Index("ix_law_change_event_law_id", LawChangeEvent.law_id)
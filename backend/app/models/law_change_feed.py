@@ -0,0 +1,67 @@
+from sqlalchemy import (
+    Column,
+    Text,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+
+
+class LawChangeFeed(Base):
+    """
+    변경이력 목록(GET /api/v1/changes) 전용 읽기 모델.
+    law_change_event + law 조인 결과를 목록 항목 컬럼 그대로 펼쳐 둔 테이블로,
+    적재(nlic_loader)와 AI 요약(ai_summarizer)이 바뀐 행만 갱신한다 (app/services/change_feed.py).
+    """
+
+    __tablename__ = "law_change_feed"
+
+    change_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("law_change_event.change_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    law_id = Column(Text, nullable=False)
+    law_name = Column(Text, nullable=False)
+    law_type_name = Column(Text, nullable=True)
+    ministry_names = Column(Text, nullable=True)
+
+    change_type = Column(Text, nullable=True)
+    proclamation_no = Column(Text, nullable=True)
+    proclamation_date = Column(Date, nullable=True)
+    enforce_date = Column(Date, nullable=True)
+    current_hist_cd = Column(Text, nullable=True)
+    collected_date = Column(Date, nullable=False)
+    change_summary = Column(Text, nullable=True)
+    action_recommendation = Column(Text, nullable=True)
+    ai_importance = Column(Text, nullable=True)
+
+    # law_change_event.created_at (목록 정렬 2순위)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+
+# 목록 정렬과 같은 순서의 인덱스 (law_change_event의 ix_*_order와 동일한 구성)
+Index(
+    "ix_law_change_feed_proclamation_order",
+    LawChangeFeed.proclamation_date.desc().nullslast(),
+    LawChangeFeed.created_at.desc(),
+    LawChangeFeed.change_id.desc(),
+)
+Index(
+    "ix_law_change_feed_enforce_order",
+    LawChangeFeed.enforce_date.desc().nullslast(),
+    LawChangeFeed.created_at.desc(),
+    LawChangeFeed.change_id.desc(),
+)
+Index(
+    "ix_law_change_feed_collected_order",
+    LawChangeFeed.collected_date.desc().nullslast(),
+    LawChangeFeed.created_at.desc(),
+    LawChangeFeed.change_id.desc(),
+)
+Index("ix_law_change_feed_law_id", LawChangeFeed.law_id)
@@ -29,6 +29,7 @@ class LawChangeListItem(BaseModel):
 class LawChangeListResponse(BaseModel):
     total: int
     items: List[LawChangeListItem]
+    next_cursor: Optional[str] = None   # 다음 페이지 커서 (없으면 마지막 페이지)
 
 
 class ArticleDiffItem(BaseModel):
@@ -37,6 +38,13 @@ class ArticleDiffItem(BaseModel):
     old_content: Optional[str] = None
     new_no: Optional[str] = None
     new_content: Optional[str] = None
+    old_truncated: bool = False   # max_chars로 old_content가 잘렸는지
+    new_truncated: bool = False
+    # 적재 시 계산한 단어 diff (예전 행은 backfill 전까지 None)
+    is_changed: Optional[bool] = None
+    change_score: Optional[int] = None        # 바뀐(삭제+추가) 단어 수
+    # [[tag, i1, i2, j1, j2], ...] tag: r/d/i, 인덱스는 <p> 제거·unescape 한 본문(잘리기 전)의 공백 단위 단어
+    diff_ops: Optional[List[List[Any]]] = None
 
     class Config:
         from_attributes = True 
@@ -66,7 +74,15 @@ class LawChangeDetail(BaseModel):
     has_old_new: str              # 'Y' / 'N'
     old_basic: Optional[Dict[str, Any]] = None
     new_basic: Optional[Dict[str, Any]] = None
-    articles: List[ArticleDiffItem]
+    article_count: int = 0            # 조문 비교 전체 건수
+    changed_article_count: int = 0    # 그중 개정 전/후 내용이 다른 건수
+    articles: List[ArticleDiffItem]   # 첫 페이지만 (나머지는 GET /changes/{change_id}/articles)
+    articles_next_cursor: Optional[str] = None
 
     class Config:
         orm_mode = True
+
+
+class ArticleDiffPage(BaseModel):
+    items: List[ArticleDiffItem]
+    next_cursor: Optional[str] = None   # 다음 페이지 커서 (없으면 마지막 페이지)
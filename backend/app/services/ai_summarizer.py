@@ -1,40 +1,109 @@
 # app/services/ai_summarizer.py
 
+import hashlib
 import json
 import logging
-from typing import Optional, Tuple
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
 import time
-import re
-import html
+import textwrap
+import threading
 
-import requests
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.config import get_settings
+from app.db.session import SessionLocal
 from app.models.law_change_event import LawChangeEvent
 from app.models.law import Law
 from app.models.old_new_info import OldNewInfo
 from app.models.article_diff import ArticleDiff
+from app.models.ai_summary_cache import AiSummaryCache
+from app.services.cache_versions import AI_SUMMARIES, bump_cache_version
+from app.services.change_feed import update_feed_ai
+from app.services.llm_backends import get_llm_backend
+from app.services.llm_stream import IMPORTANCE_VALUES, StreamAborted, summary_validator
+from app.services.text_diff import (
+    CHARS_PER_TOKEN,
+    WordDiff,
+    clean_html,
+    estimate_tokens,
+    word_diff,
+    word_diff_from_ops,
+)
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
-OLLAMA_URL = f"{settings.ollama_base_url}/api/generate"
-OLLAMA_MODEL = settings.ollama_model_name
 
+# 프롬프트 문구/구성을 바꾸면 올려서 ai_summary_cache를 무효화
+PROMPT_TEMPLATE_VERSION = "2"
+# 묶음 프롬프트로 만든 결과는 따로 저장 (단건 프롬프트 결과와 섞지 않는다)
+BATCH_PROMPT_VERSION = f"{PROMPT_TEMPLATE_VERSION}-batch"
 
-def _clean_html(text: str) -> str:
-    """old_content/new_content 안의 <p> 같은 단순 강조태그 제거만."""
-    if not text:
-        return ""
 
-    text = html.unescape(text)
+_PROMPT_INTRO = textwrap.dedent("""\
+    당신은 한국 산업안전보건·환경 법규를 분석하는 컴플라이언스 전문가입니다.
+    아래 정보는 안전보건관리 솔루션(중대재해처벌법 대응, KOSHA 가이드 기반)의 법규 변경이력입니다.
 
-    # <p> 또는 </p> 제거만 수행
-    text = re.sub(r"</?p\s*>", "", text, flags=re.IGNORECASE)
+    이 솔루션의 주요 메뉴는 다음과 같습니다.
+    - 경영: 경영책임자 의무, 안전보건 방침/목표, 이사회 보고 등
+    - 안전관리: 위험성평가, 작업허가, 설비/시설 점검, 법규 준수 평가, 자체점검
+    - 보건: 근로자 건강검진, 작업환경측정, 보호구 관리, 직업병 예방
+    - 환경: 대기/수질/폐기물/화학물질 관리, 배출시설 인허가, 환경점검
+
+    사용자는 공장 현장 근로자, 안전관리자, 환경/보건 담당자입니다.
+    조문 변경은 바뀐 부분만 "…앞 문맥 [개정 전 → 개정 후] 뒤 문맥…" 형태로 보여 줍니다.""")
+
+_PROMPT_RULES = textwrap.dedent("""\
+    1. 이번 법령 변경의 중요도를 아래 중 하나로 판단해 주세요.
+    - NONE: 시스템 관점에서 별도 조치가 거의 필요 없는 경미한 변경
+    - LOW: 인지는 필요하지만 즉시적인 조치는 크지 않은 변경
+    - MEDIUM: 관련 메뉴/문서를 수정해야 할 가능성이 있는 변경
+    - HIGH: 반드시 조치해야 하는 중요한 변경
+
+    2. 현업 담당자가 이해하기 쉽게, 변경의 핵심 내용을 한국어로 3~5줄 정도로 요약해 주세요.
+    - 실제로 변경된 조문을 중심으로 설명해 주세요.
+
+    3. 우리 솔루션을 사용하는 사용자가 해야 할 구체적인 조치사항을 제안해 주세요.
+    - 담당자 관점으로 작성: 예) "안전관리자", "현장 반장", "환경 담당자", "경영책임자" 등
+    - 솔루션 메뉴와 연결해서 작성: 위험성평가, 법규 준수 평가, 작업허가, 교육관리, 문서관리, 설비점검, 환경점검 등
+    - 체크리스트 형태의 액션으로 작성: "무엇을, 어느 메뉴에서, 어떻게 변경/추가/점검할지"를 써주세요.
+
+    4. 만약 시스템이나 현장 조치가 사실상 필요 없는 경미한 변경이라면,
+    - importance를 "NONE"으로 설정하고
+    - actions 배열에는 "조치할 사항이 없습니다." 한 줄만 넣어 주세요.""")
+
+_PROMPT_OUTPUT = textwrap.dedent("""\
+    반드시 아래 JSON 형식으로만 출력하세요. 다른 문장/설명은 절대 쓰지 마세요.
+
+    {
+    "importance": "HIGH | MEDIUM | LOW | NONE 중 하나",
+    "summary": "변경 내용을 한국어로 요약",
+    "actions": ["첫번째 조치사항", "두번째 조치사항"]
+    }""")
+
+_PROMPT_BATCH_OUTPUT = textwrap.dedent("""\
+    위의 각 항목(변경이력)마다 따로 판단해서, 반드시 아래 JSON 배열 형식으로만 출력하세요.
+    항목 하나당 객체 하나, id는 항목 번호와 같아야 합니다. 다른 문장/설명은 절대 쓰지 마세요.
+
+    [
+    {
+    "id": 1,
+    "importance": "HIGH | MEDIUM | LOW | NONE 중 하나",
+    "summary": "변경 내용을 한국어로 요약",
+    "actions": ["첫번째 조치사항", "두번째 조치사항"]
+    }
+    ]""")
+
+# 묶음 요청 대상 제개정구분 (다른 법 개정에 따른 기계적 개정)
+_BATCH_CHANGE_TYPES = {"타법개정"}
+
+# 조문 변경 부분 1개의 최대 글자 수 (긴 신설 조문 등)
+_MAX_SPAN_CHARS = 400
 
-    return text.strip()
 
 def _format_basic_json(basic: dict | None, label: str) -> str:
     """old_basic / new_basic JSONB를 사람이 읽기 좋게 정리."""
@@ -54,158 +123,356 @@ def _format_basic_json(basic: dict | None, label: str) -> str:
     return f"[{label}]\n" + "\n".join(lines)
 
 
-def _format_article_diffs(rows: list[ArticleDiff], max_rows: int = 5) -> str:
-    """ArticleDiff 여러 건을 조문별 변경 요약 형태로 정리."""
-    if not rows:
-        return "조문별 diff 정보 없음"
+class ArticleContent(NamedTuple):
+    """프롬프트용 조문 1건 (ArticleDiff에서 값만 복사)"""
+    old_no: Optional[str]
+    old_content: Optional[str]
+    new_no: Optional[str]
+    new_content: Optional[str]
+    is_changed: Optional[bool]
+    diff_ops: Optional[list]
 
-    lines: list[str] = []
-    for idx, row in enumerate(rows[:max_rows], start=1):
-        old_no = (row.old_no or "").strip()
-        new_no = (row.new_no or "").strip()
-        no_display = old_no or new_no or "(조문 번호 없음)"
-
-        old_text = _clean_html(row.old_content or "")
-        new_text = _clean_html(row.new_content or "")
-
-        lines.append(
-            f"- 조문 {no_display} (항목 {idx})\n"
-            f"  [개정 전]\n  {old_text or '(내용 없음)'}\n"
-            f"  [개정 후]\n  {new_text or '(내용 없음)'}"
-        )
 
-    if len(rows) > max_rows:
-        lines.append(f"... (총 {len(rows)}개 중 상위 {max_rows}개만 표시)")
+class MstContent(NamedTuple):
+    """
+    프롬프트에 들어가는 MST 내용 (ORM 객체가 아니라 값).
+    워커는 건마다 커밋하므로, ORM 객체를 들고 있으면 커밋으로 만료된 뒤 조문/본문을 한 건씩 다시 읽는다.
+    """
+    has_old_new: bool               # has_old_new='Y'인 OldNewInfo가 있었는지
+    old_basic: Optional[dict]
+    new_basic: Optional[dict]
+    articles: List[ArticleContent]  # 법령 순서
+
 
+def _format_basics(content: MstContent) -> str:
+    """개정 후 기본 정보 전체 + 개정 전 기본 정보는 값이 달라진 항목만"""
+    if not content.has_old_new:
+        return "신·구조문 기본 정보 없음 (has_old_new != 'Y')"
+
+    new_basic = content.new_basic if isinstance(content.new_basic, dict) else {}
+    old_basic = content.old_basic if isinstance(content.old_basic, dict) else {}
+    changed_old = {k: v for k, v in old_basic.items() if new_basic.get(k) != v}
+
+    new_text = _format_basic_json(new_basic, "개정 후 기본 정보")
+    if not changed_old:
+        return new_text
+    return f"{new_text}\n\n" + _format_basic_json(changed_old, "개정 전 기본 정보 (달라진 항목만)")
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "…(생략)"
+
+
+def _format_article_change(no_display: str, old_text: str, new_text: str, diff: WordDiff) -> str:
+    if not old_text:
+        return f"- 조문 {no_display} [신설]\n  {_truncate(new_text, _MAX_SPAN_CHARS)}"
+    if not new_text:
+        return f"- 조문 {no_display} [삭제]\n  {_truncate(old_text, _MAX_SPAN_CHARS)}"
+
+    lines = [f"- 조문 {no_display} [개정, 단어 {diff.changed_words}/{diff.total_words}개 변경]"]
+    for c in diff.changes:
+        old = _truncate(c.old, _MAX_SPAN_CHARS) or "(없음)"
+        new = _truncate(c.new, _MAX_SPAN_CHARS) or "(삭제)"
+        lines.append(f"  · …{c.before} [{old} → {new}] {c.after}…")
     return "\n".join(lines)
 
-def build_prompt_for_change(db: Session, change: LawChangeEvent) -> str:
-    """법령 변경이력 1건에 대해 Qwen에게 줄 프롬프트 생성 (mst 기준 old/new + diff 포함)."""
 
-    law: Optional[Law] = change.law
+def _format_article_diffs(rows: List[ArticleContent], token_budget: int) -> str:
+    """
+    조문별 변경을 변경량(바뀐 단어 수)이 큰 순서로, 바뀐 부분만 token_budget 안에서 정리.
+    내용이 같은 조문은 뺀다.
+    """
+    if not rows:
+        return "조문별 diff 정보 없음"
 
-    law_name = getattr(law, "law_name", "") if law else ""
-    law_type_name = getattr(law, "law_type_name", "") if law else ""
-    ministry_names = getattr(law, "ministry_names", "") if law else ""
+    ranked: list[Tuple[int, str]] = []
+    unchanged = 0
+    for row in rows:
+        if row.is_changed is False:
+            unchanged += 1
+            continue
+        old_text = clean_html(row.old_content or "")
+        new_text = clean_html(row.new_content or "")
+        if old_text == new_text:
+            unchanged += 1
+            continue
 
-    meta_part = f"""
-                법령명: {law_name}
-                법령유형: {law_type_name}
-                소관부처: {ministry_names}
-                제개정구분: {change.change_type or ""}
-                공포번호: {change.proclamation_no or ""}
-                공포일: {change.proclamation_date or ""}
-                시행일: {change.enforce_date or ""}
-                수집일: {change.collected_date or ""}
-                MST: {change.mst}
-                """
-
-    # 🔹 mst 기준으로 OldNewInfo 1건 (있으면)
+        no_display = (row.old_no or "").strip() or (row.new_no or "").strip() or "(조문 번호 없음)"
+        # 적재 때 저장한 opcode가 있으면 그대로 (backfill 전 행만 다시 계산)
+        if row.diff_ops is not None:
+            diff = word_diff_from_ops(old_text, new_text, row.diff_ops)
+        else:
+            diff = word_diff(old_text, new_text)
+        # 신설/삭제 조문은 단어 수 전체가 변경량
+        ranked.append((diff.changed_words, _format_article_change(no_display, old_text, new_text, diff)))
+
+    if not ranked:
+        return "내용이 바뀐 조문 없음"
+
+    ranked.sort(key=lambda r: r[0], reverse=True)
+
+    blocks: list[str] = []
+    used = 0
+    for _, block in ranked:
+        cost = estimate_tokens(block)
+        if used + cost > token_budget:
+            remaining = token_budget - used
+            # 남은 예산이 조금이라도 있으면 잘라서 넣고 끝
+            if remaining > 50:
+                blocks.append(_truncate(block, int(remaining * CHARS_PER_TOKEN)))
+            break
+        blocks.append(block)
+        used += cost
+
+    notes = []
+    if len(blocks) < len(ranked):
+        notes.append(f"변경된 조문 {len(ranked)}개 중 변경량이 큰 {len(blocks)}개만 표시")
+    if unchanged:
+        notes.append(f"내용이 같은 조문 {unchanged}개 제외")
+    if notes:
+        blocks.append(f"... ({', '.join(notes)})")
+
+    return "\n".join(blocks)
+
+
+def load_mst_content(db: Session, mst: str) -> MstContent:
+    """프롬프트에 들어가는 MST 내용: OldNewInfo(has_old_new='Y'인 것만) + ArticleDiff 목록 (값으로 복사)"""
     old_new: OldNewInfo | None = (
         db.query(OldNewInfo)
         .filter(
-            OldNewInfo.mst == change.mst,
+            OldNewInfo.mst == mst,
             OldNewInfo.has_old_new == "Y",
         )
         .one_or_none()
     )
-
-    if old_new:
-        old_basic_text = _format_basic_json(old_new.old_basic, "개정 전 기본 정보")
-        new_basic_text = _format_basic_json(old_new.new_basic, "개정 후 기본 정보")
-        old_new_text = f"{old_basic_text}\n\n{new_basic_text}"
-    else:
-        old_new_text = "신·구조문 기본 정보 없음 (has_old_new != 'Y')"
-
-    # 🔹 mst 기준 ArticleDiff 여러 건
     diff_rows = (
         db.query(ArticleDiff)
-        .filter(ArticleDiff.mst == change.mst)
+        .filter(ArticleDiff.mst == mst)
+        .order_by(ArticleDiff.sort_key, ArticleDiff.ordinal)
         .all()
     )
-    diff_text = _format_article_diffs(diff_rows, max_rows=5)
-
-    detail_part = f"""
-                [신·구조문 정보 요약]
-                {old_new_text}
-
-                [조문별 diff 정보 요약]
-                {diff_text}
-                """
+    return MstContent(
+        has_old_new=old_new is not None,
+        old_basic=old_new.old_basic if old_new else None,
+        new_basic=old_new.new_basic if old_new else None,
+        articles=[
+            ArticleContent(
+                row.old_no, row.old_content, row.new_no, row.new_content, row.is_changed, row.diff_ops
+            )
+            for row in diff_rows
+        ],
+    )
 
-    prompt = f"""
-            당신은 한국 산업안전보건·환경 법규를 분석하는 컴플라이언스 전문가입니다.
-            아래 정보는 안전보건관리 솔루션(중대재해처벌법 대응, KOSHA 가이드 기반)의
-            법규 변경이력입니다.
 
-            이 솔루션의 주요 메뉴는 다음과 같습니다.
-            - 경영: 경영책임자 의무, 안전보건 방침/목표, 이사회 보고 등
-            - 안전관리: 위험성평가, 작업허가, 설비/시설 점검, 법규 준수 평가, 자체점검
-            - 보건: 근로자 건강검진, 작업환경측정, 보호구 관리, 직업병 예방
-            - 환경: 대기/수질/폐기물/화학물질 관리, 배출시설 인허가, 환경점검
+def mst_content_hash(content: MstContent) -> str:
+    """MST 내용(기본정보 + 조문 diff)의 지문. 행 순서와 무관하도록 정렬해서 해시"""
+    articles = sorted(
+        (
+            row.old_no or "",
+            row.old_content or "",
+            row.new_no or "",
+            row.new_content or "",
+        )
+        for row in content.articles
+    )
+    payload = {
+        "old_basic": content.old_basic,
+        "new_basic": content.new_basic,
+        "articles": articles,
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-            사용자는 공장 현장 근로자, 안전관리자, 환경/보건 담당자입니다.
 
-            [변경 이력 메타 정보]
-            {meta_part}
+def _format_change_meta(change: LawChangeEvent) -> str:
+    """변경이력 1건의 메타 정보 (법령명/유형/부처 + 이벤트 필드)"""
+    law: Optional[Law] = change.law
 
-            [신·구조문 및 diff 정보]
-            {detail_part}
+    law_name = getattr(law, "law_name", "") if law else ""
+    law_type_name = getattr(law, "law_type_name", "") if law else ""
+    ministry_names = getattr(law, "ministry_names", "") if law else ""
 
-            요청사항:
-            1. 이번 법령 변경의 중요도를 아래 중 하나로 판단해 주세요.
-            - NONE: 시스템 관점에서 별도 조치가 거의 필요 없는 경미한 변경
-            - LOW: 인지는 필요하지만 즉시적인 조치는 크지 않은 변경
-            - MEDIUM: 관련 메뉴/문서를 수정해야 할 가능성이 있는 변경
-            - HIGH: 반드시 조치해야 하는 중요한 변경
+    return "\n".join([
+        f"법령명: {law_name}",
+        f"법령유형: {law_type_name}",
+        f"소관부처: {ministry_names}",
+        f"제개정구분: {change.change_type or ''}",
+        f"공포번호: {change.proclamation_no or ''}",
+        f"공포일: {change.proclamation_date or ''}",
+        f"시행일: {change.enforce_date or ''}",
+        f"수집일: {change.collected_date or ''}",
+        f"MST: {change.mst}",
+    ])
+
+
+def _format_change_block(meta: str, content: MstContent, token_budget: int) -> str:
+    """변경이력 1건의 메타 정보 + 기본 정보 + 조문 변경 (조문 변경은 token_budget 안에서)"""
+    basics_part = _format_basics(content)
+
+    fixed = f"[변경 이력 메타 정보]\n{meta}\n\n[신·구조문 기본 정보]\n{basics_part}"
+    # 고정 부분을 뺀 나머지를 조문 변경에 쓰되, 기본 정보가 아주 길어도 최소한은 남긴다
+    diff_budget = max(200, token_budget - estimate_tokens(fixed))
+    diff_text = _format_article_diffs(content.articles, token_budget=diff_budget)
+
+    return f"{fixed}\n\n[조문별 변경 (바뀐 부분만)]\n{diff_text}"
+
+
+def build_prompt_for_change(
+    db: Session,
+    change: LawChangeEvent,
+    content: Optional[MstContent] = None,
+    meta: Optional[str] = None,
+) -> str:
+    """
+    법령 변경이력 1건에 대해 Qwen에게 줄 프롬프트 생성 (mst 기준 old/new + diff 포함).
+    전체 길이는 대략 ai_prompt_token_budget 토큰 이내.
+    content/meta를 미리 만들어 넘기면 change를 다시 읽지 않는다.
+    """
+    # 🔹 mst 기준 OldNewInfo 1건 (있으면) + ArticleDiff 여러 건
+    if content is None:
+        content = load_mst_content(db, change.mst)
+    if meta is None:
+        meta = _format_change_meta(change)
+
+    fixed_tokens = estimate_tokens(_PROMPT_INTRO) + estimate_tokens(_PROMPT_RULES) + estimate_tokens(_PROMPT_OUTPUT)
+    block = _format_change_block(meta, content, settings.ai_prompt_token_budget - fixed_tokens)
+
+    return "\n\n".join([
+        _PROMPT_INTRO,
+        block,
+        "요청사항:\n" + _PROMPT_RULES,
+        _PROMPT_OUTPUT,
+    ])
+
+
+def build_batch_prompt(
+    items: List[Tuple[str, MstContent]],
+) -> str:
+    """
+    작은 변경이력 여러 건을 한 번에 묻는 프롬프트 (공통 지시문은 한 번만).
+    items는 (_format_change_meta 결과, MstContent).
+    블록은 _batch_block_tokens가 잰 것과 같은 예산으로 만들어 잘리지 않고,
+    전체가 ai_prompt_token_budget 안에 들도록 묶는 것은 _pack_batches가 맡는다.
+    """
+    blocks = [
+        f"### 항목 {idx}\n" + _format_change_block(meta, content, settings.ai_prompt_token_budget)
+        for idx, (meta, content) in enumerate(items, start=1)
+    ]
+    return "\n\n".join([
+        _PROMPT_INTRO,
+        *blocks,
+        "요청사항 (항목마다):\n" + _PROMPT_RULES,
+        _PROMPT_BATCH_OUTPUT,
+    ])
+
+
+class AiCallStats:
+    """LLM 호출 통계 (벤치마크/로그용, 프로세스 전체 누적)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0        # 실제 LLM 요청 수 (재시도 포함)
+            self.retries = 0      # 그중 두 번째 이후 시도
+            self.failures = 0     # 형식 오류/중단된 시도
+            self.latencies: List[float] = []
+
+    def record(self, elapsed: float, attempt: int, ok: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            if attempt > 1:
+                self.retries += 1
+            if not ok:
+                self.failures += 1
+            self.latencies.append(elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            calls, retries, failures = self.calls, self.retries, self.failures
+
+        def _pct(p: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 3)
+
+        return {
+            "calls": calls,
+            "retries": retries,
+            "failures": failures,
+            "retry_rate": round(retries / calls, 4) if calls else 0.0,
+            "latency_p50_sec": _pct(0.5),
+            "latency_p95_sec": _pct(0.95),
+        }
+
+
+call_stats = AiCallStats()
+
+
+def _generate(prompt: str, streaming: bool | None = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    LLM 응답 텍스트와 호출 통계 (llm_streaming이면 객체가 닫히는 즉시 끊음).
+    통계는 서버가 알려 준 실제 토큰 수/prefill 시간 (스트리밍은 중간에 끊으므로 없음)
+    """
+    if streaming is None:
+        streaming = settings.llm_streaming
+    validator = summary_validator(settings.llm_stream_max_chars) if streaming else None
+    return get_llm_backend().generate(prompt, validator, timeout=settings.llm_timeout_sec)
 
-            2. 현업 담당자가 이해하기 쉽게, 변경의 핵심 내용을 한국어로 3~5줄 정도로 요약해 주세요.
-            - 실제로 변경된 조문(신·구조문 / diff)을 중심으로 설명해 주세요.
 
-            3. 우리 솔루션을 사용하는 사용자가 해야 할 구체적인 조치사항을 제안해 주세요.
-            - 담당자 관점으로 작성: 예) "안전관리자", "현장 반장", "환경 담당자", "경영책임자" 등
-            - 솔루션 메뉴와 연결해서 작성: 위험성평가, 법규 준수 평가, 작업허가, 교육관리, 문서관리, 설비점검, 환경점검 등
-            - 체크리스트 형태의 액션으로 작성: "무엇을, 어느 메뉴에서, 어떻게 변경/추가/점검할지"를 써주세요.
+def _normalize_result(obj: Dict[str, Any]) -> Tuple[str, Optional[str], Optional[str]]:
+    """LLM JSON 결과 → (summary, actions 텍스트, importance)"""
+    importance = (obj.get("importance") or "").strip().upper() or None
+    summary = obj.get("summary") or ""
+    actions = obj.get("actions") or []
 
-            4. 만약 시스템이나 현장 조치가 사실상 필요 없는 경미한 변경이라면,
-            - importance를 "NONE"으로 설정하고
-            - actions 배열에는 "조치할 사항이 없습니다." 한 줄만 넣어 주세요.
+    if importance == "NONE":
+        actions = ["조치할 사항이 없습니다."]
 
-            반드시 아래 JSON 형식으로만 출력하세요. 다른 문장/설명은 절대 쓰지 마세요.
+    if isinstance(actions, list):
+        actions_text = "\n".join(f"- {a}" for a in actions)
+    elif isinstance(actions, str):
+        actions_text = actions
+    else:
+        actions_text = None
 
-            {{
-            "importance": "HIGH | MEDIUM | LOW | NONE 중 하나",
-            "summary": "변경 내용을 한국어로 요약",
-            "actions": [
-                "첫번째 조치사항",
-                "두번째 조치사항"
-            ]
-            }}
-            """
-    return prompt.strip()
+    return summary, actions_text, importance
 
 
-def call_ollama(prompt: str, max_retries: int = 2) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+def call_llm(prompt: str, max_retries: int = 2) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     last_error = None
     for attempt in range(1, max_retries + 1):
         start = time.perf_counter()
-        resp = requests.post(OLLAMA_URL, json={
-            "model": OLLAMA_MODEL,
-            "prompt": prompt,
-            "stream": False,
-        }, timeout=120)
-        resp.raise_for_status()
-        data = resp.json()
-        raw = (data.get("response") or "").strip()
+        try:
+            raw, stats = _generate(prompt)
+        except StreamAborted as e:
+            # 형식이 틀린 응답은 끝까지 기다리지 않고 바로 재시도
+            last_error = e
+            call_stats.record(time.perf_counter() - start, attempt, ok=False)
+            logger.warning(
+                "[AI] 스트리밍 응답 중단 (attempt=%d, %.2f초, %d자): %s",
+                attempt, time.perf_counter() - start, len(e.partial), e.reason,
+            )
+            continue
         elapsed = time.perf_counter() - start
 
-        logger.info(f"[AI] Ollama 호출 시간: {elapsed:.2f}초 (attempt={attempt})")
-        print(f"[AI] Ollama 호출 시간: {elapsed:.2f}초 (attempt={attempt})")
+        logger.info(
+            "[AI] LLM 호출 시간: %.2f초 (attempt=%d) prompt=%d자/추정 %d토큰, "
+            "실제 prompt=%s토큰 prefill=%.2f초 output=%s토큰",
+            elapsed, attempt, len(prompt), estimate_tokens(prompt),
+            stats.get("prompt_tokens"), stats.get("prefill_sec", 0.0), stats.get("output_tokens"),
+        )
 
         try:
             obj = json.loads(raw)
         except json.JSONDecodeError as e:
             last_error = e
+            call_stats.record(elapsed, attempt, ok=False)
             logger.warning(
                 "AI JSON 파싱 실패 (attempt=%d). raw 일부: %s",
                 attempt, raw[:200],
@@ -217,77 +484,459 @@ def call_ollama(prompt: str, max_retries: int = 2) -> Tuple[Optional[str], Optio
             continue
 
         # 여기서부터는 성공한 경우
-        importance = (obj.get("importance") or "").strip().upper() or None
-        summary = obj.get("summary") or ""
-        actions = obj.get("actions") or []
+        call_stats.record(elapsed, attempt, ok=True)
+        return _normalize_result(obj)
+
+    # 여기까지 오면 전부 실패
+    logger.error("AI 호출/파싱이 모두 실패했습니다: %s", last_error)
+    return None, None, None
+
+
+def _pending_conditions() -> list:
+    """요약/조치가 아직 없고, old_new_info.has_old_new = 'Y' 인 mst의 변경이력"""
+    mst_select = (
+        select(OldNewInfo.mst)
+        .where(OldNewInfo.has_old_new == "Y")
+    )
+    return [
+        LawChangeEvent.mst.in_(mst_select),
+        LawChangeEvent.change_summary.is_(None),
+        LawChangeEvent.action_recommendation.is_(None),
+    ]
+
+
+def _cached_result(
+    db: Session,
+    content_hash: str,
+    prompt_versions: Tuple[str, ...] = (PROMPT_TEMPLATE_VERSION,),
+) -> Optional[AiSummaryCache]:
+    """같은 내용/모델/프롬프트 버전으로 이미 만든 결과가 있으면 hit 기록 후 반환 (prompt_versions 순서대로)"""
+    model_name = get_llm_backend().model_name
+    cached = None
+    for prompt_version in prompt_versions:
+        cached = db.get(AiSummaryCache, (content_hash, model_name, prompt_version))
+        if cached is not None:
+            break
+    if cached is not None:
+        cached.hit_count = AiSummaryCache.hit_count + 1
+        cached.last_hit_at = func.now()
+    return cached
+
+
+def _store_result(
+    db: Session,
+    content_hash: str,
+    summary: Optional[str],
+    actions: Optional[str],
+    importance: Optional[str],
+    prompt_version: str = PROMPT_TEMPLATE_VERSION,
+) -> None:
+    # 다른 워커가 같은 내용을 동시에 처리했을 수 있으므로 먼저 저장된 쪽을 남긴다
+    stmt = pg_insert(AiSummaryCache).values(
+        content_hash=content_hash,
+        model_name=get_llm_backend().model_name,
+        prompt_version=prompt_version,
+        ai_importance=importance,
+        change_summary=summary,
+        action_recommendation=actions,
+    )
+    db.execute(stmt.on_conflict_do_nothing())
+
+
+def _valid_batch_item(obj: Any, count: int) -> bool:
+    if not isinstance(obj, dict):
+        return False
+    if not isinstance(obj.get("id"), int) or not 1 <= obj["id"] <= count:
+        return False
+    importance = obj.get("importance")
+    if not isinstance(importance, str) or importance.strip().upper() not in IMPORTANCE_VALUES:
+        return False
+    if not isinstance(obj.get("summary"), str) or not obj["summary"].strip():
+        return False
+    return isinstance(obj.get("actions"), (list, str))
+
+
+def call_llm_batch(
+    prompt: str,
+    count: int,
+) -> Dict[int, Tuple[str, Optional[str], Optional[str]]]:
+    """
+    묶음 프롬프트 1회 호출 → {항목 번호: (summary, actions, importance)}.
+    형식이 맞는 항목만 돌려주고, 빠지거나 틀린 항목은 호출한 쪽에서 단건으로 다시 처리한다.
+    (배열 응답이라 스트리밍 검사 없이 한 번에 받는다)
+    """
+    start = time.perf_counter()
+    raw, stats = _generate(prompt, streaming=False)
+    elapsed = time.perf_counter() - start
+
+    logger.info(
+        "[AI] LLM 묶음 호출 시간: %.2f초 (%d건) prompt=%d자/추정 %d토큰, "
+        "실제 prompt=%s토큰 prefill=%.2f초 output=%s토큰",
+        elapsed, count, len(prompt), estimate_tokens(prompt),
+        stats.get("prompt_tokens"), stats.get("prefill_sec", 0.0), stats.get("output_tokens"),
+    )
+
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        call_stats.record(elapsed, 1, ok=False)
+        logger.warning("AI 묶음 응답 JSON 파싱 실패. raw 일부: %s", raw[:200])
+        return {}
+    if isinstance(data, dict):
+        # {"results": [...]} 처럼 한 번 감싸서 오는 경우
+        data = next((v for v in data.values() if isinstance(v, list)), [])
+    if not isinstance(data, list):
+        return {}
+
+    results: Dict[int, Tuple[str, Optional[str], Optional[str]]] = {}
+    for obj in data:
+        if _valid_batch_item(obj, count) and obj["id"] not in results:
+            results[obj["id"]] = _normalize_result(obj)
+    call_stats.record(elapsed, 1, ok=bool(results))
+    return results
+
+
+class _Target(NamedTuple):
+    """
+    요약할 변경이력 1건. 프롬프트 입력(meta/content)은 첫 커밋 전에 값으로 만들어 두어
+    건마다 커밋해도 change/law/조문을 다시 읽지 않는다 (change는 결과를 저장할 때만 사용).
+    """
+    change: LawChangeEvent
+    change_id: UUID
+    mst: str
+    change_type: Optional[str]
+    meta: str
+    content: MstContent
+    content_hash: str
+
+
+def _save_result(
+    db: Session,
+    target: _Target,
+    summary: Optional[str],
+    actions: Optional[str],
+    importance: Optional[str],
+    prompt_version: str = PROMPT_TEMPLATE_VERSION,
+) -> None:
+    _store_result(db, target.content_hash, summary, actions, importance, prompt_version)
+
+    change = target.change
+    change.change_summary = summary
+    change.action_recommendation = actions
+    change.ai_importance = importance
+
+    db.add(change)
+    update_feed_ai(db, change)
+    bump_cache_version(db, AI_SUMMARIES)  # 요약 본문 검색 건수 캐시 무효화
+    db.commit()
+
+
+def _summarize_single(db: Session, target: _Target) -> bool:
+    """변경이력 1건을 단독 프롬프트로 요약/조치 생성 후 커밋. 저장했으면 True"""
+    change = target.change
+    try:
+        prompt = build_prompt_for_change(db, change, content=target.content, meta=target.meta)
+        summary, actions, importance = call_llm(prompt)
+
+        # ❗ 파싱 실패한 경우: 이번 change는 건너뛰기
+        if summary is None and actions is None and importance is None:
+            logger.warning(
+                "AI 응답 파싱 실패로 change_id=%s 는 저장하지 않습니다.",
+                target.change_id,
+            )
+            db.rollback()
+            return False
+
+        _save_result(db, target, summary, actions, importance)
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"AI 요약 생성 실패 (change_id={target.change_id}): {e}")
+        return False
+
+
+def _summarize_batch(db: Session, targets: List[_Target]) -> List[_Target]:
+    """묶음 1회 호출 후 결과가 온 항목은 저장. 결과가 없거나 틀린 항목을 돌려준다"""
+    try:
+        prompt = build_batch_prompt([(t.meta, t.content) for t in targets])
+        results = call_llm_batch(prompt, len(targets))
+    except Exception as e:
+        logger.warning("AI 묶음 호출 실패 → %d건 단건 처리: %s", len(targets), e)
+        return targets
+
+    leftovers: List[_Target] = []
+    for idx, target in enumerate(targets, start=1):
+        result = results.get(idx)
+        if result is None:
+            leftovers.append(target)
+            continue
+        try:
+            _save_result(db, target, *result, prompt_version=BATCH_PROMPT_VERSION)
+        except Exception as e:
+            db.rollback()
+            logger.exception(f"AI 요약 저장 실패 (change_id={target.change_id}): {e}")
+            leftovers.append(target)
+
+    if leftovers:
+        logger.info("[AI] 묶음 %d건 중 %d건은 단건으로 다시 처리", len(targets), len(leftovers))
+    return leftovers
+
+
+def _batch_block_tokens(target: _Target) -> Optional[int]:
+    """
+    조문 변경이 작아서 묶어 물어도 되는 변경이력이면 묶음 프롬프트 블록의 추정 토큰 수, 아니면 None
+    (타법개정은 한도를 넉넉히)
+    """
+    if target.change_type in _BATCH_CHANGE_TYPES:
+        limit = settings.ai_batch_other_law_tokens
+    else:
+        limit = settings.ai_batch_small_tokens
+    block = _format_change_block(target.meta, target.content, settings.ai_prompt_token_budget)
+    tokens = estimate_tokens(block)
+    return tokens if tokens <= limit else None
 
-        if importance == "NONE":
-            actions = ["조치할 사항이 없습니다."]
 
-        if isinstance(actions, list):
-            actions_text = "\n".join(f"- {a}" for a in actions)
-        elif isinstance(actions, str):
-            actions_text = actions
+def _pack_batches(items: List[Tuple[_Target, int]]) -> List[List[_Target]]:
+    """
+    묶음 대상을 ai_batch_size건씩 묶되, 묶음 프롬프트 전체(공통 지시문 + 블록들)가
+    ai_prompt_token_budget을 넘기 전에 다음 묶음으로 넘긴다 (블록은 자르지 않는다)
+    """
+    budget = settings.ai_prompt_token_budget
+    fixed = (
+        estimate_tokens(_PROMPT_INTRO)
+        + estimate_tokens(_PROMPT_RULES)
+        + estimate_tokens(_PROMPT_BATCH_OUTPUT)
+    )
+    chunks: List[List[_Target]] = []
+    current: List[_Target] = []
+    used = fixed
+    for target, tokens in items:
+        # "### 항목 N" 머리글 몫
+        cost = tokens + 5
+        if current and (len(current) >= settings.ai_batch_size or used + cost > budget):
+            chunks.append(current)
+            current = []
+            used = fixed
+        current.append(target)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _summarize_changes(db: Session, changes: List[LawChangeEvent]) -> Tuple[int, int]:
+    """
+    변경이력 여러 건 요약/조치 생성 (건마다 커밋). (저장 건수, 실패 건수)
+    - 프롬프트 입력은 첫 커밋 전에 전부 값으로 만들어 둔다 (커밋마다 ORM 객체가 만료되므로)
+    - 같은 MST 내용의 결과가 캐시에 있으면 재사용
+    - 작은 변경(_batch_block_tokens)은 프롬프트 예산 안에서 ai_batch_size건까지 묶어 한 번에 호출하고,
+      묶음 응답에서 빠지거나 형식이 틀린 항목만 단건 호출
+    """
+    saved = 0
+    failed = 0
+    targets: List[_Target] = []
+    singles: List[_Target] = []
+    batchable: List[Tuple[_Target, int]] = []
+
+    for change in changes:
+        change_id = change.change_id
+        try:
+            content = load_mst_content(db, change.mst)
+            targets.append(_Target(
+                change=change,
+                change_id=change_id,
+                mst=change.mst,
+                change_type=change.change_type,
+                meta=_format_change_meta(change),
+                content=content,
+                content_hash=mst_content_hash(content),
+            ))
+        except Exception as e:
+            db.rollback()
+            failed += 1
+            logger.exception(f"AI 요약 생성 실패 (change_id={change_id}): {e}")
+
+    for target in targets:
+        change = target.change
+        try:
+            # 묶음 대상이면 묶음 프롬프트 결과도 재사용 (단건 결과 우선)
+            block_tokens = _batch_block_tokens(target) if settings.ai_batch_size > 1 else None
+            batchable_target = block_tokens is not None
+            cached = _cached_result(
+                db,
+                target.content_hash,
+                (PROMPT_TEMPLATE_VERSION, BATCH_PROMPT_VERSION) if batchable_target else (PROMPT_TEMPLATE_VERSION,),
+            )
+            if cached is not None:
+                logger.info("[AI] 캐시 재사용 (change_id=%s, mst=%s)", target.change_id, target.mst)
+                change.change_summary = cached.change_summary
+                change.action_recommendation = cached.action_recommendation
+                change.ai_importance = cached.ai_importance
+                db.add(change)
+                update_feed_ai(db, change)
+                bump_cache_version(db, AI_SUMMARIES)
+                db.commit()
+                saved += 1
+                continue
+        except Exception as e:
+            db.rollback()
+            failed += 1
+            logger.exception(f"AI 요약 생성 실패 (change_id={target.change_id}): {e}")
+            continue
+
+        if batchable_target:
+            batchable.append((target, block_tokens))
         else:
-            actions_text = None
+            singles.append(target)
 
-        return summary, actions_text, importance
+    for chunk in _pack_batches(batchable):
+        # 한 건만 남은 묶음은 단건 프롬프트로
+        if len(chunk) == 1:
+            singles.extend(chunk)
+            continue
+        leftovers = _summarize_batch(db, chunk)
+        saved += len(chunk) - len(leftovers)
+        singles.extend(leftovers)
 
-    # 여기까지 오면 전부 실패
-    logger.error("AI 호출/파싱이 모두 실패했습니다: %s", last_error)
-    return None, None, None
+    for target in singles:
+        if _summarize_single(db, target):
+            saved += 1
+        else:
+            failed += 1
+
+    return saved, failed
 
 
 def generate_ai_for_pending_changes(db: Session, limit: int = 10) -> int:
     """
     아직 요약/조치가 없는 변경이력들 중,
     old_new_info.has_old_new = 'Y' 인 mst만 대상으로,
-    collected_date 최신순으로 limit 만큼 처리.
+    collected_date 최신순으로 limit 만큼 처리 (작은 변경은 묶어서, 나머지는 한 건씩).
     """
-    # has_old_new = 'Y'인 mst만 추출
-    mst_select = (
-        select(OldNewInfo.mst)
-        .where(OldNewInfo.has_old_new == "Y")
-    )
-
-    # collected_date DESC 기준으로 최신 10개만
     queryset = (
         db.query(LawChangeEvent)
-        .filter(
-            LawChangeEvent.mst.in_(mst_select),
-            LawChangeEvent.change_summary.is_(None),
-            LawChangeEvent.action_recommendation.is_(None),
-        )
+        .filter(*_pending_conditions())
         .order_by(LawChangeEvent.collected_date.desc(), LawChangeEvent.created_at.desc())
         .limit(limit)
         .all()
     )
 
-    count = 0
-    for change in queryset:
-        try:
-            prompt = build_prompt_for_change(db, change)
-            summary, actions, importance = call_ollama(prompt)
-            
-            # ❗ 파싱 실패한 경우: 이번 change는 건너뛰기
-            if summary is None and actions is None and importance is None:
-                logger.warning(
-                    "AI 응답 파싱 실패로 change_id=%s 는 저장하지 않습니다.",
-                    change.change_id,
-                )
-                # rollback은 안 해도 되지만 혹시 몰라 해도 OK
-                db.rollback()
-                continue
-            
-            change.change_summary = summary
-            change.action_recommendation = actions
-            change.ai_importance = importance
-            
-            db.add(change)
-            db.commit()
-            count += 1
-        except Exception as e:
-            db.rollback()
-            logger.exception(f"AI 요약 생성 실패 (change_id={change.change_id}): {e}")
-
+    count, _ = _summarize_changes(db, queryset)
     return count
+
+
+def claim_pending_changes(db: Session, batch_size: int = 1) -> List[UUID]:
+    """
+    처리할 변경이력을 batch_size건 가져가고 ai_claimed_at을 찍은 뒤 바로 커밋.
+
+    - FOR UPDATE SKIP LOCKED: 다른 워커/프로세스가 동시에 고르고 있는 행은 건너뜀
+    - ai_claimed_at 임대: LLM 호출 동안 트랜잭션을 잡고 있지 않아도 중복 처리되지 않음.
+      워커가 죽어서 ai_claim_timeout_sec이 지나면 다시 대상이 된다
+    """
+    stale_before = func.now() - timedelta(seconds=settings.ai_claim_timeout_sec)
+    candidates = (
+        select(LawChangeEvent.change_id)
+        .where(
+            *_pending_conditions(),
+            or_(
+                LawChangeEvent.ai_claimed_at.is_(None),
+                LawChangeEvent.ai_claimed_at < stale_before,
+            ),
+        )
+        .order_by(LawChangeEvent.collected_date.desc(), LawChangeEvent.created_at.desc())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True, of=LawChangeEvent)
+    )
+    change_ids = list(
+        db.scalars(
+            update(LawChangeEvent)
+            .where(LawChangeEvent.change_id.in_(candidates.scalar_subquery()))
+            .values(ai_claimed_at=func.now())
+            .returning(LawChangeEvent.change_id)
+            .execution_options(synchronize_session=False)
+        )
+    )
+    db.commit()
+    return change_ids
+
+
+def run_ai_workers(
+    workers: int | None = None,
+    limit: int | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Dict[str, Any]:
+    """
+    워커 풀 모드: workers개의 스레드가 각자 대상을 가져가서(claim_pending_changes) LLM을 동시에 호출.
+    - limit이 없으면 대상이 바닥날 때까지 처리
+    - 여러 프로세스에서 동시에 실행해도 같은 변경이력을 두 번 처리하지 않는다
+    - 실패한 건은 임대가 끝날 때(ai_claim_timeout_sec)까지 다시 가져가지 않는다
+    - ai_batch_size > 1이면 워커마다 그만큼씩 가져가서 작은 변경은 묶어 호출
+    """
+    if workers is None:
+        workers = settings.ai_workers
+    workers = max(1, workers)
+
+    lock = threading.Lock()
+    claimed = 0
+    processed = 0
+    failed = 0
+
+    claim_size = max(1, settings.ai_batch_size)
+
+    def _reserve() -> int:
+        nonlocal claimed
+        with lock:
+            n = claim_size if limit is None else min(claim_size, limit - claimed)
+            n = max(0, n)
+            claimed += n
+            return n
+
+    def _worker() -> None:
+        nonlocal claimed, processed, failed
+        db = session_factory()
+        try:
+            while True:
+                reserved = _reserve()
+                if reserved == 0:
+                    return
+                change_ids = claim_pending_changes(db, batch_size=reserved)
+                with lock:
+                    claimed -= reserved - len(change_ids)
+                if not change_ids:
+                    return
+
+                changes = [
+                    change
+                    for change in (db.get(LawChangeEvent, change_id) for change_id in change_ids)
+                    if change is not None
+                ]
+                saved, errors = _summarize_changes(db, changes)
+                with lock:
+                    processed += saved
+                    failed += errors + (len(change_ids) - len(changes))
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=_worker, name=f"ai-worker-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    per_min = processed / elapsed * 60 if elapsed > 0 else 0.0
+    logger.info(
+        "[AI] 워커 %d개: %d건 저장, %d건 실패, %.1f초 (%.2f건/분)",
+        workers, processed, failed, elapsed, per_min,
+    )
+    return {
+        "workers": workers,
+        "processed": processed,
+        "failed": failed,
+        "elapsed_sec": round(elapsed, 2),
+        "changes_per_min": round(per_min, 2),
+    }
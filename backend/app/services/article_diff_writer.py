@@ -0,0 +1,200 @@
+# app/services/article_diff_writer.py
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import io
+import json
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.article_diff import ArticleDiff, compute_article_sort_key
+from app.models.article_text import ArticleText, article_text_hash
+from app.services.text_diff import article_word_diff
+
+# (old_no, old_content, new_no, new_content)
+ArticlePair = Tuple[Optional[str], str, Optional[str], str]
+
+ARTICLE_DIFF_COPY_COLUMNS = (
+    "mst",
+    "old_no",
+    "old_hash",
+    "new_no",
+    "new_hash",
+    "sort_key",
+    "ordinal",
+    "is_changed",
+    "change_score",
+    "diff_ops",
+)
+
+_EXECUTEMANY_CHUNK = 500
+_CHUNK = 1000  # 본문 저장 → 조문 비교 행 적재를 이 건수씩 번갈아 (메모리는 한 청크 분량)
+
+
+def iter_article_pairs(
+    old_list: List[Dict[str, Any]],
+    new_list: List[Dict[str, Any]],
+) -> Iterator[ArticlePair]:
+    """구조문/신조문 목록을 같은 순번끼리 짝지어 하나씩 돌려준다 (한쪽이 짧으면 빈 조문)."""
+    max_len = max(len(old_list), len(new_list))
+
+    for i in range(max_len):
+        old_item = old_list[i] if i < len(old_list) else {}
+        new_item = new_list[i] if i < len(new_list) else {}
+
+        yield (
+            old_item.get("no"),
+            old_item.get("content") or "",
+            new_item.get("no"),
+            new_item.get("content") or "",
+        )
+
+
+def _copy_field(value: Any) -> str:
+    """COPY text 포맷 한 칸 (NULL은 \\N, 구분자/개행/역슬래시는 escape)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class _CopyStream(io.RawIOBase):
+    """
+    행 iterator를 COPY FROM STDIN 입력 스트림으로 바꿔 준다.
+    psycopg2가 read(size)로 당겨 갈 때만 다음 행을 만들어서 전체 행을 메모리에 올리지 않는다.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[Any, ...]]):
+        self._rows = iter(rows)
+        self._buf = b""
+        self.rows_written = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buf) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buf += ("\t".join(_copy_field(v) for v in row) + "\n").encode("utf-8")
+            self.rows_written += 1
+
+        if size < 0:
+            chunk, self._buf = self._buf, b""
+        else:
+            chunk, self._buf = self._buf[:size], self._buf[size:]
+        return chunk
+
+
+def store_article_texts(db: Session, contents: Iterable[Optional[str]]) -> None:
+    """
+    조문 본문들을 article_text에 저장 (이미 있는 해시는 건너뜀).
+    연속된 MST는 대부분의 조문이 그대로라서, 먼저 있는 해시를 조회하고 없는 본문만 보낸다.
+    """
+    texts: Dict[str, str] = {}
+    for content in contents:
+        content_hash = article_text_hash(content)
+        if content_hash is not None:
+            texts[content_hash] = content
+
+    if not texts:
+        return
+
+    existing = set(
+        db.scalars(select(ArticleText.content_hash).where(ArticleText.content_hash.in_(list(texts))))
+    )
+    missing = [{"content_hash": h, "content": c} for h, c in texts.items() if h not in existing]
+    if missing:
+        # 동시에 같은 본문을 적재하는 워커가 있어도 한 번만
+        db.execute(pg_insert(ArticleText).on_conflict_do_nothing(index_elements=["content_hash"]), missing)
+
+
+def _rows_for(db: Session, mst: str, pairs: Iterable[ArticlePair]) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    조문 비교 행을 _CHUNK건씩 (각 청크의 본문은 article_text에 저장한 뒤 돌려준다).
+    정렬 키는 앞 행의 키를 이어받으므로 청크를 넘어 순서대로 계산한다.
+    """
+    pairs = iter(pairs)
+    ordinal = 0
+    prev_key: Optional[int] = None
+    while True:
+        chunk = list(islice(pairs, _CHUNK))
+        if not chunk:
+            return
+        store_article_texts(db, (c for _, old, _, new in chunk for c in (old, new)))
+
+        rows = []
+        for old_no, old_content, new_no, new_content in chunk:
+            prev_key = compute_article_sort_key(old_no, old_content, new_no, new_content, prev_key)
+            rows.append(
+                (
+                    mst,
+                    old_no,
+                    article_text_hash(old_content),
+                    new_no,
+                    article_text_hash(new_content),
+                    prev_key,
+                    ordinal,
+                    *article_word_diff(old_content, new_content),
+                )
+            )
+            ordinal += 1
+        yield rows
+
+
+def _write_with_copy(db: Session, rows: Iterable[Tuple[Any, ...]]) -> int:
+    stream = _CopyStream(rows)
+    dbapi_conn = db.connection().connection
+    cursor = dbapi_conn.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {ArticleDiff.__tablename__} ({', '.join(ARTICLE_DIFF_COPY_COLUMNS)}) FROM STDIN",
+            stream,
+        )
+    finally:
+        cursor.close()
+    return stream.rows_written
+
+
+def _write_with_executemany(db: Session, rows: Iterable[Tuple[Any, ...]]) -> int:
+    rows = iter(rows)
+    written = 0
+    while True:
+        chunk = [dict(zip(ARTICLE_DIFF_COPY_COLUMNS, row)) for row in islice(rows, _EXECUTEMANY_CHUNK)]
+        if not chunk:
+            return written
+        db.execute(insert(ArticleDiff.__table__), chunk)
+        written += len(chunk)
+
+
+def write_article_diffs(
+    db: Session,
+    mst: str,
+    pairs: Iterable[ArticlePair],
+    use_copy: bool | None = None,
+) -> int:
+    """
+    mst 하나의 조문 비교 행들을 ORM 객체 없이 article_diff에 바로 적재하고 적재 건수를 돌려준다.
+
+    - 본문은 article_text에 내용 주소(해시)로 한 번만 저장하고, 행에는 해시만
+    - 단어 diff(is_changed / change_score / diff_ops)도 여기서 한 번 계산해 같이 저장
+    - psycopg2면 COPY FROM STDIN으로 스트리밍 (기본)
+    - 그 외 드라이버거나 use_copy=False면 청크 단위 executemany INSERT
+    - 세션의 현재 트랜잭션 안에서 실행되므로 커밋/롤백은 호출하는 쪽 책임
+    """
+    db.flush()  # 세션에 쌓인 old_new_info 등을 먼저 내보냄
+
+    if use_copy is None:
+        use_copy = db.get_bind().dialect.driver == "psycopg2"
+
+    write = _write_with_copy if use_copy else _write_with_executemany
+    return sum(write(db, rows) for rows in _rows_for(db, mst, pairs))
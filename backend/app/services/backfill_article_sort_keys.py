@@ -0,0 +1,63 @@
+import argparse
+import time
+
+from sqlalchemy import select, update
+
+from app.db.session import SessionLocal
+from app.models.article_diff import ArticleDiff, compute_article_sort_key
+from app.services.cache_versions import ARTICLE_DIFFS, bump_cache_version
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="기존 article_diff 행의 sort_key를 현재 규칙(앞 행 상속, 부칙 구역)으로 다시 계산 (mst 단위, ordinal 순)"
+    )
+    parser.add_argument("--batch-msts", type=int, default=50, help="한 트랜잭션에서 처리할 mst 수")
+    parser.add_argument("--limit", type=int, default=None, help="처리할 최대 mst 수 (없으면 전부)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    done = 0
+    updated = 0
+    last_mst = None
+    start = time.perf_counter()
+    try:
+        while args.limit is None or done < args.limit:
+            size = args.batch_msts if args.limit is None else min(args.batch_msts, args.limit - done)
+            q = select(ArticleDiff.mst).distinct().order_by(ArticleDiff.mst).limit(size)
+            if last_mst is not None:
+                q = q.where(ArticleDiff.mst > last_mst)
+            msts = list(db.scalars(q))
+            if not msts:
+                break
+            last_mst = msts[-1]
+
+            values = []
+            for mst in msts:
+                rows = db.scalars(
+                    select(ArticleDiff).where(ArticleDiff.mst == mst).order_by(ArticleDiff.ordinal)
+                ).unique().all()
+                key = None
+                for row in rows:
+                    key = compute_article_sort_key(row.old_no, row.old_content, row.new_no, row.new_content, key)
+                    if key != row.sort_key:
+                        values.append({"diff_id": row.diff_id, "sort_key": key})
+
+            if values:
+                db.execute(update(ArticleDiff), values)
+                # 조문 순서가 바뀌므로 상세 응답 ETag/캐시 무효화
+                bump_cache_version(db, ARTICLE_DIFFS)
+            db.commit()
+            db.expunge_all()
+
+            done += len(msts)
+            updated += len(values)
+            print(f"mst {done}건 처리, 행 {updated}건 갱신 ({time.perf_counter() - start:.1f}초)")
+    finally:
+        db.close()
+
+    print(f"정렬 키 다시 계산 완료 → mst {done}건, 행 {updated}건 갱신")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import time
+
+from sqlalchemy import select, update
+
+from app.db.session import SessionLocal
+from app.models.article_diff import ArticleDiff
+from app.services.cache_versions import ARTICLE_DIFFS, bump_cache_version
+from app.services.text_diff import article_word_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기존 article_diff 행의 단어 diff(is_changed/change_score/diff_ops) 채우기")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 트랜잭션에서 처리할 행 수")
+    parser.add_argument("--limit", type=int, default=None, help="처리할 최대 행 수 (없으면 전부)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    done = 0
+    last_id = None
+    start = time.perf_counter()
+    try:
+        while args.limit is None or done < args.limit:
+            size = args.batch_size if args.limit is None else min(args.batch_size, args.limit - done)
+            q = select(ArticleDiff).where(ArticleDiff.is_changed.is_(None))
+            if last_id is not None:
+                q = q.where(ArticleDiff.diff_id > last_id)  # diff_id 순으로 이어서 (앞에서부터 다시 훑지 않게)
+            rows = db.scalars(q.order_by(ArticleDiff.diff_id).limit(size)).unique().all()
+            if not rows:
+                break
+            last_id = rows[-1].diff_id
+
+            values = []
+            for row in rows:
+                diff = article_word_diff(row.old_content, row.new_content)
+                values.append({"diff_id": row.diff_id, **diff._asdict()})
+            db.execute(update(ArticleDiff), values)
+            # 조문별 is_changed/diff_ops, changed_article_count가 바뀌므로 상세 응답 ETag/캐시 무효화
+            bump_cache_version(db, ARTICLE_DIFFS)
+            db.commit()
+            db.expunge_all()
+
+            done += len(rows)
+            print(f"{done}건 처리 ({time.perf_counter() - start:.1f}초)")
+    finally:
+        db.close()
+
+    print(f"단어 diff 채우기 완료 → {done}건")
+
+
+if __name__ == "__main__":
+    main()
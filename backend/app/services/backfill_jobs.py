@@ -0,0 +1,355 @@
+# app/services/backfill_jobs.py
+from datetime import date, timedelta
+from typing import Any, Dict, List, Set
+from uuid import UUID
+import logging
+import threading
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal, engine
+from app.models.backfill_job import BackfillJob, BackfillJobDate
+from app.services.nlic_backfill import BackfillCheckpoint, backfill_changes
+
+logger = logging.getLogger(__name__)
+
+# 이 프로세스에서 실행 중인 작업 → 중단 요청 이벤트
+_running: Dict[UUID, threading.Event] = {}
+# 스레드가 끝나기 전에 재개 요청이 들어온 작업 (스레드가 끝나면 한 번 더 실행)
+_restart_requested: Set[UUID] = set()
+_running_lock = threading.Lock()
+
+
+class BackfillJobError(Exception):
+    pass
+
+
+class _JobCheckpoint(BackfillCheckpoint):
+    """backfill_job / backfill_job_date 에 진행 상황을 기록하는 체크포인트"""
+
+    def __init__(self, job_id: UUID, stop_event: threading.Event):
+        self.job_id = job_id
+        self.stop_event = stop_event
+
+    def start_page(self, target_date: date) -> int:
+        db = SessionLocal()
+        try:
+            pages_done = db.scalar(
+                select(BackfillJobDate.pages_done).where(
+                    BackfillJobDate.job_id == self.job_id,
+                    BackfillJobDate.target_date == target_date,
+                )
+            )
+        finally:
+            db.close()
+        return (pages_done or 0) + 1
+
+    def on_page(self, db: Session, target_date: date, page: int, counts: Dict[str, Any]) -> None:
+        stmt = pg_insert(BackfillJobDate).values(
+            job_id=self.job_id,
+            target_date=target_date,
+            status="RUNNING",
+            pages_done=page,
+            history_records=counts["history_records"],
+            new_events=counts["new_events"],
+            laws_touched=counts["laws_touched"],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BackfillJobDate.job_id, BackfillJobDate.target_date],
+            set_={
+                "pages_done": page,
+                "history_records": BackfillJobDate.history_records + counts["history_records"],
+                "new_events": BackfillJobDate.new_events + counts["new_events"],
+                "laws_touched": BackfillJobDate.laws_touched + counts["laws_touched"],
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+        status = db.scalar(
+            update(BackfillJob)
+            .where(BackfillJob.job_id == self.job_id)
+            .values(
+                last_page_date=target_date,
+                last_page_no=page,
+                total_history_records_seen=BackfillJob.total_history_records_seen + counts["history_records"],
+                total_new_events_inserted=BackfillJob.total_new_events_inserted + counts["new_events"],
+                total_laws_touched=BackfillJob.total_laws_touched + counts["laws_touched"],
+            )
+            .returning(BackfillJob.status)
+        )
+        # 다른 프로세스(관리 API)에서 들어온 일시정지 요청
+        if status == "PAUSE_REQUESTED":
+            self.stop_event.set()
+
+    def on_date_done(self, db: Session, target_date: date) -> None:
+        stmt = pg_insert(BackfillJobDate).values(
+            job_id=self.job_id,
+            target_date=target_date,
+            status="DONE",
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BackfillJobDate.job_id, BackfillJobDate.target_date],
+            set_={"status": "DONE", "updated_at": func.now()},
+        )
+        db.execute(stmt)
+        db.execute(
+            update(BackfillJob)
+            .where(BackfillJob.job_id == self.job_id)
+            .values(last_completed_date=target_date)
+        )
+
+    def should_stop(self) -> bool:
+        return self.stop_event.is_set()
+
+
+def job_to_dict(job: BackfillJob) -> Dict[str, Any]:
+    total_days = (job.end_date - job.start_date).days + 1
+    done_days = (job.last_completed_date - job.start_date).days + 1 if job.last_completed_date else 0
+    return {
+        "job_id": str(job.job_id),
+        "status": job.status,
+        "start_date": job.start_date.isoformat(),
+        "end_date": job.end_date.isoformat(),
+        "workers": job.workers,
+        "last_completed_date": job.last_completed_date.isoformat() if job.last_completed_date else None,
+        "last_page_date": job.last_page_date.isoformat() if job.last_page_date else None,
+        "last_page_no": job.last_page_no,
+        "days_done": done_days,
+        "days_total": total_days,
+        "progress": round(done_days / total_days, 4) if total_days > 0 else 1.0,
+        "total_history_records_seen": job.total_history_records_seen,
+        "total_new_events_inserted": job.total_new_events_inserted,
+        "total_laws_touched": job.total_laws_touched,
+        "old_new_failed": job.old_new_failed,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def job_dates(db: Session, job_id: UUID, limit: int = 31) -> List[Dict[str, Any]]:
+    """최근에 진행된 날짜별 상태 (최신 날짜부터)"""
+    rows = db.scalars(
+        select(BackfillJobDate)
+        .where(BackfillJobDate.job_id == job_id)
+        .order_by(BackfillJobDate.target_date.desc())
+        .limit(limit)
+    )
+    return [
+        {
+            "target_date": r.target_date.isoformat(),
+            "status": r.status,
+            "pages_done": r.pages_done,
+            "history_records": r.history_records,
+            "new_events": r.new_events,
+            "laws_touched": r.laws_touched,
+        }
+        for r in rows
+    ]
+
+
+def create_job(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    workers: int | None = None,
+) -> BackfillJob:
+    if end_date < start_date:
+        raise BackfillJobError(f"end_date({end_date})가 start_date({start_date})보다 앞섭니다.")
+
+    job = BackfillJob(start_date=start_date, end_date=end_date, workers=workers)
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _run_job(job_id: UUID, stop_event: threading.Event) -> None:
+    """
+    작업 스레드 본문.
+    같은 작업이 여러 프로세스에서 동시에 돌지 않도록 작업별 advisory lock을 잡고 있는 동안만 실행.
+    """
+    lock_key = {"key": f"backfill_job:{job_id}"}
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        locked = lock_conn.scalar(text("SELECT pg_try_advisory_lock(hashtext(:key))"), lock_key)
+        if not locked:
+            logger.info("[BACKFILL JOB] %s 는 다른 프로세스에서 실행 중", job_id)
+            return
+        try:
+            # 일시정지로 멈추는 사이에 재개 요청(PENDING)이 들어왔으면 lock을 쥔 채로 이어서 실행
+            while _run_locked_job(job_id, stop_event):
+                stop_event.clear()
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), lock_key)
+
+
+def _run_locked_job(job_id: UUID, stop_event: threading.Event) -> bool:
+    """한 번 실행. 멈춘 뒤 보니 그 사이 재개 요청이 와 있었으면 True"""
+    db = SessionLocal()
+    try:
+        job = db.get(BackfillJob, job_id)
+        if job is None or job.status in ("COMPLETED", "PAUSED"):
+            return False
+        if job.status == "PAUSE_REQUESTED":
+            db.execute(
+                update(BackfillJob)
+                .where(BackfillJob.job_id == job_id, BackfillJob.status == "PAUSE_REQUESTED")
+                .values(status="PAUSED")
+            )
+            db.commit()
+            return False
+
+        job.status = "RUNNING"
+        job.error = None
+        db.commit()
+
+        # 체크포인트 다음 날짜부터 (진행 중이던 날짜는 커밋된 다음 페이지부터)
+        resume_date = (
+            job.last_completed_date + timedelta(days=1)
+            if job.last_completed_date
+            else job.start_date
+        )
+        end_date = job.end_date
+        workers = job.workers
+    finally:
+        db.close()
+
+    logger.info("[BACKFILL JOB] %s 시작/재개: %s ~ %s", job_id, resume_date, end_date)
+
+    status = "COMPLETED"
+    error = None
+    old_new_failed = 0
+    try:
+        if resume_date <= end_date:
+            summary = backfill_changes(
+                start_date=resume_date,
+                end_date=end_date,
+                workers=workers,
+                checkpoint=_JobCheckpoint(job_id, stop_event),
+            )
+            old_new_failed = len(summary["old_new_failed_msts"])
+            if summary["stopped"]:
+                status = "PAUSED"
+    except Exception as e:
+        logger.exception("[BACKFILL JOB] %s 실패", job_id)
+        status = "FAILED"
+        error = str(e)
+
+    db = SessionLocal()
+    try:
+        stmt = update(BackfillJob).where(BackfillJob.job_id == job_id)
+        if status == "PAUSED":
+            # 멈추는 동안 resume_job이 PENDING으로 바꿔 놨으면 PAUSED로 덮어쓰지 않는다
+            stmt = stmt.where(BackfillJob.status.in_(("RUNNING", "PAUSE_REQUESTED")))
+        result = db.execute(
+            stmt.values(
+                status=status,
+                error=error,
+                old_new_failed=BackfillJob.old_new_failed + old_new_failed,
+                finished_at=func.now() if status == "COMPLETED" else None,
+            )
+        )
+        if result.rowcount == 0:
+            db.execute(
+                update(BackfillJob)
+                .where(BackfillJob.job_id == job_id)
+                .values(old_new_failed=BackfillJob.old_new_failed + old_new_failed)
+            )
+        db.commit()
+    finally:
+        db.close()
+    return status == "PAUSED" and result.rowcount == 0
+
+
+def start_job(job_id: UUID) -> bool:
+    """작업을 백그라운드 스레드로 실행. 이 프로세스에서 이미 실행 중이면 False"""
+    with _running_lock:
+        if job_id in _running:
+            return False
+        stop_event = threading.Event()
+        _running[job_id] = stop_event
+
+    def _target() -> None:
+        while True:
+            try:
+                _run_job(job_id, stop_event)
+            except Exception:
+                logger.exception("[BACKFILL JOB] %s 스레드 오류", job_id)
+            # 재개 요청 확인과 _running 해제를 같은 lock 안에서 (resume_job과 경합 방지)
+            with _running_lock:
+                if job_id not in _restart_requested:
+                    _running.pop(job_id, None)
+                    return
+                _restart_requested.discard(job_id)
+                stop_event.clear()
+
+    threading.Thread(target=_target, name=f"backfill-job-{job_id}", daemon=True).start()
+    return True
+
+
+def pause_job(db: Session, job_id: UUID) -> BackfillJob:
+    """일시정지 요청 – 지금 적재 중인 페이지까지 커밋한 뒤 멈춘다 (다른 프로세스에서 실행 중이어도 동작)"""
+    job = db.get(BackfillJob, job_id)
+    if job is None:
+        raise BackfillJobError("job not found")
+
+    if job.status in ("PENDING", "RUNNING"):
+        job.status = "PAUSE_REQUESTED"
+        db.commit()
+
+    with _running_lock:
+        stop_event = _running.get(job_id)
+    if stop_event is not None:
+        stop_event.set()
+
+    db.refresh(job)
+    return job
+
+
+def resume_job(db: Session, job_id: UUID) -> BackfillJob:
+    """일시정지/실패한 작업을 체크포인트부터 다시 실행"""
+    job = db.get(BackfillJob, job_id)
+    if job is None:
+        raise BackfillJobError("job not found")
+    if job.status == "COMPLETED":
+        raise BackfillJobError("이미 완료된 작업입니다.")
+
+    if job.status in ("PAUSED", "FAILED", "PAUSE_REQUESTED"):
+        job.status = "PENDING"
+        db.commit()
+
+    # 일시정지 중인 스레드가 아직 끝나지 않았으면 끝난 뒤 다시 실행하도록 예약
+    with _running_lock:
+        still_running = job_id in _running
+        if still_running:
+            _restart_requested.add(job_id)
+    if not still_running:
+        start_job(job_id)
+    db.refresh(job)
+    return job
+
+
+def resume_interrupted_jobs() -> int:
+    """
+    앱 시작 시 호출: 크래시/재배포로 끊긴 작업(PENDING/RUNNING)을 체크포인트부터 이어서 실행.
+    여러 프로세스가 동시에 호출해도 작업별 advisory lock 때문에 한 곳에서만 실행된다.
+    """
+    db = SessionLocal()
+    try:
+        job_ids = list(
+            db.scalars(
+                select(BackfillJob.job_id).where(
+                    BackfillJob.status.in_(("PENDING", "RUNNING", "PAUSE_REQUESTED"))
+                )
+            )
+        )
+    finally:
+        db.close()
+
+    for job_id in job_ids:
+        start_job(job_id)
+    return len(job_ids)
@@ -0,0 +1,182 @@
+# app/services/bench_ai_summarizer.py
+"""
+AI 요약 처리량 벤치마크 (합성 변경이력을 넣고 generate_ai_for_pending_changes / run_ai_workers 실행)
+
+    python -m app.services.bench_ai_summarizer --changes 200 --latency 0.5 --failure-rate 0.05
+    python -m app.services.bench_ai_summarizer --backend ollama --changes 20 --mode workers --workers 4
+
+- 백엔드: stub(기본, GPU 불필요) | ollama | openai (설정값 사용)
+- 합성 변경이력은 collected_date가 먼 미래라서 실제 대기 건보다 먼저 처리되고, limit=--changes로만 돈다
+- 끝나면 합성 데이터와 그 요약 캐시를 지운다
+- 출력: 처리 건수, 건/분, LLM 호출 지연 p50/p95, 재시도율
+"""
+import argparse
+import time
+import uuid
+from datetime import date
+from typing import List
+
+from sqlalchemy import delete, func, select
+
+from app.db.session import SessionLocal
+from app.models.ai_summary_cache import AiSummaryCache
+from app.models.article_diff import ArticleDiff
+from app.models.article_text import ArticleText
+from app.models.law import Law
+from app.models.law_change_event import LawChangeEvent, compute_event_key
+from app.models.old_new_info import OldNewInfo
+from app.services.ai_summarizer import (
+    call_stats,
+    generate_ai_for_pending_changes,
+    load_mst_content,
+    mst_content_hash,
+    run_ai_workers,
+)
+from app.services.article_diff_writer import write_article_diffs
+from app.services.llm_backends import StubBackend, get_llm_backend, set_llm_backend
+
+_BENCH_DATE = date(2999, 12, 31)
+_SAMPLE = "사업주는 근로자가 작업장에서 안전하게 작업할 수 있도록 필요한 조치를 하여야 한다."
+
+
+def _seed(run_id: str, changes: int, articles: int, follow_on_ratio: float) -> List[str]:
+    """합성 법령 1개 + 변경이력 changes건 (MST마다 내용이 달라서 캐시에 안 걸림)"""
+    law_id = f"BENCH-AI-{run_id}"
+    msts: List[str] = []
+    db = SessionLocal()
+    try:
+        db.add(Law(law_id=law_id, law_name=f"벤치마크 법령 {run_id}", law_type_name="법률"))
+        db.flush()
+
+        follow_on_every = round(1 / follow_on_ratio) if follow_on_ratio > 0 else 0
+        for i in range(changes):
+            mst = f"{law_id}-{i}"
+            msts.append(mst)
+            change_type = "타법개정" if follow_on_every and i % follow_on_every == 0 else "일부개정"
+
+            db.add(
+                OldNewInfo(
+                    mst=mst,
+                    has_old_new="Y",
+                    old_basic={"법령명": f"벤치마크 법령 {run_id}", "공포번호": str(i)},
+                    new_basic={"법령명": f"벤치마크 법령 {run_id}", "공포번호": str(i + 1)},
+                )
+            )
+            # 타법개정은 조문 1개 용어 변경, 나머지는 articles개 조문 개정
+            n_articles = 1 if change_type == "타법개정" else articles
+            write_article_diffs(
+                db,
+                mst,
+                (
+                    (
+                        f"제{j}조",
+                        f"<p>제{j}조 {_SAMPLE} ({mst})</p>",
+                        f"제{j}조",
+                        f"<p>제{j}조 {_SAMPLE} 개정 {i}-{j} ({mst})</p>",
+                    )
+                    for j in range(1, n_articles + 1)
+                ),
+            )
+
+            key_fields = dict(
+                law_id=law_id,
+                mst=mst,
+                change_type=change_type,
+                proclamation_no=str(i),
+                proclamation_date=_BENCH_DATE,
+                enforce_date=_BENCH_DATE,
+                current_hist_cd=None,
+            )
+            db.add(
+                LawChangeEvent(
+                    **key_fields,
+                    event_key=compute_event_key(**key_fields),
+                    collected_date=_BENCH_DATE,
+                )
+            )
+        db.commit()
+    finally:
+        db.close()
+    return msts
+
+
+def _cleanup(run_id: str, msts: List[str]) -> None:
+    db = SessionLocal()
+    try:
+        hashes = [mst_content_hash(load_mst_content(db, mst)) for mst in msts]
+        db.execute(delete(AiSummaryCache).where(AiSummaryCache.content_hash.in_(hashes)))
+        db.execute(delete(LawChangeEvent).where(LawChangeEvent.mst.in_(msts)))
+        # 합성 조문 본문은 mst가 들어 있어서 다른 행과 공유되지 않음
+        text_hashes = set()
+        for old_hash, new_hash in db.execute(
+            select(ArticleDiff.old_hash, ArticleDiff.new_hash).where(ArticleDiff.mst.in_(msts))
+        ):
+            text_hashes.update((old_hash, new_hash))
+        db.execute(delete(ArticleDiff).where(ArticleDiff.mst.in_(msts)))
+        db.execute(delete(ArticleText).where(ArticleText.content_hash.in_(text_hashes - {None})))
+        db.execute(delete(OldNewInfo).where(OldNewInfo.mst.in_(msts)))
+        db.execute(delete(Law).where(Law.law_id == f"BENCH-AI-{run_id}"))
+        db.commit()
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["stub", "settings"], default="stub",
+                        help="stub: 프로세스 내 가짜 백엔드, settings: 설정(llm_backend)의 실제 백엔드")
+    parser.add_argument("--changes", type=int, default=100, help="합성 변경이력 수")
+    parser.add_argument("--articles", type=int, default=5, help="변경이력 1건의 개정 조문 수")
+    parser.add_argument("--follow-on-ratio", type=float, default=0.5, help="타법개정(묶음 대상) 비율")
+    parser.add_argument("--mode", choices=["serial", "workers"], default="serial",
+                        help="serial: generate_ai_for_pending_changes, workers: run_ai_workers")
+    parser.add_argument("--workers", type=int, default=None, help="workers 모드의 워커 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="stub 응답 지연(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="stub 형식 오류 확률")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.backend == "stub":
+        set_llm_backend(StubBackend(latency_sec=args.latency, failure_rate=args.failure_rate, seed=args.seed))
+    backend = get_llm_backend()
+
+    run_id = uuid.uuid4().hex[:8]
+    msts = _seed(run_id, args.changes, args.articles, args.follow_on_ratio)
+    print(f"합성 변경이력 {len(msts)}건 (run={run_id}, backend={backend.name}/{backend.model_name}, mode={args.mode})")
+
+    call_stats.reset()
+    try:
+        start = time.perf_counter()
+        if args.mode == "serial":
+            db = SessionLocal()
+            try:
+                generate_ai_for_pending_changes(db, limit=args.changes)
+            finally:
+                db.close()
+        else:
+            run_ai_workers(workers=args.workers, limit=args.changes)
+        elapsed = time.perf_counter() - start
+
+        db = SessionLocal()
+        try:
+            done = db.scalar(
+                select(func.count())
+                .select_from(LawChangeEvent)
+                .where(LawChangeEvent.mst.in_(msts), LawChangeEvent.change_summary.is_not(None))
+            )
+        finally:
+            db.close()
+    finally:
+        _cleanup(run_id, msts)
+
+    stats = call_stats.snapshot()
+    print(f"처리: {done}/{len(msts)}건, {elapsed:.2f}초, {done / elapsed * 60 if elapsed else 0:.1f}건/분")
+    print(
+        f"LLM 호출: {stats['calls']}회 (재시도 {stats['retries']}회, 재시도율 {stats['retry_rate']:.1%}, "
+        f"형식 오류 {stats['failures']}회)"
+    )
+    print(f"호출 지연: p50={stats['latency_p50_sec']}초  p95={stats['latency_p95_sec']}초")
+
+
+if __name__ == "__main__":
+    main()
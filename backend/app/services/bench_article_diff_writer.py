@@ -0,0 +1,104 @@
+# app/services/bench_article_diff_writer.py
+"""
+article_diff 적재 경로 벤치마크 (큰 합성 MST 1건)
+
+    python -m app.services.bench_article_diff_writer --articles 2000 --chars 1500
+
+- orm:         기존 방식 (ArticleDiff ORM 객체 + unit-of-work flush, 본문 저장은 같은 store_article_texts)
+- executemany: write_article_diffs(use_copy=False)
+- copy:        write_article_diffs(use_copy=True)
+
+각 경로는 별도 트랜잭션에서 실행 후 롤백하므로 DB에 데이터가 남지 않는다.
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Callable, List
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.article_diff import ArticleDiff, compute_article_sort_key
+from app.models.article_text import article_text_hash
+from app.services.article_diff_writer import (
+    ArticlePair,
+    iter_article_pairs,
+    store_article_texts,
+    write_article_diffs,
+)
+
+_SAMPLE = "사업주는 근로자가 작업장에서 안전하게 작업할 수 있도록 필요한 조치를 하여야 한다. "
+
+
+def _synthetic_lists(articles: int, chars: int):
+    body = (_SAMPLE * (chars // len(_SAMPLE) + 1))[:chars]
+    old_list = [
+        {"no": f"제{i}조", "content": f"<p>제{i}조(목적) {body}</p>"} for i in range(1, articles + 1)
+    ]
+    new_list = [
+        {"no": f"제{i}조", "content": f"<p>제{i}조(목적) {body} 개정 {i}</p>"} for i in range(1, articles + 1)
+    ]
+    return old_list, new_list
+
+
+def _write_orm(db: Session, mst: str, pairs: List[ArticlePair]) -> int:
+    store_article_texts(db, (c for _, old, _, new in pairs for c in (old, new)))
+    sort_key = None
+    for ordinal, (old_no, old_content, new_no, new_content) in enumerate(pairs):
+        sort_key = compute_article_sort_key(old_no, old_content, new_no, new_content, sort_key)
+        db.add(
+            ArticleDiff(
+                mst=mst,
+                old_no=old_no,
+                old_hash=article_text_hash(old_content),
+                new_no=new_no,
+                new_hash=article_text_hash(new_content),
+                sort_key=sort_key,
+                ordinal=ordinal,
+            )
+        )
+    db.flush()
+    return len(pairs)
+
+
+def _run(name: str, fn: Callable[[Session], int]) -> None:
+    db = SessionLocal()
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        rows = fn(db)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:<12} rows={rows:>6}  {elapsed:8.3f}s  "
+            f"{rows / elapsed if elapsed else 0:10.0f} rows/s  peak={peak / 1024 / 1024:7.1f}MB"
+        )
+    finally:
+        db.rollback()
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=2000, help="MST 1건의 조문 수")
+    parser.add_argument("--chars", type=int, default=1500, help="조문 1건의 글자 수")
+    args = parser.parse_args()
+
+    old_list, new_list = _synthetic_lists(args.articles, args.chars)
+    mst = "BENCH-ARTICLE-DIFF"
+
+    print(f"합성 MST: 조문 {args.articles}건 x 약 {args.chars}자")
+    _run("orm", lambda db: _write_orm(db, mst, list(iter_article_pairs(old_list, new_list))))
+    _run(
+        "executemany",
+        lambda db: write_article_diffs(db, mst, iter_article_pairs(old_list, new_list), use_copy=False),
+    )
+    _run(
+        "copy",
+        lambda db: write_article_diffs(db, mst, iter_article_pairs(old_list, new_list), use_copy=True),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# app/services/cache_versions.py
+from typing import Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.cache_version import CacheVersion
+
+# law_change_event 행이 추가/삭제될 때 올리는 버전 (목록 건수 캐시 등)
+CHANGE_EVENTS = "law_change_event"
+# AI 요약/조치사항이 저장될 때 올리는 버전 (요약 본문 검색 건수 캐시)
+AI_SUMMARIES = "ai_summary"
+# 이미 적재된 article_diff 행을 고쳐 쓸 때 올리는 버전 (상세 응답 ETag/캐시 – backfill 등)
+ARTICLE_DIFFS = "article_diff"
+
+
+def get_cache_version(db: Session, name: str) -> int:
+    return db.scalar(select(CacheVersion.version).where(CacheVersion.name == name)) or 0
+
+
+async def get_cache_version_async(db: AsyncSession, name: str) -> int:
+    return await db.scalar(select(CacheVersion.version).where(CacheVersion.name == name)) or 0
+
+
+def get_cache_versions(db: Session, names: Tuple[str, ...]) -> Tuple[int, ...]:
+    """여러 버전을 한 번에 (names 순서대로, 없는 이름은 0)"""
+    found = dict(db.execute(select(CacheVersion.name, CacheVersion.version).where(CacheVersion.name.in_(names))).all())
+    return tuple(found.get(name, 0) for name in names)
+
+
+async def get_cache_versions_async(db: AsyncSession, names: Tuple[str, ...]) -> Tuple[int, ...]:
+    rows = (
+        await db.execute(select(CacheVersion.name, CacheVersion.version).where(CacheVersion.name.in_(names)))
+    ).all()
+    found = dict(rows)
+    return tuple(found.get(name, 0) for name in names)
+
+
+def bump_cache_version(db: Session, name: str) -> None:
+    """버전 +1 (커밋은 호출하는 쪽 트랜잭션과 함께)"""
+    stmt = pg_insert(CacheVersion).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CacheVersion.name],
+        set_={"version": CacheVersion.version + 1, "updated_at": func.now()},
+    )
+    db.execute(stmt)
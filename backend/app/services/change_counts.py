@@ -0,0 +1,72 @@
+# app/services/change_counts.py
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, Optional, Tuple
+import threading
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.services.cache_versions import CHANGE_EVENTS, get_cache_versions, get_cache_versions_async
+
+# 필터 조합별 목록 건수 캐시: key → (버전들, 저장 시각, 건수)
+_MAX_ENTRIES = 1024
+_TTL_SEC = 600.0  # 버전을 올리지 않는 경로(수동 삭제 등)로 바뀐 경우를 위한 상한
+
+_cache: "OrderedDict[Hashable, Tuple[Tuple[int, ...], float, int]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _lookup(key: Hashable, versions: Tuple[int, ...], now: float) -> Optional[int]:
+    with _lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] == versions and now - hit[1] < _TTL_SEC:
+            _cache.move_to_end(key)
+            return hit[2]
+    return None
+
+
+def _store(key: Hashable, versions: Tuple[int, ...], now: float, total: int) -> None:
+    with _lock:
+        _cache[key] = (versions, now, total)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def cached_change_count(
+    db: Session,
+    key: Hashable,
+    count: Callable[[], int],
+    version_names: Tuple[str, ...] = (CHANGE_EVENTS,),
+) -> int:
+    """
+    변경이력 목록 건수 (필터 조합 key별 캐시).
+    version_names의 cache_version이 모두 같고 TTL 안이면 COUNT를 다시 돌리지 않는다
+    (AI 요약 본문으로 검색하는 건수는 AI_SUMMARIES도 같이 넘긴다).
+    """
+    versions = get_cache_versions(db, version_names)
+    now = time.monotonic()
+
+    total = _lookup((key, version_names), versions, now)
+    if total is None:
+        total = count()
+        _store((key, version_names), versions, now, total)
+    return total
+
+
+async def cached_change_count_async(
+    db: AsyncSession,
+    key: Hashable,
+    count: Callable[[], Awaitable[int]],
+    version_names: Tuple[str, ...] = (CHANGE_EVENTS,),
+) -> int:
+    """cached_change_count의 async 세션 버전 (캐시는 공유)"""
+    versions = await get_cache_versions_async(db, version_names)
+    now = time.monotonic()
+
+    total = _lookup((key, version_names), versions, now)
+    if total is None:
+        total = await count()
+        _store((key, version_names), versions, now, total)
+    return total
@@ -0,0 +1,102 @@
+# app/services/change_feed.py
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.law import Law
+from app.models.law_change_event import LawChangeEvent
+from app.models.law_change_feed import LawChangeFeed
+
+# law에서 가져오는 컬럼 / law_change_event에서 가져오는 컬럼
+_LAW_COLUMNS = ("law_name", "law_type_name", "ministry_names")
+_EVENT_COLUMNS = (
+    "change_id",
+    "law_id",
+    "change_type",
+    "proclamation_no",
+    "proclamation_date",
+    "enforce_date",
+    "current_hist_cd",
+    "collected_date",
+    "change_summary",
+    "action_recommendation",
+    "ai_importance",
+    "created_at",
+)
+_AI_COLUMNS = ("change_summary", "action_recommendation", "ai_importance")
+
+
+def _feed_select():
+    """law_change_event + law → law_change_feed 컬럼 순서의 SELECT"""
+    return select(
+        *(LawChangeEvent.__table__.c[c] for c in _EVENT_COLUMNS),
+        *(Law.__table__.c[c] for c in _LAW_COLUMNS),
+    ).join(Law, Law.law_id == LawChangeEvent.law_id)
+
+
+def _feed_columns():
+    return [LawChangeFeed.__table__.c[c] for c in (*_EVENT_COLUMNS, *_LAW_COLUMNS)]
+
+
+def upsert_feed_events(db: Session, change_ids: Iterable[UUID]) -> None:
+    """이벤트 행을 피드에 반영 (새 이벤트 추가, 있으면 전체 컬럼 갱신)"""
+    change_ids = list(change_ids)
+    if not change_ids:
+        return
+
+    stmt = pg_insert(LawChangeFeed).from_select(
+        _feed_columns(),
+        _feed_select().where(LawChangeEvent.change_id.in_(change_ids)),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LawChangeFeed.change_id],
+        set_={c: stmt.excluded[c] for c in (*_EVENT_COLUMNS, *_LAW_COLUMNS) if c != "change_id"},
+    )
+    db.execute(stmt)
+
+
+def sync_feed_laws(db: Session, law_ids: Iterable[str]) -> None:
+    """법령명/유형/소관부처가 바뀐 법령의 피드 행만 갱신"""
+    law_ids = list(set(law_ids))
+    if not law_ids:
+        return
+
+    feed_values = tuple_(*(LawChangeFeed.__table__.c[c] for c in _LAW_COLUMNS))
+    law_values = tuple_(*(Law.__table__.c[c] for c in _LAW_COLUMNS))
+    db.execute(
+        update(LawChangeFeed)
+        .where(
+            LawChangeFeed.law_id == Law.law_id,
+            Law.law_id.in_(law_ids),
+            feed_values.is_distinct_from(law_values),
+        )
+        .values({c: Law.__table__.c[c] for c in _LAW_COLUMNS})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def update_feed_ai(db: Session, change: LawChangeEvent) -> None:
+    """AI 요약/조치/중요도를 피드에 반영 (커밋은 호출하는 쪽에서 이벤트와 함께)"""
+    db.execute(
+        update(LawChangeFeed)
+        .where(LawChangeFeed.change_id == change.change_id)
+        .values({c: getattr(change, c) for c in _AI_COLUMNS})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def rebuild_feed_sql() -> str:
+    """피드에 빠진 이벤트를 모두 채우는 SQL (마이그레이션/수동 복구용)"""
+    columns = ", ".join((*_EVENT_COLUMNS, *_LAW_COLUMNS))
+    event_cols = ", ".join(f"e.{c}" for c in _EVENT_COLUMNS)
+    law_cols = ", ".join(f"l.{c}" for c in _LAW_COLUMNS)
+    return f"""
+        INSERT INTO law_change_feed ({columns})
+        SELECT {event_cols}, {law_cols}
+        FROM law_change_event e
+        JOIN law l ON l.law_id = e.law_id
+        ON CONFLICT (change_id) DO NOTHING
+    """
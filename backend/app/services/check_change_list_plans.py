@@ -0,0 +1,177 @@
+# app/services/check_change_list_plans.py
+"""
+변경이력 목록 쿼리 실행 계획 점검 (인덱스 회귀 확인용)
+
+    python -m app.services.check_change_list_plans --events 200000 --laws 5000
+
+하나의 트랜잭션 안에서 합성 law / law_change_event를 넣고 law_change_feed를 채워 ANALYZE 한 뒤,
+date_basis별 목록 쿼리(첫 페이지, 기간 필터, 커서 다음 페이지)를 EXPLAIN 해서
+- law_change_feed를 Seq Scan 하지 않는지
+- 해당 date_basis의 ix_law_change_feed_*_order 인덱스를 쓰는지
+를 확인한다. 끝나면 롤백하므로 DB에 남는 것이 없다. 하나라도 어긋나면 종료 코드 1.
+(tests/test_change_list_plans.py가 같은 점검을 pytest로 돌린다 – PLANCHECK_DATABASE_URL 필요)
+"""
+import argparse
+import json
+import sys
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.api.v1.endpoints.changes import (
+    DATE_COLUMNS,
+    change_list_order,
+    filtered_change_query,
+    keyset_segments,
+)
+from app.db.session import SessionLocal
+from app.services.change_feed import rebuild_feed_sql
+
+_EXPECTED_INDEX = {
+    "promulgation": "ix_law_change_feed_proclamation_order",
+    "enforcement": "ix_law_change_feed_enforce_order",
+    "collected": "ix_law_change_feed_collected_order",
+}
+
+_PAGE_SIZE = 20
+
+
+def _seed(db: Session, events: int, laws: int) -> None:
+    """
+    실제 분포와 비슷하게: 2000년 이후 날짜에 고르게, 공포/시행일은 약 2%가 NULL,
+    시행일은 공포일 이후 0~180일
+    """
+    db.execute(
+        text(
+            """
+            INSERT INTO law (law_id, law_name, law_type_name)
+            SELECT 'PLANCHECK-' || g, '점검용 법령 ' || g, '법률'
+            FROM generate_series(1, :laws) g
+            """
+        ),
+        {"laws": laws},
+    )
+    db.execute(
+        text(
+            """
+            INSERT INTO law_change_event (
+                law_id, mst, change_type, proclamation_no,
+                proclamation_date, enforce_date, collected_date, event_key, created_at
+            )
+            SELECT
+                'PLANCHECK-' || (1 + (g % :laws)),
+                'PLANCHECK-' || g,
+                '일부개정',
+                g::text,
+                CASE WHEN g % 50 = 0 THEN NULL ELSE d END,
+                CASE WHEN g % 45 = 0 THEN NULL ELSE d + (g % 180) END,
+                d + (g % 3),
+                md5('PLANCHECK-' || g),
+                now() - (g || ' seconds')::interval
+            FROM (
+                SELECT g, DATE '2000-01-01' + (random() * 9000)::int AS d
+                FROM generate_series(1, :events) g
+            ) s
+            """
+        ),
+        {"events": events, "laws": laws},
+    )
+    db.execute(text(rebuild_feed_sql()))
+    db.execute(text("ANALYZE law"))
+    db.execute(text("ANALYZE law_change_event"))
+    db.execute(text("ANALYZE law_change_feed"))
+
+
+def _walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def _explain(db: Session, query) -> Dict[str, Any]:
+    sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def _feed_scans(db: Session, query) -> List[Dict[str, Any]]:
+    """실행 계획에서 law_change_feed를 읽는 노드들"""
+    return [n for n in _walk(_explain(db, query)) if n.get("Relation Name") == "law_change_feed"]
+
+
+def _plan_ok(feed_scans: List[Dict[str, Any]], expected_index: str) -> bool:
+    seq = [n for n in feed_scans if n["Node Type"] == "Seq Scan"]
+    used = {n.get("Index Name") for n in feed_scans}
+    return not seq and expected_index in used
+
+
+def _check(db: Session, label: str, query, expected_index: str) -> bool:
+    feed_scans = _feed_scans(db, query)
+
+    ok = _plan_ok(feed_scans, expected_index)
+    status = "OK  " if ok else "FAIL"
+    scans = ", ".join(f"{n['Node Type']}({n.get('Index Name') or '-'})" for n in feed_scans)
+    print(f"{status} {label:<40} {scans}")
+    return ok
+
+
+def _cases() -> List[Tuple[str, Any, str]]:
+    cases = []
+    for basis, expected in _EXPECTED_INDEX.items():
+        order = change_list_order(basis)
+
+        first = filtered_change_query(None, basis, None, None).order_by(*order).limit(_PAGE_SIZE + 1)
+        cases.append((f"{basis} 첫 페이지", first, expected))
+
+        ranged = (
+            filtered_change_query(None, basis, date(2015, 1, 1), date(2015, 12, 31))
+            .order_by(*order)
+            .limit(_PAGE_SIZE + 1)
+        )
+        cases.append((f"{basis} 기간 필터", ranged, expected))
+
+        # 중간쯤의 커서 (첫 구간 = 행 비교 조건)
+        cursor = keyset_segments(
+            DATE_COLUMNS[basis],
+            date(2012, 6, 30),
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            UUID(int=0),
+        )[0]
+        keyset = (
+            filtered_change_query(None, basis, None, None)
+            .order_by(*order)
+            .where(cursor)
+            .limit(_PAGE_SIZE + 1)
+        )
+        cases.append((f"{basis} 커서 다음 페이지", keyset, expected))
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200_000, help="합성 변경이력 수")
+    parser.add_argument("--laws", type=int, default=5_000, help="합성 법령 수")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print(f"합성 데이터 적재: law {args.laws}건, law_change_event {args.events}건 (롤백 예정)")
+        _seed(db, args.events, args.laws)
+        results = [_check(db, label, query, expected) for label, query, expected in _cases()]
+    finally:
+        db.rollback()
+        db.close()
+
+    failed = results.count(False)
+    print(f"{len(results) - failed}/{len(results)} 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# app/services/detail_cache.py
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+import threading
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# change_id → (etag, 직렬화된 응답 본문). 같은 change_id는 최신 버전 하나만 보관
+_cache: "OrderedDict[UUID, Tuple[str, bytes]]" = OrderedDict()
+_size = 0
+_lock = threading.Lock()
+
+
+def get_cached_detail(change_id: UUID, etag: str) -> Optional[bytes]:
+    """etag(버전)까지 같을 때만 캐시된 상세 응답 본문"""
+    with _lock:
+        hit = _cache.get(change_id)
+        if hit is None or hit[0] != etag:
+            return None
+        _cache.move_to_end(change_id)
+        return hit[1]
+
+
+def store_detail(change_id: UUID, etag: str, body: bytes) -> None:
+    """
+    상세 응답 본문 저장 (전체 크기가 changes_detail_cache_max_bytes를 넘으면 오래된 것부터 버림).
+    한 건이 상한의 1/8보다 크면 다른 항목을 다 밀어내므로 저장하지 않는다.
+    """
+    global _size
+    max_bytes = settings.changes_detail_cache_max_bytes
+    if len(body) > max_bytes // 8:
+        return
+
+    with _lock:
+        old = _cache.pop(change_id, None)
+        if old is not None:
+            _size -= len(old[1])
+        _cache[change_id] = (etag, body)
+        _size += len(body)
+        while _size > max_bytes:
+            _, (_, evicted) = _cache.popitem(last=False)
+            _size -= len(evicted)
+
@@ -0,0 +1,250 @@
+# app/services/llm_backends.py
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional, Tuple
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+
+import requests
+
+from app.core.config import get_settings
+from app.services.llm_stream import IncrementalJsonValidator, StreamAborted, consume_token_stream
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class LlmBackend(ABC):
+    """
+    AI 요약용 LLM 호출 백엔드.
+    generate()는 (응답 텍스트, 통계)를 돌려준다. 통계는 서버가 알려 준 값만
+    (prompt_tokens / prefill_sec / output_tokens, 없으면 빈 dict).
+    validator가 있으면 스트리밍으로 받으면서 검사하고, 객체가 닫히면 바로 끊는다.
+    """
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    @abstractmethod
+    def generate(
+        self,
+        prompt: str,
+        validator: Optional[IncrementalJsonValidator],
+        timeout: float,
+    ) -> Tuple[str, Dict[str, Any]]:
+        ...
+
+
+class OllamaBackend(LlmBackend):
+    """Ollama /api/generate"""
+
+    name = "ollama"
+
+    def __init__(self, base_url: str, model_name: str):
+        super().__init__(model_name)
+        self.url = f"{base_url.rstrip('/')}/api/generate"
+
+    def generate(self, prompt, validator, timeout):
+        payload = {
+            "model": self.model_name,
+            "prompt": prompt,
+        }
+        if validator is not None:
+            with requests.post(self.url, json={**payload, "stream": True}, stream=True, timeout=timeout) as resp:
+                resp.raise_for_status()
+                return consume_token_stream(self._iter_tokens(resp), validator, timeout), {}
+
+        resp = requests.post(self.url, json={**payload, "stream": False}, timeout=timeout)
+        resp.raise_for_status()
+        data = resp.json()
+        stats = {
+            "prompt_tokens": data.get("prompt_eval_count"),
+            "prefill_sec": (data.get("prompt_eval_duration") or 0) / 1e9,
+            "output_tokens": data.get("eval_count"),
+        }
+        return (data.get("response") or "").strip(), stats
+
+    @staticmethod
+    def _iter_tokens(resp: requests.Response) -> Iterable[str]:
+        """스트림(NDJSON)의 response 토큰"""
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            data: Dict[str, Any] = json.loads(line)
+            if data.get("error"):
+                raise requests.HTTPError(f"Ollama 오류: {data['error']}")
+            token = data.get("response")
+            if token:
+                yield token
+            if data.get("done"):
+                return
+
+
+class OpenAICompatBackend(LlmBackend):
+    """OpenAI 호환 /chat/completions (vLLM, llama.cpp server 등)"""
+
+    name = "openai"
+
+    def __init__(self, base_url: str, model_name: str, api_key: Optional[str] = None):
+        super().__init__(model_name)
+        self.url = f"{base_url.rstrip('/')}/chat/completions"
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+    def generate(self, prompt, validator, timeout):
+        payload = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if validator is not None:
+            with requests.post(
+                self.url,
+                json={**payload, "stream": True},
+                headers=self.headers,
+                stream=True,
+                timeout=timeout,
+            ) as resp:
+                resp.raise_for_status()
+                return consume_token_stream(self._iter_tokens(resp), validator, timeout), {}
+
+        resp = requests.post(self.url, json=payload, headers=self.headers, timeout=timeout)
+        resp.raise_for_status()
+        data = resp.json()
+        usage = data.get("usage") or {}
+        stats = {
+            "prompt_tokens": usage.get("prompt_tokens"),
+            "output_tokens": usage.get("completion_tokens"),
+        }
+        content = ((data.get("choices") or [{}])[0].get("message") or {}).get("content") or ""
+        return content.strip(), stats
+
+    @staticmethod
+    def _iter_tokens(resp: requests.Response) -> Iterable[str]:
+        """SSE 스트림(data: {...})의 delta.content 토큰"""
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            body = line[len("data:"):].strip()
+            if body == "[DONE]":
+                return
+            data: Dict[str, Any] = json.loads(body)
+            choices = data.get("choices") or []
+            if not choices:
+                continue
+            token = (choices[0].get("delta") or {}).get("content")
+            if token:
+                yield token
+
+
+_BATCH_ITEM = re.compile(r"^### 항목 (\d+)", flags=re.MULTILINE)
+_STUB_IMPORTANCE = ("NONE", "LOW", "MEDIUM", "HIGH")
+
+
+class StubBackend(LlmBackend):
+    """
+    GPU 없이 요약 처리량/동시성을 재기 위한 프로세스 내 가짜 백엔드.
+    - latency_sec(± jitter 비율)만큼 기다린 뒤 정해진 모양의 JSON을 돌려준다 (묶음 프롬프트면 배열)
+    - failure_rate 확률로 형식이 틀린 응답을 돌려준다 (재시도/폴백 경로 측정용)
+    - 같은 seed면 같은 순서로 지연/실패가 나온다
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        latency_sec: float = 1.0,
+        failure_rate: float = 0.0,
+        jitter: float = 0.3,
+        seed: int = 0,
+    ):
+        super().__init__("stub")
+        self.latency_sec = latency_sec
+        self.failure_rate = failure_rate
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self) -> Tuple[float, bool]:
+        with self._lock:
+            delay = self.latency_sec * (1 + self._rng.uniform(-self.jitter, self.jitter))
+            failed = self._rng.random() < self.failure_rate
+        return max(0.0, delay), failed
+
+    @staticmethod
+    def _result(prompt: str, item_id: int | None = None) -> Dict[str, Any]:
+        digest = hashlib.md5(f"{item_id}:{prompt}".encode("utf-8")).digest()
+        importance = _STUB_IMPORTANCE[digest[0] % len(_STUB_IMPORTANCE)]
+        result: Dict[str, Any] = {
+            "importance": importance,
+            "summary": f"(stub) 변경 내용 요약 {digest.hex()[:8]}",
+            "actions": ["(stub) 법규 준수 평가 메뉴에서 해당 조문 점검"],
+        }
+        if item_id is not None:
+            result = {"id": item_id, **result}
+        return result
+
+    def generate(self, prompt, validator, timeout):
+        delay, failed = self._draw()
+
+        if failed:
+            text = "죄송합니다. 요청하신 내용을 정리하면 다음과 같습니다..."
+        else:
+            items = [int(n) for n in _BATCH_ITEM.findall(prompt)]
+            if items:
+                text = json.dumps([self._result(prompt, n) for n in items], ensure_ascii=False)
+            else:
+                text = json.dumps(self._result(prompt), ensure_ascii=False)
+
+        if validator is not None:
+            # 스트리밍: 토큰이 고르게 나온다고 보고, 형식이 틀리면 앞부분만 받고 중단
+            if failed:
+                time.sleep(min(delay, timeout) * 0.1)
+                raise StreamAborted("stub 형식 오류", text[:10])
+            time.sleep(min(delay, timeout))
+            return consume_token_stream(
+                (text[i:i + 4] for i in range(0, len(text), 4)), validator, timeout
+            ), {}
+
+        time.sleep(min(delay, timeout))
+        return text, {"prompt_tokens": None, "output_tokens": None}
+
+
+_backend: LlmBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def _backend_from_settings() -> LlmBackend:
+    kind = settings.llm_backend.lower()
+    if kind == "ollama":
+        return OllamaBackend(settings.ollama_base_url, settings.ollama_model_name)
+    if kind == "openai":
+        return OpenAICompatBackend(settings.openai_base_url, settings.openai_model_name, settings.openai_api_key)
+    if kind == "stub":
+        return StubBackend(
+            latency_sec=settings.llm_stub_latency_sec,
+            failure_rate=settings.llm_stub_failure_rate,
+            seed=settings.llm_stub_seed,
+        )
+    raise ValueError(f"알 수 없는 llm_backend: {settings.llm_backend!r} (ollama | openai | stub)")
+
+
+def get_llm_backend() -> LlmBackend:
+    """설정(llm_backend)에 맞는 백엔드 (프로세스 전체 공유)"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = _backend_from_settings()
+        return _backend
+
+
+def set_llm_backend(backend: LlmBackend | None) -> None:
+    """백엔드 교체 (벤치마크 등). None이면 다음 호출 때 설정값으로 다시 만든다"""
+    global _backend
+    with _backend_lock:
+        _backend = backend
@@ -0,0 +1,163 @@
+# app/services/llm_stream.py
+from typing import Dict, Iterable, Optional, Set
+import time
+
+# 요약 응답의 최상위 키 / importance 허용값
+SUMMARY_KEYS = {"importance", "summary", "actions"}
+IMPORTANCE_VALUES = {"HIGH", "MEDIUM", "LOW", "NONE"}
+
+
+class StreamAborted(Exception):
+    """스트리밍 응답이 기대한 JSON 모양에서 벗어나 중간에 끊은 경우"""
+
+    def __init__(self, reason: str, partial: str):
+        super().__init__(reason)
+        self.reason = reason
+        self.partial = partial
+
+
+class IncrementalJsonValidator:
+    """
+    토큰 조각을 받는 대로 JSON 객체 1개의 모양을 검사한다.
+
+    - 공백 다음 첫 글자가 '{'가 아니면 실패
+    - 최상위 키는 allowed_keys 중 하나여야 함
+    - enum_values에 지정한 키는 문자열 값이 허용값(대소문자 무시)이어야 함
+    - 최상위 객체가 닫히면 done (그 뒤 토큰은 볼 필요 없음)
+
+    feed()는 "continue" | "done"을 돌려주고, 모양이 틀리면 ValueError를 던진다.
+    """
+
+    def __init__(
+        self,
+        allowed_keys: Set[str],
+        enum_values: Optional[Dict[str, Set[str]]] = None,
+        max_chars: int = 8000,
+    ):
+        self.allowed_keys = allowed_keys
+        self.enum_values = enum_values or {}
+        self.max_chars = max_chars
+
+        self.text: list[str] = []
+        self.length = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.started = False
+        self.done = False
+
+        # 최상위(depth 1) 문자열 수집용
+        self._expect_key = False
+        self._current_key: Optional[str] = None
+        self._buf: Optional[list[str]] = None
+
+    @property
+    def value(self) -> str:
+        return "".join(self.text)
+
+    def feed(self, chunk: str) -> str:
+        for ch in chunk:
+            if self.done:
+                return "done"
+            self._feed_char(ch)
+        if self.length > self.max_chars and not self.done:
+            raise ValueError(f"응답이 {self.max_chars}자를 넘도록 객체가 닫히지 않음")
+        return "done" if self.done else "continue"
+
+    def _feed_char(self, ch: str) -> None:
+        if not self.started:
+            if ch.isspace():
+                return
+            if ch != "{":
+                raise ValueError(f"JSON 객체로 시작하지 않음: {ch!r}")
+            self.started = True
+
+        self.text.append(ch)
+        self.length += 1
+
+        if self.in_string:
+            if self.escape:
+                self.escape = False
+            elif ch == "\\":
+                self.escape = True
+            elif ch == '"':
+                self.in_string = False
+                self._end_string()
+                return
+            if self._buf is not None:
+                self._buf.append(ch)
+            return
+
+        if ch == '"':
+            self.in_string = True
+            if self.depth == 1:
+                self._buf = []
+            return
+
+        if ch in "{[":
+            self.depth += 1
+            if self.depth == 1:
+                self._expect_key = True
+        elif ch in "}]":
+            self.depth -= 1
+            if self.depth == 0:
+                self.done = True
+            elif self.depth < 0:
+                raise ValueError("괄호 짝이 맞지 않음")
+        elif self.depth == 1:
+            if ch == ":":
+                self._expect_key = False
+            elif ch == ",":
+                self._expect_key = True
+                self._current_key = None
+
+    def _end_string(self) -> None:
+        if self._buf is None:
+            return
+        s = "".join(self._buf)
+        self._buf = None
+
+        if self._expect_key:
+            if s not in self.allowed_keys:
+                raise ValueError(f"예상하지 않은 키: {s!r}")
+            self._current_key = s
+            return
+
+        allowed = self.enum_values.get(self._current_key or "")
+        if allowed is not None and s.strip().upper() not in allowed:
+            raise ValueError(f"{self._current_key} 값이 허용값이 아님: {s[:50]!r}")
+
+
+def summary_validator(max_chars: int) -> IncrementalJsonValidator:
+    return IncrementalJsonValidator(
+        allowed_keys=SUMMARY_KEYS,
+        enum_values={"importance": IMPORTANCE_VALUES},
+        max_chars=max_chars,
+    )
+
+
+def consume_token_stream(
+    tokens: Iterable[str],
+    validator: IncrementalJsonValidator,
+    timeout: float,
+) -> str:
+    """
+    스트리밍 토큰을 validator에 넣다가 객체가 닫히면 바로 멈춘다.
+    - 호출한 쪽이 연결을 닫으면 서버도 나머지 생성을 멈춘다 (Ollama, vLLM 모두 연결 종료 시 중단)
+    - 모양이 틀리면 StreamAborted (재시도를 바로 시작할 수 있게)
+    - timeout은 첫 토큰 ~ 마지막 토큰까지 전체 허용 시간
+    """
+    deadline = time.monotonic() + timeout
+    for token in tokens:
+        try:
+            status = validator.feed(token)
+        except ValueError as e:
+            raise StreamAborted(str(e), validator.value) from None
+        if status == "done":
+            break
+        if time.monotonic() > deadline:
+            raise StreamAborted(f"{timeout:.0f}초 안에 응답이 끝나지 않음", validator.value)
+
+    if not validator.done:
+        raise StreamAborted("JSON 객체가 닫히기 전에 응답이 끝남", validator.value)
+    return validator.value
@@ -0,0 +1,192 @@
+# app/services/nlic_async_client.py
+from datetime import date
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+import asyncio
+import random
+
+import httpx
+
+from app.core.config import get_settings
+from app.services import nlic_client
+from app.services.nlic_client import (
+    NlicClientError,
+    _cache_miss,
+    _history_params,
+    _history_ttl_sec,
+    _old_new_params,
+    _parse_history_page,
+    _rate_limiter,
+)
+
+settings = get_settings()
+
+
+class AsyncNlicClient:
+    """
+    NLIC async 클라이언트 (nlic_client의 동기 함수들과 같은 응답 형태)
+
+    - 하나의 httpx.AsyncClient를 공유 → keep-alive 커넥션 풀 재사용
+    - 호스트별 동시 요청 수 제한 (nlic_max_connections_per_host)
+    - 지터가 들어간 지수 백오프 재시도, 재시도 포함 요청 1건의 deadline
+    - 호출 속도는 동기 클라이언트와 같은 전역 rate limit을 공유
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_connections_per_host: int | None = None,
+        deadline_sec: float | None = None,
+    ):
+        if max_connections is None:
+            max_connections = settings.nlic_max_connections
+        if max_connections_per_host is None:
+            max_connections_per_host = settings.nlic_max_connections_per_host
+        if deadline_sec is None:
+            deadline_sec = settings.nlic_request_deadline_sec
+
+        self.max_connections_per_host = max_connections_per_host
+        self.deadline_sec = deadline_sec
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncNlicClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    async def _request_json(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        timeout: float = 230,
+        max_retries: int = 5,
+        backoff_sec: float = 1.0,
+        max_backoff_sec: float = 30.0,
+    ) -> Dict[str, Any]:
+        """
+        nlic_client._request_json의 async 버전
+        - 타임아웃/네트워크 에러 시 full-jitter 지수 백오프로 재시도
+        - deadline_sec을 넘기면 남은 재시도와 상관없이 NlicClientError
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline_sec
+        last_exc: Exception | None = None
+
+        for attempt in range(1, max_retries + 1):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            try:
+                delay = _rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                async with self._host_slot(url):
+                    resp = await self._client.get(
+                        url,
+                        params=params,
+                        timeout=min(timeout, max(remaining, 0.001)),
+                    )
+                resp.raise_for_status()
+                return resp.json()
+            except httpx.TransportError as e:  # 타임아웃/커넥션 에러
+                last_exc = e
+                print(
+                    f"[NLIC] timeout/conn error (attempt {attempt}/{max_retries}) "
+                    f"url={url} params={params} err={e!r}"
+                )
+                if attempt < max_retries:
+                    wait = random.uniform(0, min(max_backoff_sec, backoff_sec * 2 ** (attempt - 1)))
+                    await asyncio.sleep(min(wait, max(deadline - loop.time(), 0)))
+                continue
+            except Exception as e:
+                # HTTP 500, JSON 파싱 오류 등
+                raise NlicClientError(f"Request failed: {e}") from e
+
+        raise NlicClientError(
+            f"Request to {url} failed after {max_retries} retries "
+            f"(deadline {self.deadline_sec:.0f}s): {last_exc!r}"
+        )
+
+    async def _cached_request_json(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        ttl_sec: float,
+        **request_kwargs: Any,
+    ) -> Dict[str, Any]:
+        """동기 클라이언트와 같은 디스크 캐시 사용 (파일 I/O는 스레드에서)"""
+        cache = nlic_client._cache
+        if cache is None:
+            return await self._request_json(url, params, **request_kwargs)
+
+        data = await asyncio.to_thread(cache.get, params, ttl_sec)
+        if data is not None:
+            return data
+
+        _cache_miss(params)
+        data = await self._request_json(url, params, **request_kwargs)
+        await asyncio.to_thread(cache.put, params, data)
+        return data
+
+    async def fetch_law_history_page_by_regdt(
+        self,
+        reg_dt: date,
+        page: int = 1,
+        display: int = 100,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        params = _history_params(reg_dt, page, display)
+        data = await self._cached_request_json(
+            settings.nlic_history_url,
+            params,
+            _history_ttl_sec(reg_dt),
+        )
+        return _parse_history_page(data, page, display)
+
+    async def fetch_old_new(self, mst: str) -> Dict[str, Any]:
+        params = _old_new_params(mst)
+        return await self._cached_request_json(
+            settings.nlic_oldnew_url,
+            params,
+            settings.nlic_cache_mst_ttl_sec,
+            timeout=230,
+            max_retries=5,
+            backoff_sec=2.0,
+        )
+
+
+_shared_client: AsyncNlicClient | None = None
+
+
+def get_async_nlic_client() -> AsyncNlicClient:
+    """프로세스 공용 async 클라이언트 (이벤트 루프 안에서 처음 호출될 때 생성)"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = AsyncNlicClient()
+    return _shared_client
+
+
+async def close_async_nlic_client() -> None:
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -0,0 +1,213 @@
+# app/services/nlic_backfill.py
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Deque, Dict, List, Tuple
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.services.nlic_client import fetch_law_history_page_by_regdt
+from app.services.nlic_loader import OldNewPipeline, _ingest_history_items, requeue_missing_old_new
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+@dataclass
+class _PrefetchedDate:
+    """한 날짜 분량의 lsHstInf 응답 (전체 페이지)"""
+
+    target_date: date
+    pages: List[List[Dict[str, Any]]] = field(default_factory=list)
+
+
+def _iter_dates(start_date: date, end_date: date):
+    cur = start_date
+    while cur <= end_date:
+        yield cur
+        cur += timedelta(days=1)
+
+
+def _prefetch_date(target_date: date) -> _PrefetchedDate:
+    """워커 스레드에서 실행: 한 날짜의 모든 lsHstInf 페이지를 미리 받아 둔다 (DB에는 쓰지 않음)"""
+    prefetched = _PrefetchedDate(target_date=target_date)
+
+    page = 1
+    while True:
+        items, has_next = fetch_law_history_page_by_regdt(
+            reg_dt=target_date,
+            page=page,
+            display=100,
+        )
+        if not items:
+            break
+        prefetched.pages.append(items)
+        if not has_next:
+            break
+        page += 1
+
+    return prefetched
+
+
+class BackfillCheckpoint:
+    """
+    backfill_changes 진행 상황 훅 (기본 구현은 아무것도 하지 않음 → 일회성 실행)
+    - on_page / on_date_done은 해당 페이지/날짜 적재와 같은 트랜잭션에서 호출되므로
+      체크포인트와 적재 데이터가 항상 함께 커밋된다.
+    """
+
+    def start_page(self, target_date: date) -> int:
+        """이 날짜에서 처음 적재할 페이지 (이미 커밋된 페이지는 건너뜀)"""
+        return 1
+
+    def on_page(self, db: Session, target_date: date, page: int, counts: Dict[str, Any]) -> None:
+        pass
+
+    def on_date_done(self, db: Session, target_date: date) -> None:
+        pass
+
+    def should_stop(self) -> bool:
+        return False
+
+
+def _write_date(
+    db: Session,
+    prefetched: _PrefetchedDate,
+    pipeline: OldNewPipeline,
+    checkpoint: BackfillCheckpoint,
+) -> Tuple[Dict[str, int], bool]:
+    """
+    적재 스레드에서 실행: 받아 둔 페이지를 순서대로 적재하고 페이지마다 커밋 (load_changes_for_date와 동일).
+    신규 이벤트의 mst는 커밋 후 oldAndNew 파이프라인으로 넘긴다.
+    중간에 멈추라는 요청이 있으면 (집계, False)를 돌려준다.
+    """
+    totals = {"history_records": 0, "new_events": 0, "laws_touched": 0}
+    first_page = checkpoint.start_page(prefetched.target_date)
+
+    for page_no, items in enumerate(prefetched.pages, start=1):
+        if page_no < first_page:
+            continue
+        if checkpoint.should_stop():
+            return totals, False
+
+        counts = _ingest_history_items(db, items, prefetched.target_date, pipeline=pipeline)
+        checkpoint.on_page(db, prefetched.target_date, page_no, counts)
+        db.commit()
+
+        for mst in counts["new_msts"]:
+            pipeline.submit(mst)
+        for key in totals:
+            totals[key] += counts[key]
+
+    checkpoint.on_date_done(db, prefetched.target_date)
+    db.commit()
+
+    return totals, True
+
+
+def backfill_changes(
+    start_date: date,
+    end_date: date,
+    workers: int | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+    old_new_workers: int | None = None,
+    checkpoint: BackfillCheckpoint | None = None,
+) -> Dict[str, Any]:
+    """
+    (start_date ~ end_date) 변경이력 동시 적재 엔진
+
+    - lsHstInf 페이지 조회는 workers개 스레드가 여러 날짜를 동시에 선조회
+    - oldAndNew는 OldNewPipeline 워커들이 mst 단위로 따로 받아서 커밋
+    - 전체 호출 속도는 nlic_client의 전역 rate limit(nlic_max_requests_per_sec)을 따른다
+    - law / law_change_event 적재는 날짜 순서대로, 날짜마다 별도 세션으로 진행
+      → 중복 판정/집계가 직렬 실행과 정확히 같다
+    - 선조회는 최대 workers * 2 일치까지만 앞서 나가므로 메모리 사용량이 제한된다
+    - checkpoint: 페이지/날짜 단위 진행 기록과 중단 요청 확인 (BackfillCheckpoint)
+    """
+    if checkpoint is None:
+        checkpoint = BackfillCheckpoint()
+    if workers is None:
+        workers = settings.nlic_backfill_workers
+    workers = max(1, workers)
+    lookahead = workers * 2
+
+    dates = list(_iter_dates(start_date, end_date))
+
+    total_history_records = 0
+    total_new_events = 0
+    total_laws_touched = 0
+
+    stopped = False
+
+    pending: Deque[Tuple[date, Future]] = deque()
+    next_idx = 0
+
+    pipeline = OldNewPipeline(workers=old_new_workers, session_factory=session_factory)
+
+    with pipeline, ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nlic-backfill") as pool:
+        # 이전 실행이 oldAndNew 큐를 비우기 전에 끊겼을 수 있으므로 빠진 mst부터 다시 넣는다
+        db = session_factory()
+        try:
+            requeue_missing_old_new(db, pipeline)
+        finally:
+            db.close()
+
+        def _submit_next() -> None:
+            nonlocal next_idx
+            target_date = dates[next_idx]
+            pending.append(
+                (target_date, pool.submit(_prefetch_date, target_date))
+            )
+            next_idx += 1
+
+        while next_idx < len(dates) and len(pending) < lookahead:
+            _submit_next()
+
+        try:
+            while pending:
+                target_date, future = pending.popleft()
+                if next_idx < len(dates):
+                    _submit_next()
+
+                prefetched = future.result()
+
+                db = session_factory()
+                try:
+                    counts, completed = _write_date(db, prefetched, pipeline, checkpoint)
+                finally:
+                    db.close()
+
+                total_history_records += counts["history_records"]
+                total_new_events += counts["new_events"]
+                total_laws_touched += counts["laws_touched"]
+
+                if not completed:
+                    stopped = True
+                    for _, pending_future in pending:
+                        pending_future.cancel()
+                    logger.info("[BACKFILL] %s 적재 중 중단 요청으로 멈춤", target_date)
+                    break
+
+                logger.info(
+                    "[BACKFILL] %s 적재 완료: records=%d new_events=%d",
+                    target_date, counts["history_records"], counts["new_events"],
+                )
+        except BaseException:
+            for _, future in pending:
+                future.cancel()
+            raise
+
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "total_history_records_seen": total_history_records,
+        "total_new_events_inserted": total_new_events,
+        "total_laws_touched": total_laws_touched,
+        "stopped": stopped,
+        **pipeline.stats(),
+    }
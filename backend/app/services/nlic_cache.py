@@ -0,0 +1,148 @@
+# app/services/nlic_cache.py
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키에서 제외할 파라미터 (인증키는 응답 내용과 무관)
+_IGNORED_PARAMS = {"OC"}
+
+
+class NlicResponseCache:
+    """
+    NLIC 응답 디스크 캐시 (content-addressed, gzip 압축)
+
+    - 키: target/조회 파라미터를 정렬한 JSON의 sha256 → root/ab/abcd....json.gz
+    - 신선도: 파일 mtime(저장 시각) 기준 TTL. 조회할 때마다 atime을 갱신해서 LRU 순서로 사용
+    - 전체 크기가 max_bytes를 넘으면 오래 안 쓴 파일부터 지워서 90% 아래로 줄인다
+    - 캐시 디렉터리 자체가 응답 원본(JSON)이라 오프라인 재적재/테스트 픽스처로 그대로 쓸 수 있다
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: int | None = None  # 처음 저장할 때 디렉터리를 훑어서 계산
+
+    @staticmethod
+    def key(params: Dict[str, Any]) -> str:
+        normalized = {k: str(v) for k, v in params.items() if k not in _IGNORED_PARAMS}
+        raw = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.json.gz")
+
+    def _fresh_path(self, params: Dict[str, Any], ttl_sec: float) -> Optional[str]:
+        path = self._path(self.key(params))
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        if now - st.st_mtime > ttl_sec:
+            return None
+        # LRU용 접근 시각만 갱신 (mtime = 저장 시각은 그대로)
+        os.utime(path, (now, st.st_mtime))
+        return path
+
+    def get(self, params: Dict[str, Any], ttl_sec: float) -> Optional[Dict[str, Any]]:
+        path = self._fresh_path(params, ttl_sec)
+        if path is None:
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("[NLIC CACHE] 손상된 캐시 파일 무시: %s (%s)", path, e)
+            return None
+
+    @contextmanager
+    def open(self, params: Dict[str, Any], ttl_sec: float) -> Iterator[Optional[BinaryIO]]:
+        """캐시된 응답을 (압축 해제된) 바이트 스트림으로 연다. 없으면 None."""
+        path = self._fresh_path(params, ttl_sec)
+        if path is None:
+            yield None
+            return
+        with gzip.open(path, "rb") as f:
+            yield f
+
+    def put(self, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        with self.writer(params) as f:
+            f.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    @contextmanager
+    def writer(self, params: Dict[str, Any]) -> Iterator[BinaryIO]:
+        """
+        응답 바이트를 써 넣을 파일. 블록이 예외 없이 끝나야 캐시에 반영된다 (임시 파일 → rename).
+        """
+        path = self._path(self.key(params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as f:
+                yield f
+            added = os.path.getsize(tmp_path)
+            # 같은 키를 다시 쓰는 경우(TTL 만료/강제 갱신) 덮어쓰는 파일 크기는 빼고 계산
+            try:
+                added -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self._account(added)
+
+    def _account(self, added: int) -> None:
+        """added: 이번 저장으로 늘어난 바이트 (덮어쓴 경우 새 파일 - 기존 파일, 음수일 수 있음)"""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, _, size in self._scan())
+            else:
+                self._size += added
+            if self._size <= self.max_bytes:
+                return
+            self._evict()
+
+    def _scan(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".json.gz"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, st.st_atime, st.st_size
+
+    def _evict(self) -> None:
+        """오래 안 쓴 파일부터 지워서 max_bytes의 90% 아래로"""
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._scan(), key=lambda e: e[1])
+        size = sum(e[2] for e in entries)
+        removed = 0
+        for path, _, file_size in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            size -= file_size
+            removed += 1
+        self._size = size
+        logger.info("[NLIC CACHE] %d개 파일 정리 → %.1fMB", removed, size / 1024 / 1024)
@@ -1,12 +1,17 @@
 # app/services/nlic_client.py
+from contextlib import contextmanager
 from datetime import date
-from typing import Any, Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
+import io
+import threading
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ReadTimeout, ConnectionError as RequestsConnectionError
 
 from app.core.config import get_settings
+from app.services.nlic_cache import NlicResponseCache
 
 settings = get_settings()
 
@@ -15,25 +20,85 @@ class NlicClientError(Exception):
     pass
 
 
-def _request_json(
+class _RateLimiter:
+    """
+    프로세스 전역 요청 속도 제한
+    - 여러 스레드(백필 워커)가 동시에 호출해도 초당 rate_per_sec 건을 넘지 않도록 호출 간격을 벌린다.
+    """
+
+    def __init__(self, rate_per_sec: float):
+        self.rate_per_sec = rate_per_sec
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def reserve(self) -> float:
+        """다음 호출 슬롯을 예약하고, 그때까지 기다려야 할 시간(초)을 돌려준다."""
+        if self.rate_per_sec <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_at, now)
+            self._next_at = slot + 1.0 / self.rate_per_sec
+
+        return slot - now
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+_rate_limiter = _RateLimiter(settings.nlic_max_requests_per_sec)
+
+
+def _build_session() -> requests.Session:
+    """keep-alive 커넥션을 재사용하는 공용 세션 (매 요청마다 TCP/TLS 핸드셰이크 방지)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=settings.nlic_max_connections_per_host,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+
+_cache: NlicResponseCache | None = (
+    NlicResponseCache(settings.nlic_cache_dir, settings.nlic_cache_max_bytes)
+    if settings.nlic_cache_dir
+    else None
+)
+
+
+def _request(
     url: str,
     params: Dict[str, Any],
-    timeout: int = 230,    # 기본 타임아웃 넉넉하게
-    max_retries: int = 5, # 5번까지 재시도
+    timeout: int = 230,
+    max_retries: int = 5,
     backoff_sec: float = 1.0,
-) -> Dict[str, Any]:
+    stream: bool = False,
+) -> requests.Response:
     """
-    NLIC 공통 요청 함수
+    NLIC 공통 GET (재시도 포함)
     - 타임아웃/네트워크 에러 시 여러 번 재시도
     - 그래도 안 되면 NlicClientError를 던져서 배치 전체를 중단시킨다 (초기 적재용 strict 모드).
+    - stream=True면 본문을 읽지 않은 응답을 돌려준다 (호출하는 쪽이 close)
     """
     last_exc: Exception | None = None
 
     for attempt in range(1, max_retries + 1):
         try:
-            resp = requests.get(url, params=params, timeout=timeout)
-            resp.raise_for_status()
-            return resp.json()
+            _rate_limiter.acquire()
+            resp = _session.get(url, params=params, timeout=timeout, stream=stream)
+            try:
+                resp.raise_for_status()
+            except Exception:
+                resp.close()
+                raise
+            return resp
         except (ReadTimeout, RequestsConnectionError) as e:
             last_exc = e
             print(
@@ -44,7 +109,7 @@ def _request_json(
                 time.sleep(backoff_sec * attempt)  # 1, 2, 3, 4... 초 기다렸다 재시도
             continue
         except Exception as e:
-            # HTTP 500, JSON 파싱 오류 등
+            # HTTP 500 등
             raise NlicClientError(f"Request failed: {e}") from e
 
     # max_retries 다 써도 안 되면 여기로
@@ -53,15 +118,28 @@ def _request_json(
     )
 
 
-def fetch_law_history_page_by_regdt(
-    reg_dt: date,
-    page: int = 1,
-    display: int = 100,
-) -> Tuple[List[Dict[str, Any]], bool]:
+def _request_json(
+    url: str,
+    params: Dict[str, Any],
+    timeout: int = 230,    # 기본 타임아웃 넉넉하게
+    max_retries: int = 5, # 5번까지 재시도
+    backoff_sec: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    NLIC 공통 요청 함수 (JSON 응답 전체를 dict로)
+    """
+    resp = _request(url, params, timeout=timeout, max_retries=max_retries, backoff_sec=backoff_sec)
+    try:
+        return resp.json()
+    except Exception as e:
+        # JSON 파싱 오류 등
+        raise NlicClientError(f"Request failed: {e}") from e
 
+
+def _history_params(reg_dt: date, page: int, display: int) -> Dict[str, Any]:
     reg_dt_str = reg_dt.strftime("%Y%m%d")
 
-    params = {
+    return {
       "OC": settings.nlic_oc,
       "target": "lsHstInf",
       "type": "JSON",
@@ -70,8 +148,12 @@ def fetch_law_history_page_by_regdt(
       "display": display,
     }
 
-    data = _request_json(settings.nlic_history_url, params)
 
+def _parse_history_page(
+    data: Dict[str, Any],
+    page: int,
+    display: int,
+) -> Tuple[List[Dict[str, Any]], bool]:
     service = data.get("LawSearch") or data
 
     raw_items = service.get("law") or []
@@ -95,18 +177,126 @@ def fetch_law_history_page_by_regdt(
     return items, has_next
 
 
-def fetch_old_new(mst: str) -> Dict[str, Any]:
-    params = {
+def _old_new_params(mst: str) -> Dict[str, Any]:
+    return {
         "OC": settings.nlic_oc,
         "target": "oldAndNew",
         "type": "JSON",
         "MST": mst,
     }
+
+
+def _history_ttl_sec(reg_dt: date) -> float:
+    # 오늘(또는 미래) 날짜 페이지는 아직 바뀔 수 있으므로 짧게
+    if reg_dt >= date.today():
+        return settings.nlic_cache_today_ttl_sec
+    return settings.nlic_cache_history_ttl_sec
+
+
+def _cache_miss(params: Dict[str, Any]) -> None:
+    """오프라인 모드(캐시만 사용)에서는 캐시에 없으면 네트워크 대신 실패"""
+    if settings.nlic_cache_offline:
+        raise NlicClientError(f"offline mode: no cached NLIC response for {params}")
+
+
+def _cached_request_json(
+    url: str,
+    params: Dict[str, Any],
+    ttl_sec: float,
+    **request_kwargs: Any,
+) -> Dict[str, Any]:
+    if _cache is None:
+        return _request_json(url, params, **request_kwargs)
+
+    data = _cache.get(params, ttl_sec)
+    if data is not None:
+        return data
+
+    _cache_miss(params)
+    data = _request_json(url, params, **request_kwargs)
+    _cache.put(params, data)
+    return data
+
+
+def fetch_law_history_page_by_regdt(
+    reg_dt: date,
+    page: int = 1,
+    display: int = 100,
+) -> Tuple[List[Dict[str, Any]], bool]:
+
+    params = _history_params(reg_dt, page, display)
+
+    data = _cached_request_json(settings.nlic_history_url, params, _history_ttl_sec(reg_dt))
+
+    return _parse_history_page(data, page, display)
+
+
+def fetch_old_new(mst: str) -> Dict[str, Any]:
+    params = _old_new_params(mst)
     # 내용이 길어서 timeout을 더 줌
-    return _request_json(
+    return _cached_request_json(
         settings.nlic_oldnew_url,
         params,
+        settings.nlic_cache_mst_ttl_sec,  # 한 번 공포된 MST 내용은 바뀌지 않음
         timeout=230,      # 한 건당 최대 60초까지 기다려 줌
         max_retries=5,   # 60초 * 5번 → 진짜 안 되면 그때 실패
         backoff_sec=2.0,
-    )
\ No newline at end of file
+    )
+
+
+class _TeeReader(io.RawIOBase):
+    """읽는 바이트를 그대로 sink에도 써 주는 스트림 (스트리밍 응답을 캐시에 같이 저장)"""
+
+    def __init__(self, src: BinaryIO, sink: BinaryIO):
+        self._src = src
+        self._sink = sink
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._src.read(len(b))
+        n = len(data)
+        b[:n] = data
+        self._sink.write(data)
+        return n
+
+
+@contextmanager
+def open_old_new_stream(mst: str) -> Iterator[BinaryIO]:
+    """
+    fetch_old_new의 스트리밍 버전: 응답 본문을 dict로 만들지 않고 (gzip 해제된) 바이트 스트림으로 넘겨준다.
+    재시도는 응답 헤더를 받을 때까지만 적용되고, 본문을 읽는 도중의 오류는 그대로 올라간다.
+    캐시가 켜져 있으면 캐시 파일에서 읽고, 없으면 받는 대로 캐시 파일에도 써 둔다.
+    """
+    params = _old_new_params(mst)
+
+    if _cache is not None:
+        with _cache.open(params, settings.nlic_cache_mst_ttl_sec) as cached:
+            if cached is not None:
+                yield cached
+                return
+        _cache_miss(params)
+
+    resp = _request(
+        settings.nlic_oldnew_url,
+        params,
+        timeout=230,
+        max_retries=5,
+        backoff_sec=2.0,
+        stream=True,
+    )
+    try:
+        resp.raw.decode_content = True
+        if _cache is None:
+            yield resp.raw
+            return
+
+        with _cache.writer(params) as sink:
+            reader = _TeeReader(resp.raw, sink)
+            yield reader
+            # 파서가 끝까지 읽지 않았어도 캐시에는 온전한 응답이 남도록 나머지를 마저 읽는다
+            while reader.read(64 * 1024):
+                pass
+    finally:
+        resp.close()
@@ -1,13 +1,40 @@
-from datetime import date, timedelta, datetime
-from typing import Dict, Any, List
-
+from datetime import date, datetime
+from typing import Callable, Dict, Any, List, Tuple
+from uuid import UUID
+import asyncio
+import http.client
+import logging
+import queue
+import threading
+
+import ijson
+from requests.exceptions import RequestException
+from sqlalchemy import exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
+from app.core.config import get_settings
+from app.db.session import SessionLocal
 from app.models.law import Law
-from app.models.law_change_event import LawChangeEvent
+from app.models.law_change_event import EVENT_KEY_COLUMNS, LawChangeEvent, compute_event_key
 from app.models.old_new_info import OldNewInfo
-from app.models.article_diff import ArticleDiff
-from app.services.nlic_client import fetch_law_history_page_by_regdt, fetch_old_new
+from app.services.article_diff_writer import iter_article_pairs, write_article_diffs
+from app.services.cache_versions import CHANGE_EVENTS, bump_cache_version
+from app.services.change_feed import sync_feed_laws, upsert_feed_events
+from app.services.nlic_client import (
+    NlicClientError,
+    fetch_law_history_page_by_regdt,
+    fetch_old_new,
+    open_old_new_stream,
+)
+from app.services.nlic_async_client import AsyncNlicClient, get_async_nlic_client
+from app.services.old_new_stream import iter_old_new_events, iter_streamed_article_pairs
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
 
 
 def _parse_ymd(s: str | None) -> date | None:
@@ -46,6 +73,46 @@ def _upsert_law(db: Session, item: Dict[str, Any]) -> Law:
 
     return law
 
+
+# LawSearch.law[] 필드 → law 컬럼
+_LAW_FIELDS = {
+    "law_name": "법령명한글",
+    "law_type_name": "법령구분명",
+    "ministry_names": "소관부처명",
+    "ministry_codes": "소관부처코드",
+}
+
+
+def _bulk_upsert_laws(db: Session, items: List[Dict[str, Any]]) -> None:
+    """
+    _upsert_law의 페이지 단위 버전: INSERT ... ON CONFLICT (law_id) DO UPDATE 한 번으로 처리.
+
+    - 같은 페이지에 같은 법령ID가 여러 번 나오면 순서대로 병합 (뒤에 온 값이 있으면 덮어씀)
+    - 값이 비어 있으면 기존 값을 유지 (_upsert_law의 `새 값 or 기존 값`과 동일)
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        law_id = str(item.get("법령ID"))
+        row = rows.setdefault(law_id, {"law_id": law_id, **{c: None for c in _LAW_FIELDS}})
+        for col, key in _LAW_FIELDS.items():
+            row[col] = item.get(key) or row[col]
+
+    if not rows:
+        return
+
+    stmt = pg_insert(Law).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Law.law_id],
+        set_={
+            **{
+                col: func.coalesce(func.nullif(stmt.excluded[col], ""), Law.__table__.c[col])
+                for col in _LAW_FIELDS
+            },
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
 def _ensure_list(v) -> List[Dict[str, Any]]:
     """old/new 조문 목록이 dict로 오든 list로 오든 항상 list[dict]로 변환"""
     if not v:
@@ -57,6 +124,27 @@ def _ensure_list(v) -> List[Dict[str, Any]]:
     # 혹시 모를 이상한 타입 방지용
     return []
 
+def _event_natural_key(item: Dict[str, Any], law_id: str) -> tuple | None:
+    """
+    LawSearch.law[] → 변경이력 중복 판정 키
+    (law_id, mst, change_type, proclamation_no, proclamation_date, enforce_date, current_hist_cd)
+    법령일련번호가 없으면 None
+    """
+    mst_raw = item.get("법령일련번호")
+    if not mst_raw:
+        return None
+
+    return (
+        law_id,
+        str(mst_raw),
+        item.get("제개정구분명"),
+        item.get("공포번호"),
+        _parse_ymd(item.get("공포일자")),
+        _parse_ymd(item.get("시행일자")),
+        item.get("현행연혁코드"),
+    )
+
+
 def _create_change_event_if_new(
     db: Session,
     law: Law,
@@ -74,31 +162,19 @@ def _create_change_event_if_new(
       * 현행연혁코드 → current_hist_cd
     """
     
-    mst_raw = item.get("법령일련번호")
-    if not mst_raw:
+    key = _event_natural_key(item, law.law_id)
+    if key is None:
         return None
 
-    mst = str(mst_raw)
-    
     # 신규 이벤트 후보 값들 먼저 파싱
-    change_type = item.get("제개정구분명")
-    proclamation_no = item.get("공포번호")
-    proclamation_date = _parse_ymd(item.get("공포일자"))
-    enforce_date = _parse_ymd(item.get("시행일자"))
-    current_hist_cd = item.get("현행연혁코드")
+    _, mst, change_type, proclamation_no, proclamation_date, enforce_date, current_hist_cd = key
 
-  # ✅ MST + 메타 정보까지 모두 같은 이벤트가 이미 있으면 스킵
+    event_key = compute_event_key(*key)
+
+  # ✅ MST + 메타 정보까지 모두 같은 이벤트가 이미 있으면 스킵 (event_key 유니크 인덱스 1회 조회)
     existing = (
-        db.query(LawChangeEvent)
-        .filter(
-            LawChangeEvent.law_id == law.law_id,
-            LawChangeEvent.mst == mst,
-            LawChangeEvent.change_type == change_type,
-            LawChangeEvent.proclamation_no == proclamation_no,
-            LawChangeEvent.proclamation_date == proclamation_date,
-            LawChangeEvent.enforce_date == enforce_date,
-            LawChangeEvent.current_hist_cd == current_hist_cd,
-        )
+        db.query(LawChangeEvent.change_id)
+        .filter(LawChangeEvent.event_key == event_key)
         .first()
     )
     if existing:
@@ -113,27 +189,74 @@ def _create_change_event_if_new(
         proclamation_date=proclamation_date,
         enforce_date=enforce_date,
         current_hist_cd=current_hist_cd,
+        event_key=event_key,
         collected_date=reg_dt,
     )
-    db.add(event)
-    db.flush()  # change_id 확보
+    try:
+        # 다른 적재 프로세스가 방금 같은 이벤트를 넣었으면 유니크 인덱스에 걸린다
+        with db.begin_nested():
+            db.add(event)
+            db.flush()  # change_id 확보
+    except IntegrityError:
+        return None
 
     return event
 
 
-def _save_old_new_and_articles(db: Session, event: LawChangeEvent) -> None:
+def _bulk_create_change_events_if_new(
+    db: Session,
+    items: List[Dict[str, Any]],
+    reg_dt: date,
+) -> List[Tuple[UUID, str]]:
+    """
+    _create_change_event_if_new의 페이지 단위 버전.
+    페이지 전체를 INSERT ... ON CONFLICT (event_key) DO NOTHING 한 번으로 넣고,
+    새로 들어간 이벤트의 (change_id, mst) 목록을 돌려준다.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        key = _event_natural_key(item, str(item.get("법령ID")))
+        if key is None:
+            continue
+        event_key = compute_event_key(*key)
+        if event_key in rows:
+            # 같은 페이지 안의 중복은 먼저 나온 것만 (직렬 처리와 동일)
+            continue
+        rows[event_key] = {
+            **dict(zip(EVENT_KEY_COLUMNS, key)),
+            "event_key": event_key,
+            "collected_date": reg_dt,
+        }
+
+    if not rows:
+        return []
+
+    stmt = (
+        pg_insert(LawChangeEvent)
+        .values(list(rows.values()))
+        .on_conflict_do_nothing(index_elements=[LawChangeEvent.event_key])
+        .returning(LawChangeEvent.change_id, LawChangeEvent.mst)
+    )
+
+    return [(row.change_id, row.mst) for row in db.execute(stmt)]
+
+
+def _save_old_new_and_articles(db: Session, mst: str) -> bool:
     """
     oldAndNew 호출 → old_new_info + article_diff 적재
 
     - mst 단위로 한 번만 저장
     - 같은 mst를 가지는 다른 change 이벤트가 있어도 추가로 저장하지 않음
+    - 새로 저장했으면 True, 이미 있어서 건너뛰었으면 False
     """
-    mst = event.mst
-    
      # ✅ mst 기준으로 이미 old_new_info가 있으면 스킵
     existing = db.get(OldNewInfo, mst)
     if existing:
-        return
+        return False
+
+    if settings.nlic_old_new_streaming:
+        _save_old_new_streaming(db, mst)
+        return True
 
     data = fetch_old_new(mst)
 
@@ -160,117 +283,425 @@ def _save_old_new_and_articles(db: Session, event: LawChangeEvent) -> None:
     db.add(info)
     db.flush()
 
-    max_len = max(len(old_list), len(new_list))
+    # 🔹 ArticleDiff도 mst 기준으로만 연결 (ORM 객체 없이 COPY로 일괄 적재)
+    write_article_diffs(db, mst, iter_article_pairs(old_list, new_list))
+
+    return True
+
+
+def _save_old_new_streaming(db: Session, mst: str) -> None:
+    """
+    _save_old_new_and_articles의 스트리밍 버전 (nlic_old_new_streaming 설정)
+    - 응답을 받는 대로 조문 단위로 파싱 → 짝이 맞는 대로 article_diff에 COPY
+    - 응답 크기와 상관없이 메모리는 조문 몇 건 분량만 사용
+    - 기본정보는 목록 뒤에 올 수도 있으므로 old_new_info는 조문 적재 후 같은 트랜잭션에서 저장
+    """
+    basics: Dict[str, Dict[str, Any]] = {}
+
+    try:
+        with open_old_new_stream(mst) as fp:
+            written = write_article_diffs(
+                db,
+                mst,
+                iter_streamed_article_pairs(iter_old_new_events(fp), basics),
+            )
+    except (
+        ijson.JSONError,
+        RequestException,
+        # 본문을 읽는 중 끊기면 requests로 감싸지 않고 urllib3/소켓 예외가 그대로 올라온다
+        Urllib3HTTPError,
+        http.client.HTTPException,
+        OSError,
+    ) as e:
+        raise NlicClientError(f"oldAndNew stream failed (mst={mst}): {e}") from e
+
+    info = OldNewInfo(
+        mst=mst,
+        has_old_new="Y" if written else "N",
+        old_basic=basics.get("old_basic") or {},
+        new_basic=basics.get("new_basic") or {},
+    )
+    db.add(info)
+    db.flush()
+
+
+class OldNewPipeline:
+    """
+    oldAndNew 적재 파이프라인 (생산자/소비자)
+
+    - 생산자(history 페이지 적재)는 law_change_event를 커밋한 뒤 mst를 submit()으로 넘기기만 한다
+    - 소비자 워커들은 각자 세션으로 oldAndNew 호출 → old_new_info / article_diff 를 mst 단위로 커밋
+    - 큐가 가득 차면 submit()이 대기 → 생산자가 워커보다 너무 앞서 나가지 않는다
+    - 한 mst의 실패/지연이 history 페이지 트랜잭션을 붙잡지 않는다
+
+    사용 예)
+        with OldNewPipeline() as pipeline:
+            load_changes_for_date(db, target_date, pipeline=pipeline)
+        pipeline.stats()
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        queue_size: int | None = None,
+        session_factory: Callable[[], Session] | None = None,
+    ):
+        if workers is None:
+            workers = settings.nlic_old_new_workers
+        if queue_size is None:
+            queue_size = settings.nlic_old_new_queue_size
+        if session_factory is None:
+            session_factory = SessionLocal
+
+        self.workers = max(1, workers)
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[str | None]" = queue.Queue(maxsize=max(1, queue_size))
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._seen: set[str] = set()
+
+        self.saved = 0
+        self.skipped = 0
+        self.failed: Dict[str, str] = {}
+
+    def __enter__(self) -> "OldNewPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            t = threading.Thread(
+                target=self._worker,
+                name=f"nlic-oldnew-{i}",
+                daemon=True,
+            )
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, mst: str) -> None:
+        with self._lock:
+            if mst in self._seen:
+                return
+            self._seen.add(mst)
+        self._queue.put(mst)
+
+    def close(self) -> None:
+        """남은 mst를 모두 처리할 때까지 기다린 뒤 워커 종료"""
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "old_new_saved": self.saved,
+                "old_new_skipped": self.skipped,
+                "old_new_failed_msts": dict(self.failed),
+            }
+
+    def _worker(self) -> None:
+        while True:
+            mst = self._queue.get()
+            if mst is None:
+                return
+
+            db = self._session_factory()
+            try:
+                saved = _save_old_new_and_articles(db, mst)
+                db.commit()
+                with self._lock:
+                    if saved:
+                        self.saved += 1
+                    else:
+                        self.skipped += 1
+            except IntegrityError:
+                # 다른 프로세스가 같은 mst를 먼저 저장한 경우
+                db.rollback()
+                with self._lock:
+                    self.skipped += 1
+            except Exception as e:
+                db.rollback()
+                logger.exception("[NLIC] oldAndNew 적재 실패 mst=%s", mst)
+                with self._lock:
+                    self.failed[mst] = str(e)
+            finally:
+                db.close()
+
+
+def requeue_missing_old_new(db: Session, pipeline: OldNewPipeline, limit: int = 500) -> int:
+    """
+    law_change_event는 있지만 old_new_info가 없는 mst(이전 실행의 oldAndNew 실패분)를 다시 큐에 넣는다.
+    """
+    missing = (
+        select(LawChangeEvent.mst)
+        .where(~exists().where(OldNewInfo.mst == LawChangeEvent.mst))
+        .distinct()
+        .limit(limit)
+    )
+    msts = list(db.scalars(missing))
+    for mst in msts:
+        pipeline.submit(mst)
+    return len(msts)
 
-    for i in range(max_len):
-        old_item = old_list[i] if i < len(old_list) else {}
-        new_item = new_list[i] if i < len(new_list) else {}
 
-        old_no = old_item.get("no")
-        new_no = new_item.get("no")
+def _ingest_history_items(
+    db: Session,
+    items: List[Dict[str, Any]],
+    target_date: date,
+    pipeline: OldNewPipeline | None = None,
+) -> Dict[str, Any]:
+    """
+    lsHstInf 한 페이지 분량(items)을 law / law_change_event 에 적재.
+    커밋은 호출하는 쪽에서 페이지 단위로 한다.
 
-        old_content = old_item.get("content") or ""
-        new_content = new_item.get("content") or ""
+    - pipeline이 없으면 기존처럼 신규 이벤트마다 old_new_info / article_diff 를 바로 적재
+    - pipeline이 있으면 신규 이벤트의 mst만 new_msts로 돌려주고, 커밋 후 호출하는 쪽이 큐에 넣는다
+    - nlic_bulk_ingest 설정이면 페이지 단위 일괄 upsert/insert (DB 왕복이 건수가 아니라 페이지 수에 비례)
+    - 목록 읽기 모델(law_change_feed)과 목록 캐시 버전도 같은 트랜잭션에서 갱신한다
+    """
+    if settings.nlic_bulk_ingest:
+        counts = _ingest_history_items_bulk(db, items, target_date, pipeline=pipeline)
+    else:
+        counts = _ingest_history_items_rowwise(db, items, target_date, pipeline=pipeline)
 
-        # 🔹 ArticleDiff도 mst 기준으로만 연결
-        diff = ArticleDiff(
-            mst=mst,
-            old_no=old_no,
-            old_content=old_content,
-            new_no=new_no,
-            new_content=new_content,
+    sync_feed_laws(db, (str(item.get("법령ID")) for item in items))
+    new_change_ids = counts.pop("new_change_ids")
+    if new_change_ids:
+        upsert_feed_events(db, new_change_ids)
+        bump_cache_version(db, CHANGE_EVENTS)
+    return counts
+
+
+def _ingest_history_items_rowwise(
+    db: Session,
+    items: List[Dict[str, Any]],
+    target_date: date,
+    pipeline: OldNewPipeline | None = None,
+) -> Dict[str, Any]:
+    """_ingest_history_items의 건별 ORM 처리 버전"""
+    history_records = 0
+    new_events = 0
+    laws_touched = 0
+    new_msts: List[str] = []
+    new_change_ids: List[UUID] = []
+
+    for item in items:
+        history_records += 1
+
+        # law upsert
+        law = _upsert_law(db, item)
+        db.flush()
+        laws_touched += 1
+
+        # law_change_event 신규 생성
+        event = _create_change_event_if_new(
+            db=db,
+            law=law,
+            item=item,
+            reg_dt=target_date,
         )
-        db.add(diff)
-        
-def load_changes_for_date(db: Session, target_date: date) -> Dict[str, Any]:
+        if not event:
+            continue
+
+        new_events += 1
+        new_change_ids.append(event.change_id)
+
+        if pipeline is not None:
+            new_msts.append(event.mst)
+            continue
+
+        # old/new + article_diff 적재
+        _save_old_new_and_articles(db, event.mst)
+
+    return {
+        "history_records": history_records,
+        "new_events": new_events,
+        "laws_touched": laws_touched,
+        "new_msts": new_msts,
+        "new_change_ids": new_change_ids,
+    }
+
+
+def _ingest_history_items_bulk(
+    db: Session,
+    items: List[Dict[str, Any]],
+    target_date: date,
+    pipeline: OldNewPipeline | None = None,
+) -> Dict[str, Any]:
+    """
+    _ingest_history_items의 일괄 처리 버전: law upsert 1회 + law_change_event insert-if-absent 1회.
+    집계 값(history_records / new_events / laws_touched)은 건별 처리와 같다.
+    """
+    _bulk_upsert_laws(db, items)
+    new_events = _bulk_create_change_events_if_new(db, items, target_date)
+    new_msts = [mst for _, mst in new_events]
+
+    if pipeline is None:
+        for mst in new_msts:
+            _save_old_new_and_articles(db, mst)
+
+    return {
+        "history_records": len(items),
+        "new_events": len(new_events),
+        "laws_touched": len(items),
+        "new_msts": new_msts if pipeline is not None else [],
+        "new_change_ids": [change_id for change_id, _ in new_events],
+    }
+
+
+def load_changes_for_date(
+    db: Session,
+    target_date: date,
+    pipeline: OldNewPipeline | None = None,
+    old_new_workers: int | None = None,
+) -> Dict[str, Any]:
     """
     특정 날짜(target_date)의 regDt 변경이력을 모두 수집해서
     law / law_change_event / old_new_info / article_diff 에 적재.
 
     배치(매일 밤 어제분)에서 재사용할 핵심 함수.
+
+    - pipeline: 호출하는 쪽이 관리하는 OldNewPipeline (여러 날짜에 걸쳐 공유할 때)
+    - old_new_workers: pipeline이 없을 때 이 함수 안에서 띄울 oldAndNew 워커 수
+      (None이면 설정값, 0이면 기존처럼 페이지 트랜잭션 안에서 직접 호출)
     """
+    if old_new_workers is None:
+        old_new_workers = settings.nlic_old_new_workers
+
+    own_pipeline: OldNewPipeline | None = None
+    if pipeline is None and old_new_workers > 0:
+        own_pipeline = OldNewPipeline(workers=old_new_workers)
+        own_pipeline.start()
+        pipeline = own_pipeline
+
     total_history_records = 0
     total_new_events = 0
     total_laws_touched = 0
 
-    page = 1
-    while True:
-        items, has_next = fetch_law_history_page_by_regdt(
-            reg_dt=target_date,
-            page=page,
-            display=100,
-        )
-
-        if not items:
-            break
-
-        for item in items:
-            total_history_records += 1
-
-            # law upsert
-            law = _upsert_law(db, item)
-            db.flush()
-            total_laws_touched += 1
-
-            # law_change_event 신규 생성
-            event = _create_change_event_if_new(
-                db=db,
-                law=law,
-                item=item,
+    try:
+        page = 1
+        while True:
+            items, has_next = fetch_law_history_page_by_regdt(
                 reg_dt=target_date,
+                page=page,
+                display=100,
             )
-            if not event:
-                continue
 
-            total_new_events += 1
+            if not items:
+                break
 
-            # old/new + article_diff 적재
-            _save_old_new_and_articles(db, event)
+            counts = _ingest_history_items(db, items, target_date, pipeline=pipeline)
+            total_history_records += counts["history_records"]
+            total_new_events += counts["new_events"]
+            total_laws_touched += counts["laws_touched"]
 
-        db.commit()
+            db.commit()
 
-        if not has_next:
-            break
-        page += 1
+            # 커밋된 이벤트의 mst만 oldAndNew 워커로 넘긴다
+            for mst in counts["new_msts"]:
+                pipeline.submit(mst)
 
-    return {
+            if not has_next:
+                break
+            page += 1
+    finally:
+        if own_pipeline is not None:
+            own_pipeline.close()
+
+    summary: Dict[str, Any] = {
         "target_date": target_date.isoformat(),
         "total_history_records_seen": total_history_records,
         "total_new_events_inserted": total_new_events,
         "total_laws_touched": total_laws_touched,
     }
+    if own_pipeline is not None:
+        summary.update(own_pipeline.stats())
+    return summary
 
 
-def load_initial_changes_until_yesterday(
+async def load_changes_for_date_async(
     db: Session,
-    start_date: date | None = None,
+    target_date: date,
+    client: AsyncNlicClient | None = None,
+    old_new_workers: int | None = None,
 ) -> Dict[str, Any]:
     """
-    (start_date ~ 어제까지) 전체 적재 – 기존 함수는 그대로 두고 사용.
-    """
-    if start_date is None:
-        start_date = date(2020, 1, 1)
+    load_changes_for_date의 async 버전 (FastAPI 엔드포인트 등 이벤트 루프 안에서 사용)
 
-    end_date = date.today() - timedelta(days=1)
+    - lsHstInf 페이지 조회는 AsyncNlicClient로 → 이벤트 루프를 막지 않음
+    - 페이지 적재(DB)는 스레드에서 실행하고, 그동안 다음 페이지를 미리 받아 둔다
+    - oldAndNew는 동기 버전과 같은 OldNewPipeline 워커가 처리
+    """
+    if client is None:
+        client = get_async_nlic_client()
+    if old_new_workers is None:
+        old_new_workers = settings.nlic_old_new_workers
+
+    pipeline: OldNewPipeline | None = None
+    if old_new_workers > 0:
+        pipeline = OldNewPipeline(workers=old_new_workers)
+        pipeline.start()
+
+    def _ingest_and_commit(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        counts = _ingest_history_items(db, items, target_date, pipeline=pipeline)
+        db.commit()
+        for mst in counts["new_msts"]:
+            pipeline.submit(mst)
+        return counts
 
     total_history_records = 0
     total_new_events = 0
     total_laws_touched = 0
 
-    cur = start_date
-    while cur <= end_date:
-        daily_summary = load_changes_for_date(db, cur)
-
-        total_history_records += daily_summary["total_history_records_seen"]
-        total_new_events += daily_summary["total_new_events_inserted"]
-        total_laws_touched += daily_summary["total_laws_touched"]
-
-        cur += timedelta(days=1)
-
-    return {
-        "start_date": start_date.isoformat(),
-        "end_date": end_date.isoformat(),
+    try:
+        page = 1
+        items, has_next = await client.fetch_law_history_page_by_regdt(
+            reg_dt=target_date,
+            page=page,
+            display=100,
+        )
+        while items:
+            next_page = None
+            if has_next:
+                next_page = asyncio.create_task(
+                    client.fetch_law_history_page_by_regdt(
+                        reg_dt=target_date,
+                        page=page + 1,
+                        display=100,
+                    )
+                )
+
+            try:
+                counts = await asyncio.to_thread(_ingest_and_commit, items)
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            total_history_records += counts["history_records"]
+            total_new_events += counts["new_events"]
+            total_laws_touched += counts["laws_touched"]
+
+            if next_page is None:
+                break
+            items, has_next = await next_page
+            page += 1
+    finally:
+        if pipeline is not None:
+            await asyncio.to_thread(pipeline.close)
+
+    summary: Dict[str, Any] = {
+        "target_date": target_date.isoformat(),
         "total_history_records_seen": total_history_records,
         "total_new_events_inserted": total_new_events,
         "total_laws_touched": total_laws_touched,
     }
+    if pipeline is not None:
+        summary.update(pipeline.stats())
+    return summary
+
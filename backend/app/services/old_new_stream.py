@@ -0,0 +1,118 @@
+# app/services/old_new_stream.py
+from typing import Any, BinaryIO, Dict, Iterator, Tuple
+import json
+import tempfile
+
+import ijson
+
+from app.services.article_diff_writer import ArticlePair
+
+# oldAndNew 응답에서 꺼낼 위치 (OldAndNewService 래퍼 유무와 무관한 상대 경로) → 이벤트 종류
+_TARGETS = {
+    "구조문_기본정보": "old_basic",
+    "신조문_기본정보": "new_basic",
+    "구조문목록.조문": "old",
+    "신조문목록.조문": "new",
+    "구조문목록.조문.item": "old",
+    "신조문목록.조문.item": "new",
+}
+
+_WRAPPER = "OldAndNewService."
+
+
+def iter_old_new_events(fp: BinaryIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    oldAndNew JSON을 받는 대로 파싱해서 필요한 객체만 하나씩 돌려준다.
+
+    - ("old_basic" | "new_basic", dict)
+    - ("old" | "new", 조문 dict)   ← 조문이 dict 하나로 오든 list로 오든 조문 단위로
+
+    전체 응답 트리를 만들지 않으므로 메모리는 조문 1건 크기만큼만 쓴다.
+    """
+    builder: ijson.ObjectBuilder | None = None
+    kind = ""
+    depth = 0
+
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                yield kind, builder.value
+                builder = None
+            continue
+
+        if event != "start_map":
+            continue
+
+        rel = prefix[len(_WRAPPER):] if prefix.startswith(_WRAPPER) else prefix
+        target = _TARGETS.get(rel)
+        if target is None:
+            continue
+
+        kind = target
+        depth = 1
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+
+
+def _to_pair(old_item: Dict[str, Any], new_item: Dict[str, Any]) -> ArticlePair:
+    return (
+        old_item.get("no"),
+        old_item.get("content") or "",
+        new_item.get("no"),
+        new_item.get("content") or "",
+    )
+
+
+def iter_streamed_article_pairs(
+    events: Iterator[Tuple[str, Dict[str, Any]]],
+    basics: Dict[str, Dict[str, Any]],
+) -> Iterator[ArticlePair]:
+    """
+    iter_old_new_events 결과를 같은 순번끼리 짝지은 조문 쌍으로 바꿔 준다 (iter_article_pairs와 같은 결과).
+
+    구조문/신조문 목록은 응답에 차례로 나오므로, 먼저 나온 목록만 임시 파일에 한 줄씩 내려 두고
+    두 번째 목록이 들어오는 대로 짝을 맞춰 내보낸다. 기본정보는 basics에 채워 둔다.
+    """
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as spool:
+        first_kind: str | None = None
+        paired = 0
+
+        for kind, value in events:
+            if kind in ("old_basic", "new_basic"):
+                basics[kind] = value
+                continue
+
+            if first_kind is None:
+                first_kind = kind
+
+            if kind == first_kind:
+                spool.write(json.dumps(value, ensure_ascii=False) + "\n")
+                continue
+
+            if paired == 0:
+                spool.seek(0)
+            line = spool.readline()
+            first_item = json.loads(line) if line else {}
+            paired += 1
+
+            if first_kind == "old":
+                yield _to_pair(first_item, value)
+            else:
+                yield _to_pair(value, first_item)
+
+        # 짝이 없는 나머지 (먼저 나온 목록이 더 긴 경우)
+        if first_kind is None:
+            return
+        if paired == 0:
+            spool.seek(0)
+        for line in spool:
+            first_item = json.loads(line)
+            if first_kind == "old":
+                yield _to_pair(first_item, {})
+            else:
+                yield _to_pair({}, first_item)
@@ -1,19 +1,35 @@
+import argparse
 import time
 
 from app.db.session import SessionLocal
-from app.services.ai_summarizer import generate_ai_for_pending_changes
+from app.services.ai_summarizer import generate_ai_for_pending_changes, run_ai_workers
 
 
 def main():
+    parser = argparse.ArgumentParser(description="변경이력 AI 요약/조치 생성")
+    parser.add_argument("--limit", type=int, default=None, help="처리할 최대 건수 (없으면 대상이 없을 때까지)")
+    parser.add_argument("--workers", type=int, default=None, help="동시 LLM 호출 수 (없으면 설정값 ai_workers)")
+    parser.add_argument("--serial", action="store_true", help="워커 풀 없이 한 건씩 순서대로 처리 (기존 방식)")
+    args = parser.parse_args()
+
+    if not args.serial:
+        result = run_ai_workers(workers=args.workers, limit=args.limit)
+        print(
+            f"AI 요약 생성 완료 → {result['processed']}건 처리됨 "
+            f"(실패 {result['failed']}건, 워커 {result['workers']}개)"
+        )
+        print(f"총 소요 시간: {result['elapsed_sec']:.2f}초 (처리량 {result['changes_per_min']:.2f}건/분)")
+        return
+
     db = SessionLocal()
     try:
         start = time.perf_counter()
-        count = generate_ai_for_pending_changes(db, limit=10)
+        count = generate_ai_for_pending_changes(db, limit=args.limit or 10)
         elapsed = time.perf_counter() - start
         
         print(f"AI 요약 생성 완료 → {count}건 처리됨")
         if count > 0:
-            print(f"총 소요 시간: {elapsed:.2f}초 (건당 평균 {elapsed / count:.2f}초)")
+            print(f"총 소요 시간: {elapsed:.2f}초 (건당 평균 {elapsed / count:.2f}초, {count / elapsed * 60:.2f}건/분)")
         else:
             print(f"총 소요 시간: {elapsed:.2f}초 (처리 건수 0건)")
     finally:
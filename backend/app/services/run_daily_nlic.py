@@ -2,14 +2,23 @@
 from datetime import date, timedelta
 
 from app.db.session import SessionLocal
-from app.services.nlic_loader import load_changes_for_date
+from app.services.nlic_loader import (
+    OldNewPipeline,
+    load_changes_for_date,
+    requeue_missing_old_new,
+)
 
 
 def run_for_yesterday() -> None:
     yesterday = date.today() - timedelta(days=1)
     db = SessionLocal()
     try:
-        summary = load_changes_for_date(db, yesterday)
+        with OldNewPipeline() as pipeline:
+            # 이전 실행에서 oldAndNew 적재에 실패한 mst부터 다시 시도
+            requeued = requeue_missing_old_new(db, pipeline)
+            summary = load_changes_for_date(db, yesterday, pipeline=pipeline)
+        summary["old_new_requeued"] = requeued
+        summary.update(pipeline.stats())
         print("[NLIC DAILY] done:", summary)
     finally:
         db.close()
@@ -0,0 +1,102 @@
+# app/services/text_diff.py
+from difflib import SequenceMatcher
+from typing import List, NamedTuple, Optional
+import html
+import re
+
+_P_TAG = re.compile(r"</?p\s*>", flags=re.IGNORECASE)
+
+# 한국어 LLM 토크나이저 기준 대략적인 글자/토큰 비율 (정확한 값이 아니라 예산 계산용)
+CHARS_PER_TOKEN = 1.5
+
+
+def clean_html(text: str) -> str:
+    """old_content/new_content 안의 <p> 같은 단순 강조태그 제거만."""
+    if not text:
+        return ""
+
+    text = html.unescape(text)
+
+    # <p> 또는 </p> 제거만 수행
+    text = _P_TAG.sub("", text)
+
+    return text.strip()
+
+
+def estimate_tokens(text: str) -> int:
+    return int(len(text) / CHARS_PER_TOKEN) + 1
+
+
+class WordChange(NamedTuple):
+    tag: str          # 'replace' | 'delete' | 'insert'
+    old: str
+    new: str
+    before: str       # 앞쪽 문맥 (같은 단어 몇 개)
+    after: str        # 뒤쪽 문맥
+
+
+class WordDiff(NamedTuple):
+    changes: List[WordChange]
+    changed_words: int    # 바뀐(삭제+추가) 단어 수
+    total_words: int      # 구/신 단어 수 중 큰 쪽
+
+
+# 단어 diff opcode (같은 구간은 빼고): [tag, i1, i2, j1, j2]
+#   tag: 'r'(replace) | 'd'(delete) | 'i'(insert), 인덱스는 clean_html(본문).split() 단어 기준
+_OP_TAGS = {"replace": "r", "delete": "d", "insert": "i"}
+_OP_NAMES = {v: k for k, v in _OP_TAGS.items()}
+
+
+def word_diff_ops(old_text: str, new_text: str) -> List[list]:
+    """공백 단위 단어 diff의 opcode만 (적재 시 article_diff.diff_ops로 저장)"""
+    matcher = SequenceMatcher(a=old_text.split(), b=new_text.split(), autojunk=False)
+    return [
+        [_OP_TAGS[tag], i1, i2, j1, j2]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def word_diff_from_ops(old_text: str, new_text: str, ops: List[list], context: int = 3) -> WordDiff:
+    """저장된 opcode로 WordDiff 복원 (SequenceMatcher를 다시 돌리지 않음)"""
+    old_words = old_text.split()
+    new_words = new_text.split()
+
+    changes: List[WordChange] = []
+    changed = 0
+    for tag, i1, i2, j1, j2 in ops:
+        changed += (i2 - i1) + (j2 - j1)
+        changes.append(
+            WordChange(
+                tag=_OP_NAMES[tag],
+                old=" ".join(old_words[i1:i2]),
+                new=" ".join(new_words[j1:j2]),
+                before=" ".join(old_words[max(0, i1 - context):i1]),
+                after=" ".join(old_words[i2:i2 + context]),
+            )
+        )
+
+    return WordDiff(changes, changed, max(len(old_words), len(new_words)))
+
+
+def word_diff(old_text: str, new_text: str, context: int = 3) -> WordDiff:
+    """공백 단위 단어 diff. 같은 부분은 앞뒤 context 단어만 남긴다."""
+    return word_diff_from_ops(old_text, new_text, word_diff_ops(old_text, new_text), context)
+
+
+class ArticleWordDiff(NamedTuple):
+    is_changed: bool      # <p> 태그 등을 정리한 본문이 다른지
+    change_score: int     # 바뀐(삭제+추가) 단어 수
+    diff_ops: List[list]  # word_diff_ops
+
+
+def article_word_diff(old_content: Optional[str], new_content: Optional[str]) -> ArticleWordDiff:
+    """조문 비교 행 하나의 단어 diff 요약 (원문 HTML → clean_html 후 비교)"""
+    old_text = clean_html(old_content or "")
+    new_text = clean_html(new_content or "")
+    if old_text == new_text:
+        return ArticleWordDiff(False, 0, [])
+
+    ops = word_diff_ops(old_text, new_text)
+    score = sum((i2 - i1) + (j2 - j1) for _, i1, i2, j1, j2 in ops)
+    return ArticleWordDiff(True, score, ops)
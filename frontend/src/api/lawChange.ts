@@ -1,6 +1,10 @@
 // src/api/lawChange.ts
 import http from "./http";
-import type { LawChangeEvent, LawChangeDetailResponse } from "../types/law";
+import type {
+  ArticleDiffPage,
+  LawChangeEvent,
+  LawChangeDetailResponse,
+} from "../types/law";
 
 export interface LawChangeQuery {
   start_date?: string | null;
@@ -33,3 +37,21 @@ export async function fetchLawChangeDetail(
   const { data } = await http.get<LawChangeDetailResponse>(`/changes/${id}`);
   return data;
 }
+
+export interface LawChangeArticlesQuery {
+  cursor?: string | null;
+  page_size?: number;
+  changed_only?: boolean;
+  max_chars?: number | null;
+}
+
+// 조문 비교 다음 페이지 (상세 응답의 articles_next_cursor부터)
+export async function fetchLawChangeArticles(
+  id: string,
+  params: LawChangeArticlesQuery
+): Promise<ArticleDiffPage> {
+  const { data } = await http.get<ArticleDiffPage>(`/changes/${id}/articles`, {
+    params,
+  });
+  return data;
+}
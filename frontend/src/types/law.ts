@@ -21,6 +21,17 @@ export interface ArticleDiffItem {
   old_content?: string | null;
   new_no?: string | null;
   new_content?: string | null;
+  old_truncated?: boolean;
+  new_truncated?: boolean;
+  is_changed?: boolean | null;
+  change_score?: number | null; // 바뀐 단어 수
+  // [tag(r/d/i), i1, i2, j1, j2] – <p> 제거한 본문의 공백 단위 단어 인덱스
+  diff_ops?: [string, number, number, number, number][] | null;
+}
+
+export interface ArticleDiffPage {
+  items: ArticleDiffItem[];
+  next_cursor?: string | null;
 }
 
 export interface LawChangeDetailResponse {
@@ -28,5 +39,8 @@ export interface LawChangeDetailResponse {
   has_old_new: "Y" | "N";
   old_basic?: Record<string, any> | null;
   new_basic?: Record<string, any> | null;
-  articles: ArticleDiffItem[];
+  article_count: number;
+  changed_article_count: number;
+  articles: ArticleDiffItem[]; // 첫 페이지만
+  articles_next_cursor?: string | null;
 }